@@ -55,7 +55,7 @@ export PYTHONPATH="${PYTHONPATH}:$(pwd)"
 if [ "$1" = "--prod" ]; then
     echo -e "${GREEN}生产模式启动...${NC}"
     export ENVIRONMENT=production
-    uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers 4
+    uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers 4 --loop uvloop
 else
     echo -e "${GREEN}开发模式启动...${NC}"
     export ENVIRONMENT=development
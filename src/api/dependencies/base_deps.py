@@ -8,6 +8,15 @@ from src.infrastructure.cache.cache_interface import CacheInterface, InMemoryCac
 
 settings = get_settings()
 
+# 示例API密钥
+_VALID_API_KEYS = frozenset({"demo-api-key-123", "test-api-key-456"})
+
+# 进程内共享的缓存实例
+_shared_cache = InMemoryCache(
+    max_size=settings.cache_max_size,
+    default_ttl=settings.cache_default_ttl
+)
+
 
 def get_request_id(request: Request) -> str:
     """获取请求ID"""
@@ -15,13 +24,9 @@ def get_request_id(request: Request) -> str:
 
 
 def get_cache() -> Generator[CacheInterface, None, None]:
-    """获取缓存实例"""
-    cache = InMemoryCache(
-        max_size=settings.cache_max_size,
-        default_ttl=settings.cache_default_ttl
-    )
+    """获取缓存实例（共享实例，跨请求保留缓存内容）"""
     try:
-        yield cache
+        yield _shared_cache
     finally:
         # 这里可以添加清理逻辑
         pass
@@ -55,8 +60,7 @@ def verify_api_key(request: Request) -> bool:
         return True
     
     # TODO: 实现真实的API密钥验证逻辑
-    valid_api_keys = ["demo-api-key-123", "test-api-key-456"]
-    if api_key not in valid_api_keys:
+    if api_key not in _VALID_API_KEYS:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key"
@@ -103,6 +107,9 @@ def get_pagination_params(
 class CommonDependencies:
     """常用依赖注入的封装类"""
     
+    # 每个请求都会创建实例，使用__slots__避免实例字典的分配
+    __slots__ = ("request_id", "cache", "user_id", "pagination")
+    
     def __init__(
         self,
         request_id: str = Depends(get_request_id),
@@ -120,8 +127,5 @@ def get_service_dependencies() -> dict:
     """获取服务层依赖"""
     return {
         "settings": settings,
-        "cache": InMemoryCache(
-            max_size=settings.cache_max_size,
-            default_ttl=settings.cache_default_ttl
-        )
+        "cache": _shared_cache
     }
\ No newline at end of file
@@ -1,86 +1,110 @@
 # api/middleware/error_handler.py
-import traceback
-from typing import Callable
+import logging
 
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.infrastructure.logging.logger import get_logger
 from src.schemas.dtos.response.base_response import BaseResponse
 
 logger = get_logger(__name__)
 
+# 预先构建的错误响应内容，仅参数验证错误需要替换error_message
+_VALIDATION_ERROR_TEMPLATE = BaseResponse.error_response(error="VALIDATION_ERROR").dict()
+_PERMISSION_ERROR_CONTENT = BaseResponse.error_response(
+    error="PERMISSION_ERROR",
+    error_message="没有访问权限"
+).dict()
+_NOT_FOUND_ERROR_CONTENT = BaseResponse.error_response(
+    error="NOT_FOUND_ERROR",
+    error_message="请求的资源不存在"
+).dict()
+_INTERNAL_ERROR_CONTENT = BaseResponse.error_response(
+    error="INTERNAL_SERVER_ERROR",
+    error_message="服务器内部错误"
+).dict()
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    """全局异常处理中间件"""
+# 异常类型 -> (状态码, 日志前缀, 响应内容)，响应内容为None表示使用异常信息
+_ERROR_MAP = {
+    ValueError: (400, "参数验证错误", None),
+    PermissionError: (403, "权限错误", _PERMISSION_ERROR_CONTENT),
+    FileNotFoundError: (404, "资源未找到", _NOT_FOUND_ERROR_CONTENT)
+}
+
+
+class ErrorHandlerMiddleware:
+    """全局异常处理中间件（纯ASGI实现）"""
+    
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
         try:
-            response = await call_next(request)
-            return response
-            
-        except ValueError as e:
-            # 参数验证错误
-            logger.warning(f"参数验证错误: {str(e)}", extra={
-                "url": str(request.url),
-                "method": request.method,
-                "error": str(e)
-            })
-            error_response = BaseResponse.error_response(
-                error="VALIDATION_ERROR",
-                error_message=str(e)
-            )
-            return JSONResponse(
-                status_code=400,
-                content=error_response.dict()
-            )
-            
-        except PermissionError as e:
-            # 权限错误
-            logger.warning(f"权限错误: {str(e)}", extra={
-                "url": str(request.url),
-                "method": request.method,
-                "error": str(e)
-            })
-            error_response = BaseResponse.error_response(
-                error="PERMISSION_ERROR",
-                error_message="没有访问权限"
-            )
-            return JSONResponse(
-                status_code=403,
-                content=error_response.dict()
-            )
-            
-        except FileNotFoundError as e:
-            # 资源未找到错误
-            logger.warning(f"资源未找到: {str(e)}", extra={
-                "url": str(request.url),
-                "method": request.method,
-                "error": str(e)
-            })
-            error_response = BaseResponse.error_response(
-                error="NOT_FOUND_ERROR",
-                error_message="请求的资源不存在"
-            )
-            return JSONResponse(
-                status_code=404,
-                content=error_response.dict()
-            )
-            
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
+            # 响应已开始发送时无法再返回错误响应
+            if response_started:
+                raise
+            response = self._build_error_response(scope, e)
+            await response(scope, receive, send)
+    
+    @staticmethod
+    def _build_log_extra(scope: Scope, error_message: str) -> dict:
+        """构建日志上下文（仅在确实需要记录日志时调用，避免无谓地重建URL）"""
+        return {
+            "url": str(Request(scope).url),
+            "method": scope["method"],
+            "error": error_message
+        }
+    
+    def _build_error_response(self, scope: Scope, e: Exception) -> ORJSONResponse:
+        """根据异常类型构建错误响应"""
+        error_message = str(e)
+        
+        # 沿MRO查找最具体的已知异常类型
+        for exc_type in type(e).__mro__:
+            entry = _ERROR_MAP.get(exc_type)
+            if entry is not None:
+                break
+        else:
+            entry = None
+        
+        if entry is None:
             # 其他未处理的异常
-            logger.error(f"未处理的异常: {str(e)}", extra={
-                "url": str(request.url),
-                "method": request.method,
-                "error": str(e),
-                "traceback": traceback.format_exc()
-            })
-            error_response = BaseResponse.error_response(
-                error="INTERNAL_SERVER_ERROR",
-                error_message="服务器内部错误"
+            # 交由日志处理器按需格式化堆栈，避免无条件调用traceback.format_exc()
+            logger.error(
+                f"未处理的异常: {error_message}",
+                extra=self._build_log_extra(scope, error_message),
+                exc_info=e
             )
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
-                content=error_response.dict()
-            )
\ No newline at end of file
+                content=_INTERNAL_ERROR_CONTENT
+            )
+        
+        status_code, log_prefix, content = entry
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(f"{log_prefix}: {error_message}", extra=self._build_log_extra(scope, error_message))
+        
+        if content is None:
+            # 参数验证错误直接返回异常信息
+            content = _VALIDATION_ERROR_TEMPLATE.copy()
+            content["error_message"] = error_message or content["error"]
+        
+        return ORJSONResponse(
+            status_code=status_code,
+            content=content
+        )
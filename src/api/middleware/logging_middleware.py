@@ -1,72 +1,86 @@
 # api/middleware/logging_middleware.py
+import itertools
+import logging
+import secrets
 import time
-import uuid
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 请求ID = 进程级随机前缀 + 自增计数，避免每个请求调用uuid4
+_REQUEST_ID_PREFIX = secrets.token_hex(4)
+_request_counter = itertools.count()
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """请求日志中间件"""
+
+class LoggingMiddleware:
+    """请求日志中间件（纯ASGI实现，避免BaseHTTPMiddleware的任务组与响应流复制开销）"""
+    
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
         # 生成请求ID
-        request_id = str(uuid.uuid4())
+        request_id = f"{_REQUEST_ID_PREFIX}-{next(_request_counter):x}"
         
         # 记录请求开始时间
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        # 记录请求信息
-        logger.info("请求开始", extra={
-            "request_id": request_id,
-            "method": request.method,
-            "url": str(request.url),
-            "user_agent": request.headers.get("user-agent"),
-            "client_ip": request.client.host if request.client else None,
-        })
+        # INFO未开启时跳过请求信息的收集（url、请求头等均为惰性计算）
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        request = Request(scope)
+        # 请求信息暂存在meta中，请求结束时只输出一条日志
+        meta = {"request_id": request_id, "method": scope["method"]}
+        if info_enabled:
+            meta["url"] = str(request.url)
+            meta["user_agent"] = request.headers.get("user-agent")
+            meta["client_ip"] = request.client.host if request.client else None
         
         # 将请求ID添加到请求状态中
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
+        
+        status_code = 500
+        process_time = 0.0
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, process_time
+            if message["type"] == "http.response.start":
+                # 计算处理时间并添加响应头
+                status_code = message["status"]
+                process_time = round(time.perf_counter() - start_time, 4)
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Request-ID", request_id)
+                headers.append("X-Process-Time", f"{process_time:.4f}")
+            await send(message)
         
         try:
             # 处理请求
-            response = await call_next(request)
-            
-            # 计算处理时间
-            process_time = time.time() - start_time
-            
-            # 记录响应信息
-            logger.info("请求完成", extra={
-                "request_id": request_id,
-                "method": request.method,
-                "url": str(request.url),
-                "status_code": response.status_code,
-                "process_time": round(process_time, 4),
-            })
-            
-            # 添加响应头
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Process-Time"] = str(round(process_time, 4))
-            
-            return response
-            
+            await self.app(scope, receive, send_wrapper)
+        
         except Exception as e:
             # 计算处理时间
-            process_time = time.time() - start_time
+            process_time = round(time.perf_counter() - start_time, 4)
             
             # 记录错误信息
-            logger.error("请求处理异常", extra={
-                "request_id": request_id,
-                "method": request.method,
-                "url": str(request.url),
-                "error": str(e),
-                "process_time": round(process_time, 4),
-            })
+            if "url" not in meta:
+                meta["url"] = str(request.url)
+            meta["error"] = str(e)
+            meta["process_time"] = process_time
+            logger.error("请求处理异常", extra=meta)
             
             # 重新抛出异常，让错误处理中间件处理
-            raise
\ No newline at end of file
+            raise
+        
+        # 记录请求信息与响应信息
+        if info_enabled:
+            meta["status_code"] = status_code
+            meta["process_time"] = process_time
+            logger.info("请求完成", extra=meta)
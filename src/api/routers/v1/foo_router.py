@@ -1,11 +1,14 @@
 # src/api/v1/routers/foo_router.py
+import random
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel, Field
 
 from src.application.handlers.foo_handler import FooHandler
-from src.infrastructure.decorators.rate_limit import api_rate_limit, user_rate_limit
-from src.infrastructure.decorators.retry import simple_retry
+from src.infrastructure.decorators.cache import response_cache
+from src.infrastructure.decorators.rate_limit import api_rate_limit, strict_rate_limit, user_rate_limit
+from src.infrastructure.decorators.retry import NON_RETRYABLE_EXCEPTIONS, simple_retry
 from src.infrastructure.tasks.task_decorator import async_task, sync_task
 from src.schemas.dtos.response.base_response import BaseResponse
 
@@ -24,6 +27,7 @@ class FooBatchRequest(BaseModel):
     """Foo批量处理请求"""
     items: List[Dict[str, Any]] = Field(..., min_items=1, max_items=100, description="批量处理项目")
     processing_time: float = Field(default=2.0, ge=0.1, le=10.0, description="每项处理时间(秒)")
+    shard_size: Optional[int] = Field(default=None, ge=1, le=100, description="分片大小，指定时按分片并发处理")
 
 
 class FooCacheRequest(BaseModel):
@@ -37,8 +41,9 @@ class FooExternalRequest(BaseModel):
     data: Dict[str, Any] = Field(default_factory=dict, description="发送的数据")
 
 
+@lru_cache()
 def get_foo_handler() -> FooHandler:
-    """依赖注入：获取Foo处理器"""
+    """依赖注入：获取Foo处理器（处理器无请求级状态，进程内复用同一实例）"""
     return FooHandler()
 
 
@@ -50,17 +55,15 @@ async def get_foo_status(handler: FooHandler = Depends(get_foo_handler)):
     
     这个接口用于快速检查服务状态，不需要限流和重试
     """
-    try:
-        result = await handler.handle_status_check()
-        return BaseResponse.success_response(result)
-    except Exception as e:
-        return BaseResponse.error_response("STATUS_CHECK_ERROR", str(e))
+    result = await handler.handle_status_check()
+    return handler.fast_response(result)
 
 
 # === 同步处理接口 ===
 @router.post("/sync", summary="同步数据处理")
 @api_rate_limit(requests_per_minute=60)  # 3. API层限流
-@simple_retry(attempts=2, delay=0.5)     # 2. 网络层重试
+@simple_retry(attempts=2, delay=0.5, backoff=2.0, jitter=True, max_delay=30.0,
+              give_up_on=NON_RETRYABLE_EXCEPTIONS)  # 2. 网络层重试
 @sync_task(timeout=30)                   # 1. 任务包装（同步执行）
 async def sync_data_process(
     request: FooDataRequest,
@@ -85,7 +88,8 @@ async def sync_data_process(
 # === 异步处理接口 ===
 @router.post("/async", summary="异步数据处理")
 @user_rate_limit(requests_per_minute=30)     # 3. 用户级限流
-@simple_retry(attempts=3, delay=1.0)         # 2. 重试机制
+@simple_retry(attempts=3, delay=1.0, backoff=2.0, jitter=True, max_delay=30.0,
+              give_up_on=NON_RETRYABLE_EXCEPTIONS)  # 2. 重试机制
 @async_task(priority=1, timeout=300, max_retries=2)  # 1. 异步任务
 async def async_data_process(
     request: FooDataRequest,
@@ -110,8 +114,9 @@ async def async_data_process(
 
 # === 批量处理接口 ===
 @router.post("/batch", summary="批量数据处理")
-@api_rate_limit(requests_per_minute=10)      # 3. 严格限流（批量操作）
-@simple_retry(attempts=2, delay=2.0)         # 2. 重试间隔更长
+@strict_rate_limit(requests_per_minute=10)   # 3. 严格限流（批量操作，滑动窗口）
+@simple_retry(attempts=2, delay=2.0, backoff=2.0, jitter=True, max_delay=30.0,
+              give_up_on=NON_RETRYABLE_EXCEPTIONS)  # 2. 重试间隔更长
 @async_task(priority=2, timeout=600, max_retries=1)  # 1. 高优先级异步任务
 async def batch_data_process(
     request: FooBatchRequest,
@@ -129,13 +134,15 @@ async def batch_data_process(
     """
     return await handler.handle_batch_processing(
         items=request.items,
-        processing_time=request.processing_time
+        processing_time=request.processing_time,
+        shard_size=request.shard_size
     )
 
 
 # === 缓存测试接口 ===
 @router.get("/cache/{key}", summary="获取缓存数据")
 @api_rate_limit(requests_per_minute=120)  # 缓存接口可以更高频率
+@response_cache(ttl=600, key_prefix="foo:cache:", key_func=lambda key, **_: key)  # 路由层缓存，命中时不进入Handler/Service
 async def get_cached_data(
     key: str,
     handler: FooHandler = Depends(get_foo_handler)
@@ -143,21 +150,19 @@ async def get_cached_data(
     """
     缓存数据获取 - 测试缓存装饰器
     
-    这个接口在Service层使用了@api_cache装饰器
-    第一次调用会生成数据，后续调用返回缓存
+    这个接口在Service层使用了@api_cache装饰器，路由层另有@response_cache
+    第一次调用会生成数据，后续调用直接返回缓存的响应字节
     """
-    try:
-        service = handler.foo_service
-        result = await service.get_cached_data(key)
-        return BaseResponse.success_response(result)
-    except Exception as e:
-        return BaseResponse.error_response("CACHE_ERROR", str(e))
+    service = handler.foo_service
+    result = await service.get_cached_data(key)
+    return BaseResponse.success_response(result)
 
 
 # === 外部服务调用接口 ===
 @router.post("/external", summary="调用外部服务")
 @api_rate_limit(requests_per_minute=20)      # 3. 限制外部调用频率
-@simple_retry(attempts=3, delay=1.0)         # 2. 外部调用重试
+@simple_retry(attempts=3, delay=1.0, backoff=2.0, jitter=True, max_delay=30.0,
+              give_up_on=NON_RETRYABLE_EXCEPTIONS)  # 2. 外部调用重试
 @sync_task(timeout=60)                       # 1. 同步任务（需要立即响应）
 async def call_external_service(
     request: FooExternalRequest,
@@ -179,7 +184,7 @@ async def call_external_service(
 
 # === 管理接口 ===
 @router.post("/reset", summary="重置服务计数器")
-@api_rate_limit(requests_per_minute=5)  # 管理接口严格限流
+@strict_rate_limit(requests_per_minute=5)  # 管理接口严格限流（滑动窗口）
 async def reset_service_counters(
     handler: FooHandler = Depends(get_foo_handler)
 ):
@@ -188,12 +193,9 @@ async def reset_service_counters(
     
     用于测试和调试，重置服务内部计数器
     """
-    try:
-        service = handler.foo_service
-        result = service.reset_counters()
-        return BaseResponse.success_response(result)
-    except Exception as e:
-        return BaseResponse.error_response("RESET_ERROR", str(e))
+    service = handler.foo_service
+    result = service.reset_counters()
+    return BaseResponse.success_response(result)
 
 
 # === 健康检查接口 ===
@@ -206,18 +208,16 @@ async def foo_health_check(
     
     不使用装饰器，直接调用服务层健康检查
     """
-    try:
-        service = handler.foo_service
-        result = await service.health_check()
-        return BaseResponse.success_response(result)
-    except Exception as e:
-        return BaseResponse.error_response("HEALTH_CHECK_ERROR", str(e))
+    service = handler.foo_service
+    result = await service.health_check()
+    return BaseResponse.success_response(result)
 
 
 # === 测试接口（开发用） ===
 @router.post("/test/decorators", summary="测试装饰器组合")
 @api_rate_limit(requests_per_minute=5)       # 4. 最外层：API限流
-@simple_retry(attempts=2, delay=1.0)         # 3. 重试机制
+@simple_retry(attempts=2, delay=1.0, backoff=2.0, jitter=True, max_delay=30.0,
+              give_up_on=NON_RETRYABLE_EXCEPTIONS)  # 3. 重试机制
 @async_task(priority=0, timeout=120, max_retries=1)  # 2. 任务包装
 async def test_decorators(
     fail_rate: float = Query(default=0.2, ge=0.0, le=1.0, description="失败率"),
@@ -233,8 +233,6 @@ async def test_decorators(
     3. 任务系统是否稳定
     4. 异常处理是否正确
     """
-    import random
-    
     # 模拟随机失败
     if random.random() < fail_rate:
         raise Exception(f"模拟失败（失败率: {fail_rate}）")
@@ -1,5 +1,9 @@
 # src/api/v1/routers/health_router.py
+from functools import lru_cache
+
+import orjson
 from fastapi import APIRouter, Depends
+from fastapi.responses import Response
 
 from src.application.handlers.system.health_handler import HealthHandler
 from src.schemas.dtos.response.base_response import BaseResponse
@@ -7,13 +11,20 @@ from src.schemas.dtos.response.health_response import HealthData
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
+# 仅用于OpenAPI文档，不设置response_model以跳过响应的二次校验
+_HEALTH_RESPONSES = {200: {"model": BaseResponse[HealthData]}}
+
+# ping的响应内容固定，模块加载时预先编码
+_PONG_CONTENT = orjson.dumps({"status": "ok", "message": "pong"})
+
 
+@lru_cache()
 def get_health_handler() -> HealthHandler:
-    """获取健康检查处理器"""
+    """获取健康检查处理器（进程内复用同一实例）"""
     return HealthHandler()
 
 
-@router.get("/", response_model=BaseResponse[HealthData], summary="异步健康检查")
+@router.get("/", responses=_HEALTH_RESPONSES, summary="异步健康检查")
 async def health_check(handler: HealthHandler = Depends(get_health_handler)):
     """
     异步健康检查接口
@@ -24,22 +35,23 @@ async def health_check(handler: HealthHandler = Depends(get_health_handler)):
     - 数据库连接状态（如果配置）
     - S3连接状态（如果配置）
     """
-    return await handler.handle_request()
+    return await handler.handle_fast_request()
 
 
-@router.get("/sync", response_model=BaseResponse[HealthData], summary="同步健康检查")
-def health_check_sync(handler: HealthHandler = Depends(get_health_handler)):
+@router.get("/sync", responses=_HEALTH_RESPONSES, summary="同步健康检查")
+async def health_check_sync(handler: HealthHandler = Depends(get_health_handler)):
     """
     同步健康检查接口
     
     快速检查服务基本运行状态，不检查外部依赖
+    检查过程只读内存、不含I/O，直接在事件循环中执行，不占用线程池
     """
-    return handler.handle_sync_request()
+    return handler.handle_fast_sync_request()
 
 
 @router.get("/ping", summary="简单ping检查")
-def ping():
+async def ping():
     """
     简单的ping检查，用于负载均衡器健康检查
     """
-    return {"status": "ok", "message": "pong"}
\ No newline at end of file
+    return Response(content=_PONG_CONTENT, media_type="application/json")
\ No newline at end of file
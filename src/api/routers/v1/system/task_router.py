@@ -1,39 +1,47 @@
 # src/api/v1/routers/system/task_router.py (增强版)
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
 
 from src.application.handlers.system.task_handler import TaskHandler
-from src.infrastructure.decorators.rate_limit import api_rate_limit
+from src.infrastructure.decorators.rate_limit import strict_rate_limit
 from src.schemas.dtos.response.base_response import BaseResponse
 
 router = APIRouter(prefix="/tasks", tags=["Task Management"])
 
+# 任务结果成功响应的固定前后缀，结果只编码一次后直接拼接
+# 导入时由BaseResponse.success_response编码一个占位数据后切分得到，模型字段变化时自动保持一致
+_RESULT_DATA_PLACEHOLDER = "__task_result__"
+_RESULT_RESPONSE_PREFIX, _RESULT_RESPONSE_SUFFIX = orjson.dumps(
+    BaseResponse.success_response(_RESULT_DATA_PLACEHOLDER).dict()
+).split(orjson.dumps(_RESULT_DATA_PLACEHOLDER))
 
+
+@lru_cache()
 def get_task_handler() -> TaskHandler:
+    """获取任务处理器（进程内复用同一实例）"""
     return TaskHandler()
 
 
 @router.get("/registry", summary="获取任务注册表信息")
 async def get_task_registry(handler: TaskHandler = Depends(get_task_handler)):
     """获取任务注册表的完整信息"""
-    try:
-        result = await handler.task_service.get_task_registry_info()
-        return BaseResponse.success_response(result)
-    except Exception as e:
-        return BaseResponse.error_response("REGISTRY_ERROR", str(e))
+    result = await handler.task_service.get_task_registry_info()
+    return BaseResponse.success_response(result)
 
 
 @router.get("/search", summary="搜索任务类型")
 async def search_task_types(
-    q: str = Query(..., description="搜索关键词"),
+    q: str = Query("", description="搜索关键词"),
+    tags: Optional[List[str]] = Query(None, description="标签过滤（匹配任一标签）"),
+    category: Optional[str] = Query(None, description="分类过滤"),
     handler: TaskHandler = Depends(get_task_handler)
 ):
     """搜索已注册的任务类型"""
-    try:
-        results = await handler.task_service.search_task_types(q)
-        return BaseResponse.success_response(results)
-    except Exception as e:
-        return BaseResponse.error_response("SEARCH_ERROR", str(e))
+    results = await handler.task_service.search_task_types(q, tags=tags, category=category)
+    return BaseResponse.success_response(results)
 
 
 @router.get("/{task_id}/result", summary="获取任务结果")
@@ -42,15 +50,16 @@ async def get_task_result(
     handler: TaskHandler = Depends(get_task_handler)
 ):
     """获取任务结果（从缓存或S3）"""
-    try:
-        result = await handler.task_service.get_task_result(task_id)
-        if not result:
-            raise HTTPException(status_code=404, detail="任务结果不存在")
-        return BaseResponse.success_response(result)
-    except HTTPException:
-        raise
-    except Exception as e:
-        return BaseResponse.error_response("RESULT_ERROR", str(e))
+    result = await handler.task_service.get_task_result(task_id)
+    if not result:
+        raise HTTPException(status_code=404, detail="任务结果不存在")
+    
+    # 结果可能较大，跳过BaseResponse构建与jsonable_encoder的中间拷贝，直接编码为字节
+    body = orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return Response(
+        content=b"".join((_RESULT_RESPONSE_PREFIX, body, _RESULT_RESPONSE_SUFFIX)),
+        media_type="application/json"
+    )
 
 
 @router.delete("/{task_id}/result", summary="删除任务结果")
@@ -60,47 +69,35 @@ async def delete_task_result(
     handler: TaskHandler = Depends(get_task_handler)
 ):
     """删除任务结果"""
-    try:
-        result = await handler.task_service.delete_task_result(task_id, delete_from_s3)
-        return BaseResponse.success_response(result)
-    except Exception as e:
-        return BaseResponse.error_response("DELETE_ERROR", str(e))
+    result = await handler.task_service.delete_task_result(task_id, delete_from_s3)
+    return BaseResponse.success_response(result)
 
 
 @router.post("/{task_id}/kill", summary="强制终止任务")
-@api_rate_limit(requests_per_minute=10)
+@strict_rate_limit(requests_per_minute=10)
 async def force_kill_task(
     task_id: str,
     reason: str = Query(default="手动终止", description="终止原因"),
     handler: TaskHandler = Depends(get_task_handler)
 ):
     """强制终止正在运行的任务"""
-    try:
-        result = await handler.task_service.force_kill_task(task_id, reason)
-        return BaseResponse.success_response(result)
-    except Exception as e:
-        return BaseResponse.error_response("KILL_ERROR", str(e))
+    result = await handler.task_service.force_kill_task(task_id, reason)
+    return BaseResponse.success_response(result)
 
 
 @router.get("/storage/stats", summary="获取存储统计")
 async def get_storage_stats(handler: TaskHandler = Depends(get_task_handler)):
     """获取任务结果存储统计信息"""
-    try:
-        stats = await handler.task_service.get_storage_statistics()
-        return BaseResponse.success_response(stats)
-    except Exception as e:
-        return BaseResponse.error_response("STORAGE_STATS_ERROR", str(e))
+    stats = await handler.task_service.get_storage_statistics()
+    return BaseResponse.success_response(stats)
 
 
 @router.post("/cleanup", summary="清理系统")
-@api_rate_limit(requests_per_minute=5)
+@strict_rate_limit(requests_per_minute=5)
 async def cleanup_system(
     max_age_hours: int = Query(default=24, ge=1, le=168, description="清理多少小时前的数据"),
     handler: TaskHandler = Depends(get_task_handler)
 ):
     """清理旧的任务数据和结果"""
-    try:
-        result = await handler.task_service.cleanup_system(max_age_hours)
-        return BaseResponse.success_response(result)
-    except Exception as e:
-        return BaseResponse.error_response("CLEANUP_ERROR", str(e))
\ No newline at end of file
+    result = await handler.task_service.cleanup_system(max_age_hours)
+    return BaseResponse.success_response(result)
\ No newline at end of file
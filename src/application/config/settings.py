@@ -2,12 +2,47 @@
 import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Final, List, Optional
 
 import yaml
 from pydantic import Field, validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# 优先使用libyaml的C实现加载器，未编译libyaml时回退到纯Python实现
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# YAML配置键 -> 属性名的特殊映射关系
+_ATTR_MAPPING: Final[Dict[str, str]] = {
+    "framework_name": "app_name",
+    "framework_version": "app_version",
+    "framework_debug": "debug",
+    "server_host": "host",
+    "server_port": "port", 
+    "server_reload": "reload",
+    "infrastructure_cache_default_ttl": "cache_default_ttl",
+    "infrastructure_cache_key_prefix": "cache_key_prefix",
+    "infrastructure_cache_max_size": "cache_max_size",
+    "infrastructure_tasks_max_workers": "task_max_workers",
+    "infrastructure_tasks_retry_attempts": "task_retry_attempts",
+    "infrastructure_tasks_retry_delay": "task_retry_delay",
+    "infrastructure_tasks_result_cache_size": "task_result_cache_size",
+    "infrastructure_tasks_result_cache_ttl": "task_result_cache_ttl",
+    "infrastructure_tasks_enable_s3_storage": "task_enable_s3_storage",  # 新增
+    "infrastructure_tasks_scheduler_interval": "task_scheduler_interval",  # 新增
+    "infrastructure_tasks_cleanup_interval": "task_cleanup_interval",  # 新增
+    "infrastructure_rate_limiting_enabled": "rate_limit_enabled",
+    "infrastructure_rate_limiting_requests_per_minute": "rate_limit_requests_per_minute",
+    "infrastructure_rate_limiting_burst_size": "rate_limit_burst_size",
+    "services_health_check_timeout": "health_check_timeout",
+    "services_health_dependencies": "health_dependencies",
+    "aws_region": "aws_region",
+    "aws_s3_bucket_prefix": "s3_bucket",
+    "monitoring_enable_metrics": "enable_metrics",
+    "monitoring_enable_tracing": "enable_tracing",
+    "monitoring_sample_rate": "tracing_sample_rate",
+    "notifications_slack_enabled": "slack_enabled",
+}
+
 
 class Settings(BaseSettings):
     """应用配置类 - 支持环境变量、YAML配置文件和默认值"""
@@ -30,6 +65,7 @@ class Settings(BaseSettings):
     host: str = Field(default="0.0.0.0")
     port: int = Field(default=8000, ge=1, le=65535)
     reload: bool = Field(default=False)
+    event_loop: str = Field(default="auto")  # uvicorn事件循环实现：auto时已安装uvloop则优先使用
     
     # === API设置 ===
     api_prefix: str = Field(default="/api/v1")
@@ -100,6 +136,7 @@ class Settings(BaseSettings):
     rate_limit_burst_size: int = Field(default=20, ge=1)
     
     # === 服务配置 ===
+    handler_warmup: bool = Field(default=False)  # 启动时预热处理器（缓存与重试装饰器路径）
     health_check_timeout: int = Field(default=5, ge=1)
     health_dependencies: List[str] = Field(default=["cache"])
     
@@ -147,18 +184,19 @@ class Settings(BaseSettings):
         core_config_path = config_dir / "core_config.yaml"
         if core_config_path.exists():
             with open(core_config_path, "r", encoding="utf-8") as f:
-                core_config = yaml.safe_load(f)
+                core_config = yaml.load(f, Loader=_YAML_LOADER)
                 self._update_from_nested_dict(core_config)
         
         # 加载业务配置
         service_config_path = config_dir / "service_config.yaml"
         if service_config_path.exists():
             with open(service_config_path, "r", encoding="utf-8") as f:
-                service_config = yaml.safe_load(f)
+                service_config = yaml.load(f, Loader=_YAML_LOADER)
                 self._update_from_nested_dict(service_config)
 
     def _update_from_nested_dict(self, config_dict: Dict[str, Any], prefix: str = "") -> None:
         """从嵌套字典更新配置"""
+        model_fields = type(self).model_fields
         for key, value in config_dict.items():
             if isinstance(value, dict):
                 # 递归处理嵌套字典
@@ -168,43 +206,11 @@ class Settings(BaseSettings):
                 # 将配置键转换为属性名
                 attr_name = f"{prefix}{key}".lower()
                 
-                # 处理特殊的映射关系
-                attr_mapping = {
-                    "framework_name": "app_name",
-                    "framework_version": "app_version",
-                    "framework_debug": "debug",
-                    "server_host": "host",
-                    "server_port": "port", 
-                    "server_reload": "reload",
-                    "infrastructure_cache_default_ttl": "cache_default_ttl",
-                    "infrastructure_cache_key_prefix": "cache_key_prefix",
-                    "infrastructure_cache_max_size": "cache_max_size",
-                    "infrastructure_tasks_max_workers": "task_max_workers",
-                    "infrastructure_tasks_retry_attempts": "task_retry_attempts",
-                    "infrastructure_tasks_retry_delay": "task_retry_delay",
-                    "infrastructure_tasks_result_cache_size": "task_result_cache_size",
-                    "infrastructure_tasks_result_cache_ttl": "task_result_cache_ttl",
-                    "infrastructure_tasks_enable_s3_storage": "task_enable_s3_storage",  # 新增
-                    "infrastructure_tasks_scheduler_interval": "task_scheduler_interval",  # 新增
-                    "infrastructure_tasks_cleanup_interval": "task_cleanup_interval",  # 新增
-                    "infrastructure_rate_limiting_enabled": "rate_limit_enabled",
-                    "infrastructure_rate_limiting_requests_per_minute": "rate_limit_requests_per_minute",
-                    "infrastructure_rate_limiting_burst_size": "rate_limit_burst_size",
-                    "services_health_check_timeout": "health_check_timeout",
-                    "services_health_dependencies": "health_dependencies",
-                    "aws_region": "aws_region",
-                    "aws_s3_bucket_prefix": "s3_bucket",
-                    "monitoring_enable_metrics": "enable_metrics",
-                    "monitoring_enable_tracing": "enable_tracing",
-                    "monitoring_sample_rate": "tracing_sample_rate",
-                    "notifications_slack_enabled": "slack_enabled",
-                }
-                
                 # 使用映射的属性名或原属性名
-                final_attr = attr_mapping.get(attr_name, attr_name)
+                final_attr = _ATTR_MAPPING.get(attr_name, attr_name)
                 
-                # 只有当属性存在时才设置
-                if hasattr(self, final_attr):
+                # 只有当属性是已声明的配置字段时才设置
+                if final_attr in model_fields:
                     current_value = getattr(self, final_attr)
                     # 如果当前值是默认值，则用配置文件的值替换
                     if (isinstance(current_value, list) and not current_value) or \
@@ -1,11 +1,21 @@
 # src/application/handlers/foo_handler.py
 import asyncio
+import inspect
+import logging
+from time import monotonic
 from typing import Any, Dict, Optional
+from src.application.config.settings import get_settings
 from src.application.handlers.handler_interface import BaseHandler
 from src.application.services.foo_service import get_foo_service
 from src.infrastructure.decorators.retry import simple_retry
 from src.infrastructure.decorators.cache import short_cache
 
+settings = get_settings()
+
+# Handler层追加到处理结果中的固定字段
+_ASYNC_RESULT_META = {"handler": "FooHandler", "flow": "async_processing"}
+_SYNC_RESULT_META = {"handler": "FooHandler", "flow": "sync_processing"}
+
 
 class FooHandler(BaseHandler[Dict[str, Any]]):
     """
@@ -20,6 +30,16 @@ class FooHandler(BaseHandler[Dict[str, Any]]):
     def __init__(self):
         super().__init__()
         self.foo_service = get_foo_service()
+        
+        # 进行中的状态检查，供并发请求共享
+        self._status_inflight: Optional[asyncio.Future] = None
+        
+        # 通用请求的action分发表，只在初始化时构建一次
+        self._actions = {
+            "async": lambda request_data: self.handle_async_processing(request_data.get("data", {})),
+            "sync": lambda request_data: self.handle_sync_processing(request_data.get("data", {})),
+            "batch": lambda request_data: self.handle_batch_processing(request_data.get("items", []))
+        }
     
     async def handle_async_processing(
         self, 
@@ -33,11 +53,12 @@ class FooHandler(BaseHandler[Dict[str, Any]]):
         业务流程：验证 -> 异步处理 -> 包装响应
         注意：参数验证失败不应该重试，所以验证逻辑在装饰器外部
         """
-        self.logger.info("开始异步处理流程", extra={
-            "data_keys": list(data.keys()) if data else [],
-            "processing_time": processing_time,
-            "has_callback": bool(callback_url)
-        })
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("开始异步处理流程", extra={
+                "data_keys": list(data.keys()) if data else [],
+                "processing_time": processing_time,
+                "has_callback": bool(callback_url)
+            })
         
         # 1. 业务参数验证（不重试）
         if not data:
@@ -45,46 +66,30 @@ class FooHandler(BaseHandler[Dict[str, Any]]):
             raise ValueError("数据不能为空")
         
         if processing_time > 30:
-            self.logger.warning(f"处理时间过长：{processing_time}s，调整为30s")
+            self.logger.warning("处理时间过长：%ss，调整为30s", processing_time)
             processing_time = 30.0
         
-        # 2. 调用实际处理方法（可能带重试）
-        return await self._async_processing_with_error_handling(
-            data, processing_time, callback_url
-        )
-    
-    async def _async_processing_with_error_handling(
-        self, 
-        data: Dict[str, Any], 
-        processing_time: float,
-        callback_url: Optional[str]
-    ) -> Dict[str, Any]:
-        """实际的异步处理逻辑（带错误处理）"""
+        # 2. 调用服务层进行业务处理（直接在本协程内完成，不再经过中间方法）
         try:
-            # 调用服务层进行业务处理
             result = await self.foo_service.process_data_async(
                 data=data,
                 processing_time=processing_time,
                 callback_url=callback_url
             )
             
-            # Handler层的后处理（业务流程相关）
-            enhanced_result = {
-                **result,
-                "handler": "FooHandler",
-                "flow": "async_processing",
-                "request_processed_at": asyncio.get_event_loop().time()
-            }
+            # Handler层的后处理（业务流程相关）：服务层每次返回新字典，直接原地追加字段
+            result.update(_ASYNC_RESULT_META)
+            result["request_processed_at"] = monotonic()
             
             self.logger.info("异步处理流程完成", extra={
                 "process_id": result.get("process_id"),
                 "processing_time": processing_time
             })
             
-            return enhanced_result
+            return result
             
         except Exception as e:
-            self.logger.error(f"异步处理流程失败: {str(e)}", exc_info=True)
+            self.logger.error("异步处理流程失败: %s", e, exc_info=True)
             raise
     
     def handle_sync_processing(
@@ -98,10 +103,11 @@ class FooHandler(BaseHandler[Dict[str, Any]]):
         业务流程：验证 -> 同步处理 -> 包装响应
         注意：参数验证失败不应该重试，所以验证逻辑在装饰器外部
         """
-        self.logger.info("开始同步处理流程", extra={
-            "data_keys": list(data.keys()) if data else [],
-            "processing_time": processing_time
-        })
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("开始同步处理流程", extra={
+                "data_keys": list(data.keys()) if data else [],
+                "processing_time": processing_time
+            })
         
         # 1. 业务参数验证（不重试）
         if not data:
@@ -109,13 +115,13 @@ class FooHandler(BaseHandler[Dict[str, Any]]):
             raise ValueError("数据不能为空")
         
         if processing_time > 5:
-            self.logger.warning(f"同步处理时间过长：{processing_time}s，调整为5s")
+            self.logger.warning("同步处理时间过长：%ss，调整为5s", processing_time)
             processing_time = 5.0
         
         # 2. 调用实际处理方法（带重试）
         return self._sync_processing_with_retry(data, processing_time)
     
-    @simple_retry(attempts=2, delay=0.5)  # 只对实际处理进行重试
+    @simple_retry(attempts=2, delay=0.0, retry_on=(OSError, TimeoutError))  # 只对实际处理的瞬时错误立即重试
     def _sync_processing_with_retry(
         self, 
         data: Dict[str, Any], 
@@ -129,22 +135,18 @@ class FooHandler(BaseHandler[Dict[str, Any]]):
                 processing_time=processing_time
             )
             
-            # Handler层后处理
-            enhanced_result = {
-                **result,
-                "handler": "FooHandler", 
-                "flow": "sync_processing",
-                "request_processed_at": asyncio.get_event_loop().time()
-            }
+            # Handler层后处理：服务层每次返回新字典，直接原地追加字段
+            result.update(_SYNC_RESULT_META)
+            result["request_processed_at"] = monotonic()
             
             self.logger.info("同步处理流程完成", extra={
                 "processing_time": processing_time
             })
             
-            return enhanced_result
+            return result
             
         except Exception as e:
-            self.logger.error(f"同步处理流程失败: {str(e)}", exc_info=True)
+            self.logger.error("同步处理流程失败: %s", e, exc_info=True)
             raise
     
     @short_cache(ttl=300)  # 缓存5分钟
@@ -153,7 +155,24 @@ class FooHandler(BaseHandler[Dict[str, Any]]):
         处理状态检查请求
         
         业务流程：获取服务状态 -> 系统状态 -> 组合响应
+        缓存未命中时并发的请求合并为一次检查（single-flight），避免缓存击穿
         """
+        task = self._status_inflight
+        if task is None:
+            task = asyncio.ensure_future(self._load_status_info())
+            self._status_inflight = task
+            task.add_done_callback(self._clear_status_inflight)
+        
+        # shield：单个请求被取消时不影响其他等待同一结果的请求
+        return await asyncio.shield(task)
+    
+    def _clear_status_inflight(self, task: asyncio.Future) -> None:
+        """状态检查完成后清除进行中的任务"""
+        if self._status_inflight is task:
+            self._status_inflight = None
+    
+    async def _load_status_info(self) -> Dict[str, Any]:
+        """实际的状态检查逻辑"""
         self.logger.debug("开始状态检查流程")
         
         try:
@@ -175,20 +194,23 @@ class FooHandler(BaseHandler[Dict[str, Any]]):
             return status_info
             
         except Exception as e:
-            self.logger.error(f"状态检查失败: {str(e)}", exc_info=True)
+            self.logger.error("状态检查失败: %s", e, exc_info=True)
             raise
     
     async def handle_batch_processing(
         self, 
         items: list[Dict[str, Any]], 
-        processing_time: float = 1.0
+        processing_time: float = 1.0,
+        shard_size: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         处理批量处理请求
         
         业务流程：验证 -> 批量处理 -> 汇总结果
+        指定shard_size时按分片并发处理（并发数不超过task_max_workers），
+        最慢的项目不再拖慢整批
         """
-        self.logger.info(f"开始批量处理流程，共{len(items)}项", extra={
+        self.logger.info("开始批量处理流程，共%d项", len(items), extra={
             "batch_size": len(items),
             "processing_time": processing_time
         })
@@ -198,21 +220,30 @@ class FooHandler(BaseHandler[Dict[str, Any]]):
             raise ValueError("批量处理项目不能为空")
         
         if len(items) > 100:
-            self.logger.warning(f"批量大小过大：{len(items)}，限制为100")
-            items = items[:100]
+            self.logger.warning("批量大小过大：%d，限制为100", len(items))
+            # 请求列表由本次调用独占，原地截断，不再复制切片
+            del items[100:]
         
         # 2. 调用服务层批量处理
         try:
-            results = await self.foo_service.process_batch_async(
-                items=items,
-                processing_time=processing_time
-            )
+            if shard_size and shard_size < len(items):
+                results = await self._process_batch_sharded(items, processing_time, shard_size)
+            else:
+                results = await self.foo_service.process_batch_async(
+                    items=items,
+                    processing_time=processing_time
+                )
+            
+            # 3. Handler层汇总结果（单次遍历统计成功数）
+            successful_items = 0
+            for r in results:
+                if r.get("success"):
+                    successful_items += 1
             
-            # 3. Handler层汇总结果
             summary = {
                 "total_items": len(items),
-                "successful_items": len([r for r in results if r.get("success")]),
-                "failed_items": len([r for r in results if not r.get("success")]),
+                "successful_items": successful_items,
+                "failed_items": len(results) - successful_items,
                 "processing_time": processing_time,
                 "handler": "FooHandler",
                 "flow": "batch_processing",
@@ -228,9 +259,51 @@ class FooHandler(BaseHandler[Dict[str, Any]]):
             return summary
             
         except Exception as e:
-            self.logger.error(f"批量处理失败: {str(e)}", exc_info=True)
+            self.logger.error("批量处理失败: %s", e, exc_info=True)
             raise
     
+    async def _process_batch_sharded(
+        self,
+        items: list[Dict[str, Any]],
+        processing_time: float,
+        shard_size: int
+    ) -> list[Dict[str, Any]]:
+        """按分片并发调用服务层批量处理，结果保持原有顺序，item_index为项目在整批中的位置"""
+        semaphore = asyncio.Semaphore(settings.task_max_workers)
+        
+        async def process_shard(start: int) -> list[Dict[str, Any]]:
+            async with semaphore:
+                results = await self.foo_service.process_batch_async(
+                    items=items[start:start + shard_size],
+                    processing_time=processing_time
+                )
+            # 服务层按分片内位置编号，换算为整批中的位置
+            for result in results:
+                result["item_index"] += start
+            return results
+        
+        # TaskGroup：任一分片失败时统一取消其余分片
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(process_shard(start))
+                for start in range(0, len(items), shard_size)
+            ]
+        return [result for task in tasks for result in task.result()]
+    
+    async def warmup(self) -> None:
+        """
+        启动预热：以合成数据调用一次状态检查与同步处理
+        
+        让缓存、重试装饰器等首次调用的初始化开销发生在启动阶段，而非第一个真实请求
+        """
+        try:
+            await self.handle_status_check()
+            self.handle_sync_processing({"_warmup": 1}, processing_time=0.0)
+            self.logger.info("FooHandler预热完成")
+        except Exception as e:
+            # 预热失败不影响启动
+            self.logger.warning("FooHandler预热失败: %s", e)
+    
     async def _process_request(self, request_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         通用请求处理 - BaseHandler要求实现的方法
@@ -240,14 +313,10 @@ class FooHandler(BaseHandler[Dict[str, Any]]):
         if not request_data:
             return await self.handle_status_check()
         
-        # 根据请求类型路由到不同的处理方法
-        action = request_data.get("action", "status")
-        
-        if action == "async":
-            return await self.handle_async_processing(request_data.get("data", {}))
-        elif action == "sync":
-            return self.handle_sync_processing(request_data.get("data", {}))
-        elif action == "batch":
-            return await self.handle_batch_processing(request_data.get("items", []))
-        else:
-            return await self.handle_status_check()
\ No newline at end of file
+        # 根据请求类型路由到不同的处理方法，未知action返回状态信息
+        action_handler = self._actions.get(request_data.get("action", "status"))
+        if action_handler is None:
+            return await self.handle_status_check()
+        
+        result = action_handler(request_data)
+        return await result if inspect.isawaitable(result) else result
\ No newline at end of file
@@ -1,36 +1,70 @@
 # src/application/handlers/base_handler.py
-import asyncio
-from typing import Any, Dict, Generic, TypeVar
+import logging
+from functools import partial
+from typing import Any, ClassVar, Dict, Generic, Optional, TypeVar
 
 from src.infrastructure.logging.logger import get_logger
 from src.schemas.dtos.response.base_response import BaseResponse
 
 T = TypeVar('T')
 
+# 处理器错误响应工厂，错误代码预先绑定，调用时只需传入错误信息
+_handler_error_response = partial(BaseResponse.error_response, "HANDLER_ERROR")
+_sync_handler_error_response = partial(BaseResponse.error_response, "SYNC_HANDLER_ERROR")
+
+# 预先构建的成功响应外壳，快速响应只需填充data
+_SUCCESS_ENVELOPE = BaseResponse.success_response().dict()
+
 
 class BaseHandler(Generic[T]):
     """基础处理器类，提供通用的业务流程编排功能"""
     
+    # 每个处理器类的日志器只获取一次，按类缓存（不继承父类的缓存）
+    _class_logger: ClassVar[Optional[logging.Logger]] = None
+    
     def __init__(self):
-        self.logger = get_logger(self.__class__.__name__)
+        cls = type(self)
+        logger = cls.__dict__.get("_class_logger")
+        if logger is None:
+            logger = get_logger(cls.__name__)
+            cls._class_logger = logger
+        self.logger = logger
     
     async def handle_request(self, request_data: Dict[str, Any] = None) -> BaseResponse[T]:
         """处理请求的通用模板方法"""
+        # 日志级别只检查一次，INFO关闭时跳过两次日志调用及extra字典构建
+        log_info = self.logger.isEnabledFor(logging.INFO)
         try:
-            self.logger.info("开始处理请求", extra={"request_data": request_data})
+            if log_info:
+                self.logger.info("开始处理请求", extra={"request_data": request_data})
             
             # 调用具体的处理逻辑
             result = await self._process_request(request_data)
             
-            self.logger.info("请求处理成功")
-            return BaseResponse.success_response(result)
+            if log_info:
+                self.logger.info("请求处理成功")
+            return BaseResponse(data=result)
             
         except Exception as e:
-            self.logger.error(f"请求处理失败: {str(e)}", exc_info=True)
-            return BaseResponse.error_response(
-                error="HANDLER_ERROR",
-                error_message=f"处理请求时发生错误: {str(e)}"
-            )
+            self.logger.error("请求处理失败: %s", e, exc_info=True)
+            return _handler_error_response(f"处理请求时发生错误: {e}")
+    
+    @staticmethod
+    def fast_response(result: Any) -> Dict[str, Any]:
+        """构建与BaseResponse字段一致的成功响应字典，跳过Pydantic模型构建与校验"""
+        return {**_SUCCESS_ENVELOPE, "data": result}
+    
+    async def handle_fast_request(self, request_data: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        热点接口的快速请求处理，直接返回响应字典
+        
+        不捕获异常，错误由全局异常处理中间件统一转换为错误响应
+        """
+        return self.fast_response(await self._process_request(request_data))
+    
+    def handle_fast_sync_request(self, request_data: Dict[str, Any] = None) -> Dict[str, Any]:
+        """热点接口的快速同步请求处理，直接返回响应字典"""
+        return self.fast_response(self._process_sync_request(request_data))
     
     async def _process_request(self, request_data: Dict[str, Any] = None) -> T:
         """子类需要实现的具体处理逻辑"""
@@ -38,20 +72,20 @@ class BaseHandler(Generic[T]):
     
     def handle_sync_request(self, request_data: Dict[str, Any] = None) -> BaseResponse[T]:
         """处理同步请求"""
+        log_info = self.logger.isEnabledFor(logging.INFO)
         try:
-            self.logger.info("开始处理同步请求", extra={"request_data": request_data})
+            if log_info:
+                self.logger.info("开始处理同步请求", extra={"request_data": request_data})
             
             result = self._process_sync_request(request_data)
             
-            self.logger.info("同步请求处理成功")
-            return BaseResponse.success_response(result)
+            if log_info:
+                self.logger.info("同步请求处理成功")
+            return BaseResponse(data=result)
             
         except Exception as e:
-            self.logger.error(f"同步请求处理失败: {str(e)}", exc_info=True)
-            return BaseResponse.error_response(
-                error="SYNC_HANDLER_ERROR",
-                error_message=f"处理同步请求时发生错误: {str(e)}"
-            )
+            self.logger.error("同步请求处理失败: %s", e, exc_info=True)
+            return _sync_handler_error_response(f"处理同步请求时发生错误: {e}")
     
     def _process_sync_request(self, request_data: Dict[str, Any] = None) -> T:
         """子类需要实现的同步处理逻辑"""
@@ -1,34 +1,48 @@
 # handlers/health_handler.py
 import asyncio
-from datetime import datetime
+import time
+from typing import Optional
 
 from src.application.handlers.handler_interface import BaseHandler
 from src.schemas.dtos.response.health_response import HealthData
-from src.application.services.system.health_service import HealthService
+from src.application.services.system.health_service import get_health_service
 
 
 class HealthHandler(BaseHandler[HealthData]):
     """健康检查控制器"""
     
+    # 健康检查结果缓存时间（秒）：探针密集时窗口内的请求共享同一次检查结果
+    _CACHE_TTL = 1.0
+    
     def __init__(self):
         super().__init__()
-        self.health_service = HealthService()
+        self.health_service = get_health_service()
+        
+        self._cached_health: Optional[HealthData] = None
+        self._cache_expiry = 0.0
+        self._cache_lock = asyncio.Lock()
     
     async def _process_request(self, request_data: dict = None) -> HealthData:
-        """处理健康检查请求"""
-        # 模拟异步检查过程
-        await asyncio.sleep(0.05)
+        """处理健康检查请求（结果在_CACHE_TTL内复用）"""
+        if self._cached_health is not None and time.monotonic() < self._cache_expiry:
+            return self._cached_health
         
-        # 调用服务层获取健康状态
-        health_data = await self.health_service.check_health()
+        async with self._cache_lock:
+            # 等待锁期间可能已有其他请求刷新了缓存
+            now = time.monotonic()
+            if self._cached_health is not None and now < self._cache_expiry:
+                return self._cached_health
+            
+            # 调用服务层获取健康状态
+            health_data = await self.health_service.check_health()
+            
+            self._cached_health = health_data
+            self._cache_expiry = now + self._CACHE_TTL
         
         return health_data
     
     def _process_sync_request(self, request_data: dict = None) -> HealthData:
-        """处理同步健康检查请求"""
-        import time
-        time.sleep(0.01)
-        
+        """处理同步健康检查请求（仅做内存检查，不阻塞）"""
         # 调用服务层获取简单健康状态
         health_data = self.health_service.check_simple_health()
         
@@ -1,12 +1,14 @@
 # src/application/handlers/system/task_handler.py (完整版)
 import asyncio
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
 
 from src.application.handlers.handler_interface import BaseHandler
-from src.application.services.system.task_service import TaskService
-from src.infrastructure.tasks.task_manager import task_manager
-from src.infrastructure.tasks.task_registry import TaskRegistry
+from src.application.services.system.task_service import get_task_service
+from src.infrastructure.tasks.task_manager import get_task_manager
+from src.infrastructure.tasks.task_registry import get_task_registry
 from src.infrastructure.tasks.base_task import create_simple_task, create_service_task, TaskPriority
 from src.schemas.dtos.request.task_request import (
     TaskCreateRequest, TaskQueryRequest, TaskCancelRequest, 
@@ -19,24 +21,65 @@ from src.schemas.dtos.response.task_response import (
 from src.schemas.enums.base_enums import TaskStatusEnum, TaskTypeEnum
 from src.infrastructure.utils.datetime_utils import parse_datetime
 
+# 优先级数值 -> 分布统计中的名称
+_PRIORITY_NAMES = {0: "low", 1: "normal", 2: "high", 3: "urgent"}
+
+# 原始值 -> 枚举成员，转换时直接查表，跳过枚举构造
+_STATUS_BY_VALUE = {status.value: status for status in TaskStatusEnum}
+_TYPE_BY_VALUE = {task_type.value: task_type for task_type in TaskTypeEnum}
+
+# 排序字段 -> 排序键函数（字段缺失或为None时使用默认值）
+_SORT_KEYS = {
+    "created_at": lambda task: task.get("created_at") or "",
+    "priority": lambda task: task.get("priority") or 0,
+    "status": lambda task: task.get("status") or "",
+    "duration": lambda task: task.get("duration") or 0
+}
+
+
+def _parse_task_datetime(value: Any) -> Optional[datetime]:
+    """安全的时间解析：支持ISO字符串和datetime，其他情况返回None"""
+    if isinstance(value, datetime):
+        return value
+    if not value or not isinstance(value, str):
+        return None
+    
+    # 只有字符串确实无法解析时才走异常分支
+    try:
+        return parse_datetime(value)
+    except ValueError:
+        return None
+
 
 class TaskHandler(BaseHandler[Dict[str, Any]]):
     """任务管理处理器 - 完整实现"""
     
+    # 批量操作默认并发数（可通过请求params中的concurrency覆盖，限制在1到_BULK_CONCURRENCY_MAX之间）
+    _BULK_CONCURRENCY = 16
+    _BULK_CONCURRENCY_MAX = 64
+    
+    # 系统概览缓存时间（秒）：仪表盘轮询时窗口内的请求共享同一次统计
+    _OVERVIEW_CACHE_TTL = 1.0
+    
     def __init__(self):
         super().__init__()
-        self.task_service = TaskService()
-        self.task_manager = task_manager
-        self.task_registry = TaskRegistry()
+        self.task_service = get_task_service()
+        self.task_manager = get_task_manager()
+        self.task_registry = get_task_registry()
+        
+        self._overview_cache: Optional[Dict[str, Any]] = None
+        self._overview_expiry = 0.0
+        self._overview_lock = asyncio.Lock()
     
     async def submit_task(self, request: TaskCreateRequest) -> TaskSubmitResponse:
         """提交任务"""
         try:
-            self.logger.info(f"提交任务: {request.task_name}", extra={
-                "task_type": request.task_type,
-                "priority": request.priority,
-                "timeout": request.timeout
-            })
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("提交任务: %s", request.task_name, extra={
+                    "task_type": request.task_type,
+                    "priority": request.priority,
+                    "timeout": request.timeout
+                })
             
             # 检查任务是否已注册
             if not self._is_task_registered(request.task_name):
@@ -51,19 +94,20 @@ class TaskHandler(BaseHandler[Dict[str, Any]]):
             # 提交任务到管理器
             task_id = await self.task_manager.submit_task(task, **request.params)
             
-            # 获取队列信息
+            # 获取队列信息（开始时间只估算一次，完成时间在其基础上推算）
             queue_info = self.task_manager.get_queue_info()
+            estimated_start_time = self._estimate_start_time(queue_info)
             
             return TaskSubmitResponse(
                 task_id=task_id,
                 status=TaskStatusEnum.PENDING,
                 queue_position=queue_info.get("queue_size", 0),
-                estimated_start_time=self._estimate_start_time(queue_info),
-                estimated_completion_time=self._estimate_completion_time(request.timeout, queue_info)
+                estimated_start_time=estimated_start_time,
+                estimated_completion_time=self._estimate_completion_time(request.timeout, estimated_start_time)
             )
             
         except Exception as e:
-            self.logger.error(f"提交任务失败: {request.task_name} - {str(e)}")
+            self.logger.error("提交任务失败: %s - %s", request.task_name, e)
             raise
     
     async def get_task_status(self, request: TaskQueryRequest) -> TaskResponse:
@@ -76,7 +120,7 @@ class TaskHandler(BaseHandler[Dict[str, Any]]):
             
             if not status_info:
                 # 从存储中获取历史任务
-                status_info = await self.task_manager.storage.get_task_result(task_id)
+                status_info = await self.task_manager.get_task_result(task_id)
                 
                 if not status_info:
                     raise ValueError(f"任务不存在: {task_id}")
@@ -91,7 +135,7 @@ class TaskHandler(BaseHandler[Dict[str, Any]]):
             return self._convert_to_task_response(status_info)
             
         except Exception as e:
-            self.logger.error(f"获取任务状态失败: {request.task_id} - {str(e)}")
+            self.logger.error("获取任务状态失败: %s - %s", request.task_id, e)
             raise
     
     async def cancel_task(self, request: TaskCancelRequest) -> Dict[str, Any]:
@@ -119,23 +163,31 @@ class TaskHandler(BaseHandler[Dict[str, Any]]):
             }
             
         except Exception as e:
-            self.logger.error(f"取消任务失败: {request.task_id} - {str(e)}")
+            self.logger.error("取消任务失败: %s - %s", request.task_id, e)
             raise
     
     async def get_task_list(self, request: TaskListRequest) -> TaskListResponse:
         """获取任务列表"""
         try:
+            task_filter = self._build_task_filter(request)
+            
             # 获取活跃任务
             active_tasks = self.task_manager.get_all_tasks()
             
-            # 获取历史任务
-            historical_tasks = await self.task_service.get_task_history(limit=request.limit * 2)
+            # 获取历史任务：过滤条件下推到存储层，limit只计入满足条件的任务
+            historical_tasks = await self.task_service.get_task_history(
+                limit=request.offset + request.limit * 2,
+                predicate=task_filter
+            )
             
             # 合并任务数据
             all_tasks = self._merge_task_data(active_tasks, historical_tasks)
             
-            # 应用过滤条件
-            filtered_tasks = self._filter_tasks(all_tasks, request)
+            # 应用过滤条件（活跃任务优先于同ID的历史任务，合并后统一过滤；无过滤条件时跳过）
+            if task_filter is None:
+                filtered_tasks = all_tasks
+            else:
+                filtered_tasks = [task for task in all_tasks if task_filter(task)]
             
             # 排序
             sorted_tasks = self._sort_tasks(filtered_tasks, request.sort_by, request.sort_order)
@@ -147,14 +199,13 @@ class TaskHandler(BaseHandler[Dict[str, Any]]):
             paginated_tasks = sorted_tasks[start_idx:end_idx]
             
             # 转换为响应格式
-            task_responses = [
-                self._convert_to_task_response(task_data)
-                for task_data in paginated_tasks
-            ]
+            convert = self._convert_to_task_response
+            task_responses = [convert(task_data) for task_data in paginated_tasks]
             
             page = (request.offset // request.limit) + 1 if request.limit > 0 else 1
             
-            return TaskListResponse(
+            # 各行已是构建好的TaskResponse，外层同样跳过校验，避免对整页结果再做一次逐项检查
+            return TaskListResponse.model_construct(
                 tasks=task_responses,
                 total=total,
                 page=page,
@@ -164,24 +215,21 @@ class TaskHandler(BaseHandler[Dict[str, Any]]):
             )
             
         except Exception as e:
-            self.logger.error(f"获取任务列表失败: {str(e)}")
+            self.logger.error("获取任务列表失败: %s", e)
             raise
     
     async def get_task_statistics(self) -> TaskStatisticsResponse:
         """获取任务统计信息"""
         try:
-            # 获取核心统计
-            stats = await self.task_manager.get_statistics()
+            # 运行统计与任务分布来自同一快照，无需再单独获取全部任务
+            stats = await self.task_manager.get_statistics(include_details=True)
+            recent_stats = self._calculate_recent_stats()
             runtime_stats = stats["runtime"]
             performance_stats = stats["performance"]
             
-            # 获取详细状态分布
-            all_tasks = self.task_manager.get_all_tasks()
-            status_distribution = self._calculate_status_distribution(all_tasks)
-            priority_distribution = self._calculate_priority_distribution(all_tasks)
-            
-            # 计算24小时统计
-            recent_stats = await self._calculate_recent_stats()
+            distributions = stats["distributions"]
+            status_distribution = distributions["status"]
+            priority_distribution = self._name_priority_distribution(distributions["priority"])
             
             return TaskStatisticsResponse(
                 total_tasks=runtime_stats["total_tasks"],
@@ -204,42 +252,34 @@ class TaskHandler(BaseHandler[Dict[str, Any]]):
             )
             
         except Exception as e:
-            self.logger.error(f"获取任务统计失败: {str(e)}")
+            self.logger.error("获取任务统计失败: %s", e)
             raise
     
     async def get_registered_tasks(self) -> TaskTypesResponse:
         """获取已注册的任务类型"""
         try:
             # 获取注册信息
-            registered_tasks = self.task_registry.get_task_types()
+            registered_tasks, _ = self.task_registry.get_task_types_cached()
             
             # 分类任务类型
             sync_tasks = []
             async_tasks = []
-            task_categories = {}
             
             for task_name, task_info in registered_tasks.items():
-                task_type = task_info.get("type", "async")
-                category = task_info.get("category", "general")
-                
-                if task_type == "sync":
+                if task_info.get("type", "async") == "sync":
                     sync_tasks.append(task_name)
                 else:
                     async_tasks.append(task_name)
-                
-                if category not in task_categories:
-                    task_categories[category] = []
-                task_categories[category].append(task_name)
             
             return TaskTypesResponse(
                 sync_tasks=sync_tasks,
                 async_tasks=async_tasks,
                 total_registered=len(registered_tasks),
-                task_categories=task_categories
+                task_categories=self.task_registry.get_all_categories()
             )
             
         except Exception as e:
-            self.logger.error(f"获取任务类型失败: {str(e)}")
+            self.logger.error("获取任务类型失败: %s", e)
             raise
     
     async def bulk_operation(self, request: TaskBulkOperationRequest) -> TaskBulkOperationResponse:
@@ -249,46 +289,33 @@ class TaskHandler(BaseHandler[Dict[str, Any]]):
             task_ids = request.task_ids
             params = request.params
             
-            results = []
-            successful = 0
-            failed = 0
-            
-            for task_id in task_ids:
-                try:
-                    if operation == "cancel":
-                        force = params.get("force", False)
-                        reason = params.get("reason", "批量取消")
-                        
-                        if force:
-                            success = self.task_manager.force_kill_task(task_id, reason)
-                        else:
-                            success = await self.task_manager.cancel_task(task_id, reason)
-                        
-                        if success:
-                            successful += 1
-                            results.append({"task_id": task_id, "success": True})
-                        else:
-                            failed += 1
-                            results.append({"task_id": task_id, "success": False, "error": "任务不存在或无法取消"})
-                    
-                    elif operation == "delete":
-                        delete_from_s3 = params.get("delete_from_s3", False)
-                        deletion_result = await self.task_manager.storage.delete_result(task_id, delete_from_s3)
-                        
-                        if deletion_result["deleted_from"]:
-                            successful += 1
-                            results.append({"task_id": task_id, "success": True, "deleted_from": deletion_result["deleted_from"]})
-                        else:
-                            failed += 1
-                            results.append({"task_id": task_id, "success": False, "error": "任务结果不存在"})
-                    
-                    else:
-                        failed += 1
-                        results.append({"task_id": task_id, "success": False, "error": f"不支持的操作: {operation}"})
+            # 删除操作走存储层批量接口，一次调用代替逐个删除
+            if operation == "delete":
+                results = await self._bulk_delete_results(task_ids, params.get("delete_from_s3", False))
+                successful = sum(1 for result in results if result["success"])
                 
-                except Exception as e:
-                    failed += 1
-                    results.append({"task_id": task_id, "success": False, "error": str(e)})
+                return TaskBulkOperationResponse(
+                    operation=operation,
+                    total_requested=len(task_ids),
+                    successful=successful,
+                    failed=len(results) - successful,
+                    results=results
+                )
+            
+            # 并发执行各任务的操作，信号量限制并发数，避免对存储造成突发压力
+            semaphore = asyncio.Semaphore(self._resolve_bulk_concurrency(params.get("concurrency")))
+            
+            async def run_operation(task_id: str) -> Dict[str, Any]:
+                async with semaphore:
+                    try:
+                        return await self._bulk_operate_task(operation, task_id, params)
+                    except Exception as e:
+                        return {"task_id": task_id, "success": False, "error": str(e)}
+            
+            results = await asyncio.gather(*(run_operation(task_id) for task_id in task_ids))
+            
+            successful = sum(1 for result in results if result["success"])
+            failed = len(results) - successful
             
             return TaskBulkOperationResponse(
                 operation=operation,
@@ -299,9 +326,49 @@ class TaskHandler(BaseHandler[Dict[str, Any]]):
             )
             
         except Exception as e:
-            self.logger.error(f"批量操作失败: {str(e)}")
+            self.logger.error("批量操作失败: %s", e)
             raise
     
+    def _resolve_bulk_concurrency(self, value: Any) -> int:
+        """解析批量操作并发数：未指定时使用默认值，非整数视为参数错误，超出范围时截断到[1, _BULK_CONCURRENCY_MAX]"""
+        if value is None:
+            return self._BULK_CONCURRENCY
+        if isinstance(value, bool):
+            raise ValueError(f"无效的并发数: {value}")
+        try:
+            concurrency = int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"无效的并发数: {value}")
+        return max(1, min(concurrency, self._BULK_CONCURRENCY_MAX))
+    
+    async def _bulk_delete_results(self, task_ids: List[str], delete_from_s3: bool) -> List[Dict[str, Any]]:
+        """批量删除任务结果，转换为与逐个操作一致的结果格式"""
+        deletion_results = await self.task_manager.delete_task_results_bulk(task_ids, delete_from_s3)
+        
+        return [
+            {"task_id": info["task_id"], "success": True, "deleted_from": info["deleted_from"]}
+            if info["deleted_from"] else
+            {"task_id": info["task_id"], "success": False, "error": "任务结果不存在"}
+            for info in deletion_results
+        ]
+    
+    async def _bulk_operate_task(self, operation: str, task_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """对单个任务执行批量操作（删除操作由_bulk_delete_results批量处理，不经过此处）"""
+        if operation == "cancel":
+            force = params.get("force", False)
+            reason = params.get("reason", "批量取消")
+            
+            if force:
+                success = self.task_manager.force_kill_task(task_id, reason)
+            else:
+                success = await self.task_manager.cancel_task(task_id, reason)
+            
+            if success:
+                return {"task_id": task_id, "success": True}
+            return {"task_id": task_id, "success": False, "error": "任务不存在或无法取消"}
+        
+        return {"task_id": task_id, "success": False, "error": f"不支持的操作: {operation}"}
+    
     async def cleanup_completed_tasks(self, max_history: int = 1000) -> Dict[str, Any]:
         """清理已完成的任务"""
         try:
@@ -312,13 +379,12 @@ class TaskHandler(BaseHandler[Dict[str, Any]]):
             return cleanup_result
             
         except Exception as e:
-            self.logger.error(f"清理任务失败: {str(e)}")
+            self.logger.error("清理任务失败: %s", e)
             raise
     
     def _is_task_registered(self, task_name: str) -> bool:
         """检查任务是否已注册"""
-        registered_tasks = self.task_registry.get_task_types()
-        return task_name in registered_tasks
+        return self.task_registry.has_task_type(task_name)
     
     async def _create_task_from_request(self, request: TaskCreateRequest):
         """从请求创建任务实例"""
@@ -330,8 +396,7 @@ class TaskHandler(BaseHandler[Dict[str, Any]]):
             # 简化实现：创建一个通用的服务任务
             
             # 获取任务信息
-            registered_tasks = self.task_registry.get_task_types()
-            task_info = registered_tasks.get(task_name)
+            task_info = self.task_registry.get_task_info(task_name)
             
             if not task_info:
                 return None
@@ -367,188 +432,164 @@ class TaskHandler(BaseHandler[Dict[str, Any]]):
             return None
             
         except Exception as e:
-            self.logger.error(f"创建任务失败: {request.task_name} - {str(e)}")
+            self.logger.error("创建任务失败: %s - %s", request.task_name, e)
             return None
     
     def _merge_task_data(self, active_tasks: List[Dict], historical_tasks: List[Dict]) -> List[Dict]:
-        """合并活跃任务和历史任务"""
-        task_dict = {}
-        
-        # 活跃任务优先
-        for task_data in active_tasks:
-            task_id = task_data.get("task_id")
-            if task_id:
-                task_dict[task_id] = task_data
-        
-        # 添加历史任务（不覆盖活跃任务）
-        for task_data in historical_tasks:
-            task_id = task_data.get("task_id")
-            if task_id and task_id not in task_dict:
-                task_dict[task_id] = task_data
+        """合并活跃任务和历史任务（同ID时活跃任务优先；结果随后会重新排序）"""
+        if not historical_tasks:
+            # 活跃任务ID各不相同，无历史任务时无需合并
+            return active_tasks
         
-        return list(task_dict.values())
+        historical_map = {t["task_id"]: t for t in historical_tasks if t.get("task_id")}
+        active_map = {t["task_id"]: t for t in active_tasks if t.get("task_id")}
+        return list((historical_map | active_map).values())
     
-    def _filter_tasks(self, tasks: List[Dict], request: TaskListRequest) -> List[Dict]:
-        """根据请求参数过滤任务"""
-        filtered = tasks
+    def _build_task_filter(self, request: TaskListRequest) -> Optional[Callable[[Dict], bool]]:
+        """根据请求参数构建任务过滤条件（所有条件合并为一个判断；未设置任何过滤条件时返回None）"""
+        status = request.status_filter or None
+        task_name = request.task_name_filter or None
+        priority_min = request.priority_min
+        priority_max = request.priority_max
+        tags = set(request.tags_filter) if request.tags_filter else None
         
-        if request.status_filter:
-            filtered = [t for t in filtered if t.get("status") == request.status_filter]
-        
-        if request.task_name_filter:
-            filtered = [t for t in filtered if t.get("task_name") == request.task_name_filter]
-        
-        if request.priority_min is not None:
-            filtered = [t for t in filtered if t.get("priority", 0) >= request.priority_min]
-        
-        if request.priority_max is not None:
-            filtered = [t for t in filtered if t.get("priority", 0) <= request.priority_max]
+        if (
+            status is None and task_name is None and tags is None
+            and priority_min is None and priority_max is None
+        ):
+            return None
         
-        if request.tags_filter:
-            filtered = [
-                t for t in filtered 
-                if any(tag in t.get("tags", []) for tag in request.tags_filter)
-            ]
+        def matches(t: Dict) -> bool:
+            return (
+                (status is None or t.get("status") == status)
+                and (task_name is None or t.get("task_name") == task_name)
+                and (priority_min is None or t.get("priority", 0) >= priority_min)
+                and (priority_max is None or t.get("priority", 0) <= priority_max)
+                and (tags is None or not tags.isdisjoint(t.get("tags") or ()))
+            )
         
-        return filtered
+        return matches
     
     def _sort_tasks(self, tasks: List[Dict], sort_by: str, sort_order: str) -> List[Dict]:
-        """排序任务"""
-        reverse = sort_order.lower() == "desc"
+        """排序任务（sorted对每个任务只计算一次排序键）"""
+        sort_key = _SORT_KEYS.get(sort_by)
+        if sort_key is None:
+            # 默认按创建时间倒序排序
+            sort_key = _SORT_KEYS["created_at"]
+            reverse = True
+        else:
+            reverse = sort_order.lower() == "desc"
         
-        try:
-            if sort_by == "created_at":
-                return sorted(tasks, key=lambda x: x.get("created_at") or "", reverse=reverse)
-            elif sort_by == "priority":
-                return sorted(tasks, key=lambda x: x.get("priority", 0), reverse=reverse)
-            elif sort_by == "status":
-                return sorted(tasks, key=lambda x: x.get("status", ""), reverse=reverse)
-            elif sort_by == "duration":
-                return sorted(tasks, key=lambda x: x.get("duration", 0), reverse=reverse)
-            else:
-                # 默认按创建时间排序
-                return sorted(tasks, key=lambda x: x.get("created_at") or "", reverse=True)
-        except Exception:
-            # 排序失败时返回原列表
-            return tasks
+        # 排序键已对缺失值做了默认处理，无需异常兜底
+        return sorted(tasks, key=sort_key, reverse=reverse)
     
-    def _calculate_status_distribution(self, tasks: List[Dict]) -> Dict[str, int]:
-        """计算状态分布"""
-        distribution = {}
-        for task in tasks:
-            status = task.get("status", "unknown")
-            distribution[status] = distribution.get(status, 0) + 1
-        return distribution
+    def _name_priority_distribution(self, priority_counts: Dict[int, int]) -> Dict[str, int]:
+        """将按优先级数值的计数转换为按名称的分布（未出现的优先级计0）"""
+        priority_distribution = dict.fromkeys(_PRIORITY_NAMES.values(), 0)
+        for priority, count in priority_counts.items():
+            priority_distribution[_PRIORITY_NAMES.get(priority, "normal")] += count
+        return priority_distribution
     
-    def _calculate_priority_distribution(self, tasks: List[Dict]) -> Dict[str, int]:
-        """计算优先级分布"""
-        priority_names = {0: "low", 1: "normal", 2: "high", 3: "urgent"}
-        distribution = {"low": 0, "normal": 0, "high": 0, "urgent": 0}
-        
-        for task in tasks:
-            priority = task.get("priority", 1)
-            priority_name = priority_names.get(priority, "normal")
-            distribution[priority_name] += 1
-        
-        return distribution
-    
-    async def _calculate_recent_stats(self) -> Dict[str, int]:
-        """计算最近24小时统计"""
-        # 简化实现，实际应该从存储中查询24小时内的任务
-        cutoff_time = datetime.utcnow().timestamp() - 86400  # 24小时前
-        
-        # 这里应该实现实际的时间范围查询
-        return {
-            "completed": 0,
-            "failed": 0
-        }
+    def _calculate_recent_stats(self) -> Dict[str, int]:
+        """计算最近24小时统计（由任务管理器维护的完成时间窗口直接计数，不扫描历史任务）"""
+        return self.task_manager.get_recent_completion_counts()
     
     def _estimate_start_time(self, queue_info: Dict) -> Optional[datetime]:
         """估算开始时间"""
+        now = datetime.utcnow()
         queue_size = queue_info.get("queue_size", 0)
         if queue_size == 0:
-            return datetime.utcnow()
+            return now
         
         # 简单估算：假设每个任务平均1分钟
-        estimated_delay = queue_size * 60
-        return datetime.utcnow().timestamp() + estimated_delay
+        return now + timedelta(seconds=queue_size * 60)
     
-    def _estimate_completion_time(self, timeout: Optional[int], queue_info: Dict) -> Optional[datetime]:
-        """估算完成时间"""
-        start_time = self._estimate_start_time(queue_info)
+    def _estimate_completion_time(self, timeout: Optional[int], start_time: Optional[datetime]) -> Optional[datetime]:
+        """估算完成时间（基于已估算的开始时间，不再重复读取时钟）"""
         if start_time and timeout:
-            return start_time + timeout
+            return start_time + timedelta(seconds=timeout)
         return None
     
     def _convert_to_task_response(self, task_data: Dict[str, Any]) -> TaskResponse:
-        """转换任务数据为TaskResponse格式"""
-        # 安全的时间解析
-        def safe_parse_datetime(dt_str):
-            if not dt_str:
-                return None
-            try:
-                if isinstance(dt_str, str):
-                    return parse_datetime(dt_str)
-                elif isinstance(dt_str, datetime):
-                    return dt_str
-                else:
-                    return None
-            except:
-                return None
+        """
+        转换任务数据为TaskResponse格式
         
-        start_time = safe_parse_datetime(task_data.get("start_time"))
-        end_time = safe_parse_datetime(task_data.get("end_time"))
-        created_at = safe_parse_datetime(task_data.get("created_at"))
+        数据来自任务管理器和存储层（可信数据），使用model_construct跳过字段校验；
+        状态仍通过枚举转换校验
+        """
+        get = task_data.get
         
-        # 确定任务类型
-        task_type_str = task_data.get("task_type", "async")
-        if task_type_str == "sync":
-            task_type = TaskTypeEnum.SYNC
-        else:
-            task_type = TaskTypeEnum.ASYNC
+        start_time = _parse_task_datetime(get("start_time"))
+        end_time = _parse_task_datetime(get("end_time"))
+        created_at = _parse_task_datetime(get("created_at"))
+        
+        # 确定任务类型（非sync一律按async处理）
+        task_type = _TYPE_BY_VALUE.get(get("task_type"), TaskTypeEnum.ASYNC)
         
-        return TaskResponse(
+        # 状态查表命中即可；未命中时交给枚举构造，非法状态仍然报错
+        status = get("status", "pending")
+        status = _STATUS_BY_VALUE.get(status) or TaskStatusEnum(status)
+        
+        return TaskResponse.model_construct(
             task_id=task_data["task_id"],
-            task_name=task_data.get("task_name", "unknown"),
+            task_name=get("task_name", "unknown"),
             task_type=task_type,
-            status=TaskStatusEnum(task_data.get("status", "pending")),
-            priority=task_data.get("priority", 0),
-            progress=task_data.get("progress", 0.0),
-            result=task_data.get("result"),
-            error=task_data.get("error"),
-            error_details=task_data.get("error_details"),
+            status=status,
+            priority=get("priority", 0),
+            progress=get("progress", 0.0),
+            result=get("result"),
+            error=get("error"),
+            error_details=get("error_details"),
             start_time=start_time,
             end_time=end_time,
-            duration=task_data.get("duration"),
-            timeout=task_data.get("timeout", 300),
-            retry_count=task_data.get("retry_count", 0),
-            max_retries=task_data.get("max_retries", 0),
-            tags=task_data.get("tags"),
-            worker_id=task_data.get("worker_id"),
+            duration=get("duration"),
+            timeout=get("timeout", 300),
+            retry_count=get("retry_count", 0),
+            max_retries=get("max_retries", 0),
+            tags=get("tags"),
+            worker_id=get("worker_id"),
             queue_position=None,  # 实时计算较复杂，暂时为None
             estimated_completion=None,  # 同上
             created_at=created_at,
             updated_at=end_time or start_time or created_at
         )
     
-    async def _process_request(self, request_data: Dict[str, Any] = None) -> Dict[str, Any]:
-        """处理任务相关请求的通用方法"""
-        if not request_data:
-            # 返回任务系统状态概览
-            stats = await self.get_task_statistics()
-            queue_info = self.task_manager.get_queue_info()
+    async def _get_overview(self) -> Dict[str, Any]:
+        """获取任务系统状态概览（结果在_OVERVIEW_CACHE_TTL内复用）"""
+        if self._overview_cache is not None and time.monotonic() < self._overview_expiry:
+            return self._overview_cache
+        
+        async with self._overview_lock:
+            # 等待锁期间可能已有其他请求刷新了缓存
+            now = time.monotonic()
+            if self._overview_cache is not None and now < self._overview_expiry:
+                return self._overview_cache
+            
+            # 概览只需运行统计，队列大小与工作者利用率同在其中，无需再查询队列信息
+            runtime_stats = (await self.task_manager.get_statistics())["runtime"]
             storage_stats = self.task_manager.storage.get_storage_statistics()
             
-            return {
+            overview = {
                 "message": "TaskHandler就绪，任务管理系统正常运行",
                 "system_overview": {
-                    "total_tasks": stats.total_tasks,
-                    "running_tasks": stats.running_tasks,
-                    "queue_size": queue_info["queue_size"],
-                    "worker_utilization": queue_info["worker_utilization"],
+                    "total_tasks": runtime_stats["total_tasks"],
+                    "running_tasks": runtime_stats["running_tasks"],
+                    "queue_size": runtime_stats["queue_size"],
+                    "worker_utilization": runtime_stats["worker_utilization"],
                     "storage_enabled": storage_stats.get("s3_enabled", False)
                 }
             }
+            
+            self._overview_cache = overview
+            self._overview_expiry = now + self._OVERVIEW_CACHE_TTL
+        
+        return overview
+    
+    async def _process_request(self, request_data: Dict[str, Any] = None) -> Dict[str, Any]:
+        """处理任务相关请求的通用方法"""
+        if not request_data:
+            # 返回任务系统状态概览
+            return await self._get_overview()
         
         action = request_data.get("action", "status")
         
@@ -1,5 +1,7 @@
 # src/infrastructure/external_services/s3_service.py
 import asyncio
+import mimetypes
+import re
 import time
 from io import BytesIO
 from pathlib import Path
@@ -29,6 +31,9 @@ class S3Service:
     5. 生命周期管理
     """
     
+    # DeleteObjects单次请求最多1000个键
+    _DELETE_BATCH_SIZE = 1000
+    
     def __init__(self):
         self.logger = logger
         self.bucket_name = settings.s3_bucket
@@ -115,7 +120,6 @@ class S3Service:
     def _sanitize_filename(self, filename: str) -> str:
         """清理文件名"""
         # 移除危险字符
-        import re
         safe_name = re.sub(r'[<>:"/\\|?*]', '_', filename)
         safe_name = re.sub(r'\s+', '_', safe_name)
         
@@ -385,6 +389,27 @@ class S3Service:
             self.logger.error(f"删除文件失败: {key} - {str(e)}")
             return False
     
+    def delete_files(self, keys: List[str]) -> List[str]:
+        """批量删除文件（每1000个键一次DeleteObjects请求），返回删除成功的键"""
+        deleted: List[str] = []
+        for start in range(0, len(keys), self._DELETE_BATCH_SIZE):
+            chunk = keys[start:start + self._DELETE_BATCH_SIZE]
+            try:
+                response = self.client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={"Objects": [{"Key": key} for key in chunk], "Quiet": False}
+                )
+                deleted.extend(item["Key"] for item in response.get("Deleted", []))
+                
+                for error in response.get("Errors", []):
+                    self.logger.error(f"删除文件失败: {error.get('Key')} - {error.get('Message')}")
+                
+            except Exception as e:
+                self.logger.error(f"批量删除文件失败: {len(chunk)}个 - {str(e)}")
+        
+        self.logger.info(f"批量删除文件完成: {len(deleted)}/{len(keys)}")
+        return deleted
+    
     def list_files(
         self,
         prefix: Optional[str] = None,
@@ -438,8 +463,6 @@ class S3Service:
     
     def _detect_content_type(self, filename: str) -> str:
         """检测文件内容类型"""
-        import mimetypes
-        
         content_type, _ = mimetypes.guess_type(filename)
         return content_type or 'application/octet-stream'
     
@@ -1,8 +1,10 @@
 # src/application/services/foo_service.py
 import asyncio
+import itertools
 import random
 import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from src.application.services.service_interface import BaseService
@@ -22,7 +24,24 @@ class FooService(BaseService):
     
     def __init__(self):
         super().__init__()
-        self._processing_count = 0
+        
+        # 处理编号：itertools.count取号是原子的，并发请求不会拿到相同编号
+        self._id_counter = itertools.count()
+        self._last_process_number = -1
+        
+        # 服务独享的随机数生成器，不与其他模块共用全局random状态
+        self._rng = random.Random()
+    
+    @property
+    def _processing_count(self) -> int:
+        """已分配的处理编号数量"""
+        return self._last_process_number + 1
+    
+    def _next_process_id(self, prefix: str) -> str:
+        """分配下一个处理编号"""
+        number = next(self._id_counter)
+        self._last_process_number = number
+        return f"{prefix}_{number:04d}"
     
     def get_service_info(self) -> Dict[str, Any]:
         return {
@@ -49,12 +68,13 @@ class FooService(BaseService):
         """
         异步数据处理 - 模拟复杂的异步业务逻辑
         """
-        process_id = f"async_{self._processing_count:04d}"
-        self._processing_count += 1
+        process_id = self._next_process_id("async")
+        # 数据大小在日志和结果中共用，只计算一次
+        data_size = len(str(data))
         
         self.logger.info(f"开始异步数据处理: {process_id}", extra={
             "process_id": process_id,
-            "data_size": len(str(data)),
+            "data_size": data_size,
             "processing_time": processing_time,
             "has_callback": bool(callback_url)
         })
@@ -64,7 +84,7 @@ class FooService(BaseService):
             await asyncio.sleep(processing_time)
             
             # 模拟偶发失败（5%概率）
-            if random.random() < 0.05:
+            if self._rng.random() < 0.05:
                 raise Exception(f"模拟处理失败: {process_id}")
             
             # 模拟数据处理结果
@@ -75,8 +95,8 @@ class FooService(BaseService):
                 "processing_time": processing_time,
                 "processed_at": datetime.utcnow().isoformat(),
                 "processing_type": "async",
-                "data_size": len(str(data)),
-                "enhancement": f"enhanced_value_{random.randint(1000, 9999)}"
+                "data_size": data_size,
+                "enhancement": f"enhanced_value_{self._rng.randint(1000, 9999)}"
             }
             
             # 如果有回调URL，模拟回调注册
@@ -104,8 +124,7 @@ class FooService(BaseService):
         """
         同步数据处理 - 模拟快速的同步业务逻辑
         """
-        process_id = f"sync_{self._processing_count:04d}"
-        self._processing_count += 1
+        process_id = self._next_process_id("sync")
         
         self.logger.info(f"开始同步数据处理: {process_id}", extra={
             "process_id": process_id,
@@ -117,7 +136,7 @@ class FooService(BaseService):
             time.sleep(processing_time)
             
             # 模拟偶发失败（2%概率，比异步低）
-            if random.random() < 0.02:
+            if self._rng.random() < 0.02:
                 raise Exception(f"模拟同步处理失败: {process_id}")
             
             processed_data = {
@@ -128,7 +147,7 @@ class FooService(BaseService):
                 "processed_at": datetime.utcnow().isoformat(),
                 "processing_type": "sync",
                 "data_size": len(str(data)),
-                "quick_result": f"quick_{random.randint(100, 999)}"
+                "quick_result": f"quick_{self._rng.randint(100, 999)}"
             }
             
             self.logger.info(f"同步数据处理完成: {process_id}")
@@ -146,8 +165,7 @@ class FooService(BaseService):
         """
         批量异步处理 - 模拟批量业务逻辑
         """
-        batch_id = f"batch_{self._processing_count:04d}"
-        self._processing_count += 1
+        batch_id = self._next_process_id("batch")
         
         self.logger.info(f"开始批量处理: {batch_id}", extra={
             "batch_id": batch_id,
@@ -155,39 +173,31 @@ class FooService(BaseService):
             "processing_time": processing_time
         })
         
-        results = []
+        # 各项目并发处理，整批耗时约为processing_time而不随项目数线性增长
+        outcomes = await asyncio.gather(
+            *(self._process_batch_item(batch_id, i, item, processing_time) for i, item in enumerate(items)),
+            return_exceptions=True
+        )
         
-        for i, item in enumerate(items):
-            try:
-                # 模拟每个项目的处理时间
-                await asyncio.sleep(processing_time / len(items))
-                
-                # 模拟部分失败（10%概率）
-                if random.random() < 0.1:
-                    raise Exception(f"批量项目 {i} 处理失败")
-                
-                result = {
-                    **item,
-                    "success": True,
-                    "batch_id": batch_id,
-                    "item_index": i,
-                    "processed_at": datetime.utcnow().isoformat(),
-                    "batch_result": f"batch_item_{i}_{random.randint(10, 99)}"
-                }
-                
-                results.append(result)
-                
-            except Exception as e:
-                self.logger.warning(f"批量项目 {i} 处理失败: {str(e)}")
+        # 各项目同时完成，整批共用一个完成时间，不再逐项读取时钟
+        processed_at = datetime.utcnow().isoformat()
+        
+        results = []
+        for i, (item, outcome) in enumerate(zip(items, outcomes)):
+            if isinstance(outcome, Exception):
+                self.logger.warning(f"批量项目 {i} 处理失败: {str(outcome)}")
                 results.append({
                     **item,
                     "success": False,
-                    "error": str(e),
+                    "error": str(outcome),
                     "batch_id": batch_id,
                     "item_index": i
                 })
+            else:
+                outcome["processed_at"] = processed_at
+                results.append(outcome)
         
-        successful_count = len([r for r in results if r.get("success")])
+        successful_count = sum(1 for r in results if r.get("success"))
         self.logger.info(f"批量处理完成: {batch_id}", extra={
             "successful": successful_count,
             "total": len(items)
@@ -195,6 +205,29 @@ class FooService(BaseService):
         
         return results
     
+    async def _process_batch_item(
+        self,
+        batch_id: str,
+        index: int,
+        item: Dict[str, Any],
+        processing_time: float
+    ) -> Dict[str, Any]:
+        """处理单个批量项目（完成时间由批量处理统一填写）"""
+        # 模拟项目的处理时间
+        await asyncio.sleep(processing_time)
+        
+        # 模拟部分失败（10%概率）
+        if self._rng.random() < 0.1:
+            raise Exception(f"批量项目 {index} 处理失败")
+        
+        return {
+            **item,
+            "success": True,
+            "batch_id": batch_id,
+            "item_index": index,
+            "batch_result": f"batch_item_{index}_{self._rng.randint(10, 99)}"
+        }
+    
     @network_retry(attempts=3)  # 网络调用重试
     async def call_external_service(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -203,17 +236,17 @@ class FooService(BaseService):
         self.logger.info(f"调用外部服务: {endpoint}")
         
         # 模拟网络延迟
-        await asyncio.sleep(random.uniform(0.1, 0.5))
+        await asyncio.sleep(self._rng.uniform(0.1, 0.5))
         
         # 模拟网络失败（20%概率）
-        if random.random() < 0.2:
+        if self._rng.random() < 0.2:
             raise ConnectionError(f"外部服务调用失败: {endpoint}")
         
         # 模拟成功响应
         response = {
             "external_service": endpoint,
             "request_data": data,
-            "response_id": f"ext_{random.randint(10000, 99999)}",
+            "response_id": f"ext_{self._rng.randint(10000, 99999)}",
             "timestamp": datetime.utcnow().isoformat(),
             "status": "success"
         }
@@ -233,7 +266,7 @@ class FooService(BaseService):
         
         cached_data = {
             "key": key,
-            "data": f"cached_value_{random.randint(1000, 9999)}",
+            "data": f"cached_value_{self._rng.randint(1000, 9999)}",
             "generated_at": datetime.utcnow().isoformat(),
             "cache_ttl": 600
         }
@@ -244,8 +277,8 @@ class FooService(BaseService):
     async def health_check(self) -> Dict[str, Any]:
         """服务健康检查"""
         try:
-            # 模拟健康检查逻辑
-            await asyncio.sleep(0.01)
+            # 模拟健康检查逻辑（只让出事件循环，不设置定时器）
+            await asyncio.sleep(0)
             
             # 检查服务状态
             is_healthy = self._processing_count >= 0  # 简单检查
@@ -269,7 +302,8 @@ class FooService(BaseService):
     def reset_counters(self) -> Dict[str, Any]:
         """重置计数器 - 用于测试"""
         old_count = self._processing_count
-        self._processing_count = 0
+        self._id_counter = itertools.count()
+        self._last_process_number = -1
         
         self.logger.info(f"计数器已重置: {old_count} -> 0")
         return {
@@ -279,12 +313,7 @@ class FooService(BaseService):
         }
 
 
-# 懒加载
-_foo_service = None
-
+@lru_cache()
 def get_foo_service() -> FooService:
-    """获取Foo服务实例"""
-    global _foo_service
-    if _foo_service is None:
-        _foo_service = FooService()
-    return _foo_service
\ No newline at end of file
+    """获取Foo服务实例（首次使用时创建，之后复用同一实例）"""
+    return FooService()
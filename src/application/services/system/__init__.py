@@ -7,7 +7,7 @@
 - TaskService: 任务管理
 """
 
-from src.application.services.system.health_service import HealthService
-from src.application.services.system.task_service import TaskService
+from src.application.services.system.health_service import HealthService, get_health_service
+from src.application.services.system.task_service import TaskService, get_task_service
 
-__all__ = ['HealthService', 'TaskService']
\ No newline at end of file
+__all__ = ['HealthService', 'TaskService', 'get_health_service', 'get_task_service']
\ No newline at end of file
@@ -1,6 +1,7 @@
 # src/application/services/system/health_service.py
 import asyncio
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Any
 
 from src.application.services.service_interface import BaseService
@@ -116,13 +117,17 @@ class HealthService(BaseService):
     async def _check_database(self) -> str:
         """检查数据库健康状态"""
         # TODO: 实现数据库连接检查
-        await asyncio.sleep(0.01)  # 模拟数据库检查
+        await asyncio.sleep(0)  # 模拟数据库检查：只让出事件循环，不设置定时器
         return "healthy"
     
     async def _check_s3(self) -> str:
         """检查S3健康状态"""
         # TODO: 实现S3连接检查
-        await asyncio.sleep(0.01)  # 模拟S3检查
+        await asyncio.sleep(0)  # 模拟S3检查：只让出事件循环，不设置定时器
         return "healthy"
 
 
+@lru_cache()
+def get_health_service() -> HealthService:
+    """获取健康检查服务实例（进程内复用同一实例）"""
+    return HealthService()
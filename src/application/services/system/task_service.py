@@ -1,10 +1,11 @@
 # src/application/services/system/task_service.py (更新版)
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 
 from src.application.services.service_interface import BaseService
-from src.infrastructure.tasks.task_manager import task_manager
-from src.infrastructure.tasks.task_registry import TaskRegistry
+from src.infrastructure.tasks.task_manager import get_task_manager
+from src.infrastructure.tasks.task_registry import get_task_registry
 
 
 class TaskService(BaseService):
@@ -12,8 +13,8 @@ class TaskService(BaseService):
     
     def __init__(self):
         super().__init__()
-        self.task_manager = task_manager
-        self.task_registry = TaskRegistry()
+        self.task_manager = get_task_manager()
+        self.task_registry = get_task_registry()
     
     def get_service_info(self) -> Dict[str, Any]:
         return {
@@ -32,17 +33,22 @@ class TaskService(BaseService):
             "summary": self.task_registry.get_registry_summary()
         }
     
-    async def search_task_types(self, query: str) -> List[Dict[str, Any]]:
+    async def search_task_types(
+        self,
+        query: str = "",
+        tags: Optional[List[str]] = None,
+        category: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """搜索任务类型"""
-        return self.task_registry.search_tasks(query)
+        return self.task_registry.search_tasks(query, tags=tags, category=category)
     
     async def get_task_result(self, task_id: str) -> Optional[Dict[str, Any]]:
         """获取任务结果（统一存储）"""
-        return await self.task_manager.storage.get_task_result(task_id)
+        return await self.task_manager.get_task_result(task_id)
     
     async def delete_task_result(self, task_id: str, delete_from_s3: bool = False) -> Dict[str, Any]:
         """删除任务结果"""
-        return await self.task_manager.storage.delete_result(task_id, delete_from_s3)
+        return await self.task_manager.delete_task_result(task_id, delete_from_s3)
     
     async def force_kill_task(self, task_id: str, reason: str = "手动终止") -> Dict[str, Any]:
         """强制终止任务"""
@@ -67,10 +73,20 @@ class TaskService(BaseService):
         """获取任务统计信息"""
         return await self.task_manager.get_statistics()
     
-    async def get_task_history(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """获取任务历史"""
-        return await self.task_manager.storage.get_task_history(limit)
+    async def get_task_history(
+        self,
+        limit: int = 100,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> List[Dict[str, Any]]:
+        """获取任务历史（过滤条件下推到存储层）"""
+        return await self.task_manager.storage.get_task_history(limit, predicate)
     
     async def scale_workers(self, target_count: int) -> Dict[str, Any]:
         """动态调整工作者数量"""
-        return await self.task_manager.worker_pool.scale_workers(target_count)
\ No newline at end of file
+        return await self.task_manager.worker_pool.scale_workers(target_count)
+
+
+@lru_cache()
+def get_task_service() -> TaskService:
+    """获取任务服务实例（进程内复用同一实例）"""
+    return TaskService()
@@ -1,5 +1,6 @@
 # src/infrastructure/cache/cache_interface.py
-import asyncio
+import fnmatch
+import json
 import time
 from abc import ABC, abstractmethod
 from collections import OrderedDict
@@ -58,8 +59,8 @@ class InMemoryCache(CacheInterface):
         self.logger = logger
         
         # 使用OrderedDict实现LRU
+        # 所有内部操作都是同步的（没有await），在单个事件循环内天然互斥，无需asyncio.Lock
         self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
-        self._lock = asyncio.Lock()
         
         # 统计信息
         self._stats = {
@@ -72,23 +73,19 @@ class InMemoryCache(CacheInterface):
     
     async def get(self, key: str) -> Optional[Any]:
         """异步获取缓存值"""
-        async with self._lock:
-            return self._get_internal(key)
+        return self._get_internal(key)
     
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """异步设置缓存值"""
-        async with self._lock:
-            return self._set_internal(key, value, ttl)
+        return self._set_internal(key, value, ttl)
     
     async def delete(self, key: str) -> bool:
         """异步删除缓存值"""
-        async with self._lock:
-            return self._delete_internal(key)
+        return self._delete_internal(key)
     
     async def clear_pattern(self, pattern: str) -> int:
         """异步清理匹配模式的缓存"""
-        async with self._lock:
-            return self._clear_pattern_internal(pattern)
+        return self._clear_pattern_internal(pattern)
     
     def get_sync(self, key: str) -> Optional[Any]:
         """同步获取缓存值"""
@@ -159,8 +156,6 @@ class InMemoryCache(CacheInterface):
     
     def _clear_pattern_internal(self, pattern: str) -> int:
         """内部模式清理方法"""
-        import fnmatch
-        
         keys_to_delete = [
             key for key in self._cache.keys() 
             if fnmatch.fnmatch(key, pattern)
@@ -242,7 +237,6 @@ class RedisCache(CacheInterface):
                 return None
             
             # 反序列化（这里简化，实际可能需要更复杂的序列化）
-            import json
             return json.loads(value)
             
         except Exception as e:
@@ -255,7 +249,6 @@ class RedisCache(CacheInterface):
             redis_client = await self._get_redis()
             
             # 序列化（这里简化，实际可能需要更复杂的序列化）
-            import json
             serialized_value = json.dumps(value, default=str)
             
             await redis_client.set(key, serialized_value, ex=ttl or self.default_ttl)
@@ -7,6 +7,10 @@ import pickle
 import time
 from typing import Any, Callable, Optional, Union
 
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+
 from src.infrastructure.logging.logger import get_logger
 from src.infrastructure.cache.cache_interface import CacheInterface, InMemoryCache
 
@@ -205,6 +209,64 @@ def cache_invalidate(
     return decorator
 
 
+def response_cache(
+    ttl: Optional[int] = 600,
+    key_prefix: str = "response_cache:",
+    cache_instance: Optional[CacheInterface] = None,
+    key_func: Optional[Callable] = None
+):
+    """
+    路由层响应缓存装饰器
+    
+    缓存序列化后的JSON文本，命中时直接返回，不再进入Handler/Service，
+    也不再做模型构建和JSON编码。只缓存成功的响应。
+    以字符串而非字节存入缓存，RedisCache等会再做一次JSON序列化的后端也能原样取回。
+    
+    Args:
+        ttl: 缓存过期时间（秒）
+        key_prefix: 缓存键前缀
+        cache_instance: 缓存实例（如RedisCache），None则使用内存缓存
+        key_func: 根据路由参数生成缓存键的函数，None则使用全部参数
+    """
+    def decorator(func: Callable) -> Callable:
+        cache_backend = cache_instance or InMemoryCache()
+        func_prefix = f"{key_prefix}{func.__name__}:"
+        
+        def _generate_cache_key(**kwargs) -> str:
+            """生成缓存键"""
+            if key_func:
+                return f"{func_prefix}{key_func(**kwargs)}"
+            return f"{func_prefix}{json.dumps(kwargs, sort_keys=True, default=str)}"
+        
+        @functools.wraps(func)
+        async def wrapper(**kwargs) -> Any:
+            cache_key = _generate_cache_key(**kwargs)
+            
+            cached_body = await cache_backend.get(cache_key)
+            if cached_body is not None:
+                logger.debug(f"响应缓存命中: {cache_key}")
+                return Response(content=cached_body.encode(), media_type="application/json")
+            
+            result = await func(**kwargs)
+            
+            # 已是Response对象或失败的响应不缓存
+            if isinstance(result, Response):
+                return result
+            content = result.dict() if isinstance(result, BaseModel) else result
+            if isinstance(content, dict) and content.get("success") is False:
+                return result
+            
+            body = orjson.dumps(content)
+            await cache_backend.set(cache_key, body.decode(), ttl)
+            logger.debug(f"响应缓存已保存: {cache_key}")
+            
+            return Response(content=body, media_type="application/json")
+        
+        return wrapper
+    
+    return decorator
+
+
 def memoize(maxsize: int = 128):
     """
     记忆化装饰器（基于LRU缓存）
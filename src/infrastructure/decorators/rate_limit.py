@@ -5,10 +5,12 @@ import time
 from collections import defaultdict, deque
 from typing import Any, Callable, Dict, Optional, Union
 
+from src.application.config.settings import get_settings
 from src.infrastructure.logging.logger import get_logger
 from src.schemas.enums.base_enums import ErrorCodeEnum
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 
 class RateLimitExceeded(Exception):
@@ -170,7 +172,8 @@ def rate_limit(
     per: str = "function",  # "function", "user", "ip", "custom"
     key_func: Optional[Callable] = None,
     error_message: str = "Rate limit exceeded",
-    algorithm: str = "sliding_window"  # "sliding_window" or "token_bucket"
+    algorithm: str = "sliding_window",  # "sliding_window" or "token_bucket"
+    burst_size: Optional[int] = None
 ):
     """
     限流装饰器
@@ -182,58 +185,74 @@ def rate_limit(
         key_func: 自定义键函数
         error_message: 错误信息
         algorithm: 限流算法
+        burst_size: 令牌桶容量（允许的突发请求数），默认等于max_requests
     """
+    # 令牌桶参数在装饰时计算一次
+    capacity = burst_size or max_requests
+    refill_rate = max_requests / window_seconds
+    
     def decorator(func: Callable) -> Callable:
+        func_name = func.__name__
         
-        def _get_rate_limit_key(*args, **kwargs) -> str:
-            """获取限流键"""
-            if key_func:
+        # 限流键的生成方式在装饰时确定，请求时不再判断限流维度
+        if key_func:
+            def _get_rate_limit_key(*args, **kwargs) -> str:
+                """获取限流键（自定义）"""
                 return str(key_func(*args, **kwargs))
-            
-            if per == "function":
-                return f"{func.__module__}.{func.__name__}"
-            elif per == "user":
+        
+        elif per == "user":
+            def _get_rate_limit_key(*args, **kwargs) -> str:
+                """获取限流键（用户维度）"""
                 # 从kwargs或request中获取用户ID
                 user_id = kwargs.get("user_id") or kwargs.get("current_user_id", "anonymous")
-                return f"user:{user_id}:{func.__name__}"
-            elif per == "ip":
+                return f"user:{user_id}:{func_name}"
+        
+        elif per == "ip":
+            def _get_rate_limit_key(*args, **kwargs) -> str:
+                """获取限流键（IP维度）"""
                 # 从kwargs或request中获取IP
                 client_ip = kwargs.get("client_ip") or kwargs.get("request", {}).get("client", {}).get("host", "unknown")
-                return f"ip:{client_ip}:{func.__name__}"
-            else:
-                return f"{func.__module__}.{func.__name__}"
+                return f"ip:{client_ip}:{func_name}"
+        
+        else:
+            function_key = f"{func.__module__}.{func_name}"
+            
+            def _get_rate_limit_key(*args, **kwargs) -> str:
+                """获取限流键（函数维度，固定键）"""
+                return function_key
+        
+        # 限流算法同样在装饰时确定；检查过程中没有await，单事件循环内无需加锁
+        if algorithm == "token_bucket":
+            def _check_rate_limit(rate_limit_key: str) -> None:
+                """令牌桶算法检查"""
+                bucket = global_rate_limiter.get_token_bucket(rate_limit_key, capacity, refill_rate)
+                
+                if not bucket.consume_sync():
+                    logger.warning(f"令牌桶限流触发: {func_name}", extra={
+                        "key": rate_limit_key,
+                        "available_tokens": bucket.get_available_tokens()
+                    })
+                    raise RateLimitExceeded(error_message)
+        
+        else:
+            def _check_rate_limit(rate_limit_key: str) -> None:
+                """滑动窗口算法检查"""
+                window = global_rate_limiter.get_sliding_window(rate_limit_key, window_seconds, max_requests)
+                
+                if not window.is_allowed_sync():
+                    retry_after = window.get_retry_after()
+                    logger.warning(f"滑动窗口限流触发: {func_name}", extra={
+                        "key": rate_limit_key,
+                        "current_count": window.get_current_count(),
+                        "max_requests": max_requests,
+                        "retry_after": retry_after
+                    })
+                    raise RateLimitExceeded(error_message, retry_after)
         
         if asyncio.iscoroutinefunction(func):
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs) -> Any:
-                rate_limit_key = _get_rate_limit_key(*args, **kwargs)
-                
-                if algorithm == "token_bucket":
-                    # 令牌桶算法
-                    refill_rate = max_requests / window_seconds
-                    bucket = global_rate_limiter.get_token_bucket(rate_limit_key, max_requests, refill_rate)
-                    
-                    if not await bucket.consume():
-                        logger.warning(f"令牌桶限流触发: {func.__name__}", extra={
-                            "key": rate_limit_key,
-                            "available_tokens": bucket.get_available_tokens()
-                        })
-                        raise RateLimitExceeded(error_message)
-                
-                else:
-                    # 滑动窗口算法
-                    window = global_rate_limiter.get_sliding_window(rate_limit_key, window_seconds, max_requests)
-                    
-                    if not await window.is_allowed():
-                        retry_after = window.get_retry_after()
-                        logger.warning(f"滑动窗口限流触发: {func.__name__}", extra={
-                            "key": rate_limit_key,
-                            "current_count": window.get_current_count(),
-                            "max_requests": max_requests,
-                            "retry_after": retry_after
-                        })
-                        raise RateLimitExceeded(error_message, retry_after)
-                
+                _check_rate_limit(_get_rate_limit_key(*args, **kwargs))
                 return await func(*args, **kwargs)
             
             return async_wrapper
@@ -241,34 +260,7 @@ def rate_limit(
         else:
             @functools.wraps(func)
             def sync_wrapper(*args, **kwargs) -> Any:
-                rate_limit_key = _get_rate_limit_key(*args, **kwargs)
-                
-                if algorithm == "token_bucket":
-                    # 令牌桶算法
-                    refill_rate = max_requests / window_seconds
-                    bucket = global_rate_limiter.get_token_bucket(rate_limit_key, max_requests, refill_rate)
-                    
-                    if not bucket.consume_sync():
-                        logger.warning(f"令牌桶限流触发: {func.__name__}", extra={
-                            "key": rate_limit_key,
-                            "available_tokens": bucket.get_available_tokens()
-                        })
-                        raise RateLimitExceeded(error_message)
-                
-                else:
-                    # 滑动窗口算法
-                    window = global_rate_limiter.get_sliding_window(rate_limit_key, window_seconds, max_requests)
-                    
-                    if not window.is_allowed_sync():
-                        retry_after = window.get_retry_after()
-                        logger.warning(f"滑动窗口限流触发: {func.__name__}", extra={
-                            "key": rate_limit_key,
-                            "current_count": window.get_current_count(),
-                            "max_requests": max_requests,
-                            "retry_after": retry_after
-                        })
-                        raise RateLimitExceeded(error_message, retry_after)
-                
+                _check_rate_limit(_get_rate_limit_key(*args, **kwargs))
                 return func(*args, **kwargs)
             
             return sync_wrapper
@@ -359,8 +351,23 @@ def throttle(calls_per_second: float):
 
 
 # 便捷的限流装饰器
-def api_rate_limit(requests_per_minute: int = 60):
-    """API限流"""
+def api_rate_limit(requests_per_minute: int = 60, burst_size: Optional[int] = None):
+    """API限流（令牌桶，低于平均速率时积累令牌以允许突发）"""
+    if burst_size is None:
+        # 突发容量不超过每分钟请求数，避免低频接口的限制被放宽
+        burst_size = min(settings.rate_limit_burst_size, requests_per_minute)
+    
+    return rate_limit(
+        max_requests=requests_per_minute,
+        window_seconds=60,
+        per="function",
+        algorithm="token_bucket",
+        burst_size=burst_size
+    )
+
+
+def strict_rate_limit(requests_per_minute: int = 10):
+    """严格限流（滑动窗口，任意连续60秒内最多requests_per_minute次，不允许突发）"""
     return rate_limit(
         max_requests=requests_per_minute,
         window_seconds=60,
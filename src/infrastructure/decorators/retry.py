@@ -9,6 +9,22 @@ from src.infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 不可重试的异常（参数、类型、权限、资源不存在等客户端类错误），重试也不会成功
+NON_RETRYABLE_EXCEPTIONS: Tuple[Type[Exception], ...] = (
+    ValueError,
+    TypeError,
+    PermissionError,
+    FileNotFoundError
+)
+
+
+def _is_non_retryable(error: Exception, give_up_on: Tuple[Type[Exception], ...]) -> bool:
+    """判断异常是否应直接放弃重试：命中give_up_on，或是4xx的HTTP异常（如HTTPException）"""
+    if give_up_on and isinstance(error, give_up_on):
+        return True
+    status_code = getattr(error, "status_code", None)
+    return isinstance(status_code, int) and 400 <= status_code < 500
+
 
 class RetryExhausted(Exception):
     """重试次数耗尽异常"""
@@ -26,7 +42,8 @@ def retry(
     jitter: bool = False,
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
     on_retry: Optional[Callable[[int, Exception], None]] = None,
-    max_delay: Optional[float] = None
+    max_delay: Optional[float] = None,
+    give_up_on: Tuple[Type[Exception], ...] = ()
 ):
     """
     重试装饰器
@@ -39,15 +56,16 @@ def retry(
         exceptions: 需要重试的异常类型
         on_retry: 重试时的回调函数
         max_delay: 最大延迟时间
+        give_up_on: 不重试、直接抛出的异常类型；带4xx状态码的异常（如HTTPException）同样不重试
     """
     def decorator(func: Callable) -> Callable:
         if asyncio.iscoroutinefunction(func):
             return _async_retry_wrapper(
-                func, max_attempts, delay, backoff, jitter, exceptions, on_retry, max_delay
+                func, max_attempts, delay, backoff, jitter, exceptions, on_retry, max_delay, give_up_on
             )
         else:
             return _sync_retry_wrapper(
-                func, max_attempts, delay, backoff, jitter, exceptions, on_retry, max_delay
+                func, max_attempts, delay, backoff, jitter, exceptions, on_retry, max_delay, give_up_on
             )
     
     return decorator
@@ -61,7 +79,8 @@ def _async_retry_wrapper(
     jitter: bool,
     exceptions: Tuple[Type[Exception], ...],
     on_retry: Optional[Callable[[int, Exception], None]],
-    max_delay: Optional[float]
+    max_delay: Optional[float],
+    give_up_on: Tuple[Type[Exception], ...]
 ) -> Callable:
     """异步重试包装器"""
     
@@ -91,6 +110,10 @@ def _async_retry_wrapper(
                 return result
                 
             except exceptions as e:
+                # 不可重试的异常直接抛出，不占用重试次数和等待时间
+                if _is_non_retryable(e, give_up_on):
+                    raise
+                
                 last_exception = e
                 
                 # 如果是最后一次尝试，不再重试
@@ -137,8 +160,9 @@ def _async_retry_wrapper(
                     except Exception as callback_error:
                         logger.error(f"重试回调函数执行失败: {callback_error}")
                 
-                # 等待
-                await asyncio.sleep(actual_delay)
+                # 等待（零延迟时立即重试）
+                if actual_delay > 0:
+                    await asyncio.sleep(actual_delay)
                 
                 # 更新下次延迟时间
                 current_delay *= backoff
@@ -162,7 +186,8 @@ def _sync_retry_wrapper(
     jitter: bool,
     exceptions: Tuple[Type[Exception], ...],
     on_retry: Optional[Callable[[int, Exception], None]],
-    max_delay: Optional[float]
+    max_delay: Optional[float],
+    give_up_on: Tuple[Type[Exception], ...]
 ) -> Callable:
     """同步重试包装器"""
     
@@ -189,6 +214,10 @@ def _sync_retry_wrapper(
                 return result
                 
             except exceptions as e:
+                # 不可重试的异常直接抛出，不占用重试次数和等待时间
+                if _is_non_retryable(e, give_up_on):
+                    raise
+                
                 last_exception = e
                 
                 # 如果是最后一次尝试，不再重试
@@ -232,8 +261,9 @@ def _sync_retry_wrapper(
                     except Exception as callback_error:
                         logger.error(f"重试回调函数执行失败: {callback_error}")
                 
-                # 等待
-                time.sleep(actual_delay)
+                # 等待（零延迟时立即重试）
+                if actual_delay > 0:
+                    time.sleep(actual_delay)
                 
                 # 更新下次延迟时间
                 current_delay *= backoff
@@ -333,9 +363,25 @@ def circuit_breaker(
 
 
 # 便捷的重试装饰器
-def simple_retry(attempts: int = 3, delay: float = 1.0):
-    """简单重试装饰器"""
-    return retry(max_attempts=attempts, delay=delay)
+def simple_retry(
+    attempts: int = 3,
+    delay: float = 1.0,
+    backoff: float = 1.0,
+    jitter: bool = False,
+    max_delay: Optional[float] = None,
+    give_up_on: Tuple[Type[Exception], ...] = (),
+    retry_on: Tuple[Type[Exception], ...] = (Exception,)
+):
+    """简单重试装饰器（give_up_on指定不重试的异常，如NON_RETRYABLE_EXCEPTIONS；retry_on限定需要重试的异常类型）"""
+    return retry(
+        max_attempts=attempts,
+        delay=delay,
+        backoff=backoff,
+        jitter=jitter,
+        exceptions=retry_on,
+        max_delay=max_delay,
+        give_up_on=give_up_on
+    )
 
 
 def network_retry(attempts: int = 3):
@@ -1,4 +1,5 @@
 # src/infrastructure/tasks/base_task.py (更新版)
+import inspect
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -19,14 +20,12 @@ class TaskPriority(Enum):
     
     @classmethod
     def from_int(cls, value: int) -> "TaskPriority":
-        """从整数转换为优先级"""
-        mapping = {
-            3: cls.URGENT,
-            2: cls.HIGH,
-            1: cls.NORMAL,
-            0: cls.LOW
-        }
-        return mapping.get(value, cls.NORMAL)
+        """从整数转换为优先级（未知值按NORMAL处理）"""
+        return _PRIORITY_BY_VALUE.get(value, cls.NORMAL)
+
+
+# 整数 -> 优先级，模块加载时构建一次，避免每次转换重建映射
+_PRIORITY_BY_VALUE = {priority.value: priority for priority in TaskPriority}
 
 
 class TaskStatus(Enum):
@@ -199,6 +198,7 @@ class SimpleTask(BaseTask):
             **kwargs
         )
         self.task_func = task_func
+        self._is_async = inspect.iscoroutinefunction(task_func)
     
     async def execute(self, **kwargs) -> Any:
         """执行函数任务"""
@@ -212,11 +212,7 @@ class SimpleTask(BaseTask):
                 "params": all_params
             })
             
-            # 检查函数是否是异步的
-            import asyncio
-            import inspect
-            
-            if inspect.iscoroutinefunction(self.task_func):
+            if self._is_async:
                 result = await self.task_func(**all_params)
             else:
                 result = self.task_func(**all_params)
@@ -265,24 +261,32 @@ class ServiceTask(BaseTask):
         )
         self.service_instance = service_instance
         self.method_name = method_name
+        
+        # 服务方法及其类型在首次执行时解析并缓存
+        self._method: Optional[Any] = None
+        self._is_async = False
+    
+    def _resolve_method(self) -> Any:
+        """解析服务方法（仅首次）"""
+        if self._method is None:
+            if not hasattr(self.service_instance, self.method_name):
+                raise AttributeError(f"服务 {self.service_instance.__class__.__name__} 没有方法 {self.method_name}")
+            
+            self._method = getattr(self.service_instance, self.method_name)
+            self._is_async = inspect.iscoroutinefunction(self._method)
+        return self._method
     
     async def execute(self, **kwargs) -> Any:
         """执行服务方法"""
         try:
             # 获取服务方法
-            if not hasattr(self.service_instance, self.method_name):
-                raise AttributeError(f"服务 {self.service_instance.__class__.__name__} 没有方法 {self.method_name}")
-            
-            method = getattr(self.service_instance, self.method_name)
+            method = self._resolve_method()
             
             # 合并参数
             all_params = {**self.params, **kwargs}
             
             # 执行方法
-            import asyncio
-            import inspect
-            
-            if inspect.iscoroutinefunction(method):
+            if self._is_async:
                 result = await method(**all_params)
             else:
                 result = method(**all_params)
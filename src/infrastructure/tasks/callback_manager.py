@@ -1,14 +1,17 @@
 # src/infrastructure/tasks/callback_manager.py
 import asyncio
 import json
+import uuid
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
+from src.application.config.settings import get_settings
 from src.infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 
 class CallbackType(str, Enum):
@@ -70,12 +73,29 @@ class CallbackManager:
     5. 异步服务回调支持
     """
     
+    # 异步回调队列容量，队列满时丢弃新回调，避免回调风暴拖垮事件循环
+    _QUEUE_MAX_SIZE = 10_000
+    
+    # Webhook HTTP连接池配置：并发回调复用长连接
+    _HTTP_MAX_CONNECTIONS = 100
+    _HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
+    _HTTP_TIMEOUT = 30
+    
+    # 回调失败重试的指数退避：第n次重试前等待 _RETRY_BASE_DELAY * 2^(n-1) 秒，最长_RETRY_MAX_DELAY秒
+    _RETRY_BASE_DELAY = 1.0
+    _RETRY_MAX_DELAY = 60.0
+    
     def __init__(self):
         self.logger = logger
         
         # 回调存储
         self.callbacks: Dict[str, List[Callback]] = {}  # task_id -> callbacks
-        self.pending_callbacks: List[Callback] = []
+        
+        # 异步回调与重试回调队列：(callback, task)，由常驻工作协程消费
+        self._callback_queue: asyncio.Queue = asyncio.Queue(maxsize=self._QUEUE_MAX_SIZE)
+        
+        # 等待退避结束后重新入队的回调：callback_id -> 定时器
+        self._retry_timers: Dict[str, asyncio.TimerHandle] = {}
         
         # HTTP客户端（用于webhook）
         self._http_client = None
@@ -85,7 +105,7 @@ class CallbackManager:
         
         # 管理状态
         self._running = False
-        self._processor_task: Optional[asyncio.Task] = None
+        self._worker_tasks: List[asyncio.Task] = []
         
         # 统计信息
         self.stats = {
@@ -93,7 +113,8 @@ class CallbackManager:
             "callbacks_executed": 0,
             "callbacks_failed": 0,
             "webhooks_sent": 0,
-            "retries_attempted": 0
+            "retries_attempted": 0,
+            "callbacks_dropped": 0
         }
     
     async def start(self) -> None:
@@ -106,8 +127,11 @@ class CallbackManager:
         # 启动HTTP客户端
         await self._init_http_client()
         
-        # 启动回调处理器
-        self._processor_task = asyncio.create_task(self._callback_processor())
+        # 启动回调工作协程
+        self._worker_tasks = [
+            asyncio.create_task(self._callback_worker())
+            for _ in range(settings.task_max_workers)
+        ]
         
         self.logger.info("回调管理器已启动")
     
@@ -115,13 +139,16 @@ class CallbackManager:
         """关闭回调管理器"""
         self._running = False
         
-        # 停止处理器
-        if self._processor_task:
-            self._processor_task.cancel()
-            try:
-                await self._processor_task
-            except asyncio.CancelledError:
-                pass
+        # 停止工作协程
+        for worker_task in self._worker_tasks:
+            worker_task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        
+        # 取消尚未到期的重试
+        for timer in self._retry_timers.values():
+            timer.cancel()
+        self._retry_timers.clear()
         
         # 关闭HTTP客户端
         if self._http_client:
@@ -139,8 +166,6 @@ class CallbackManager:
         max_retries: int = 3
     ) -> str:
         """注册回调"""
-        import uuid
-        
         callback_id = str(uuid.uuid4())
         callback = Callback(
             callback_id=callback_id,
@@ -183,24 +208,50 @@ class CallbackManager:
             await self._execute_callback(callback, task)
     
     async def _execute_callback(self, callback: Callback, task) -> None:
-        """执行单个回调"""
+        """执行单个回调（异步回调只入队，由工作协程执行）"""
+        if callback.trigger == CallbackTrigger.ASYNC:
+            self._enqueue_callback(callback, task)
+            return
+        
+        await self._run_callback(callback, task)
+    
+    async def _run_callback(self, callback: Callback, task) -> None:
+        """实际执行回调"""
         callback.last_attempted_at = datetime.utcnow()
         
         try:
-            if callback.trigger == CallbackTrigger.IMMEDIATE:
+            trigger = callback.trigger
+            if trigger == CallbackTrigger.IMMEDIATE:
                 await self._execute_immediate_callback(callback, task)
-            elif callback.trigger == CallbackTrigger.ASYNC:
-                self.pending_callbacks.append(callback)
-            elif callback.trigger == CallbackTrigger.WEBHOOK:
+            elif trigger == CallbackTrigger.ASYNC:
+                # 异步回调的目标可以是函数或URL
+                if callable(callback.target):
+                    await self._execute_immediate_callback(callback, task)
+                else:
+                    await self._execute_webhook_callback(callback, task)
+            elif trigger == CallbackTrigger.WEBHOOK:
                 await self._execute_webhook_callback(callback, task)
-            elif callback.trigger == CallbackTrigger.MESSAGE:
+            elif trigger == CallbackTrigger.MESSAGE:
                 await self._execute_message_callback(callback, task)
             
             self.stats["callbacks_executed"] += 1
             
         except Exception as e:
             self.logger.error(f"回调执行失败: {callback.callback_id} - {str(e)}")
-            await self._handle_callback_failure(callback, e)
+            await self._handle_callback_failure(callback, task, e)
+    
+    def _enqueue_callback(self, callback: Callback, task) -> bool:
+        """回调入队，队列已满时丢弃"""
+        try:
+            self._callback_queue.put_nowait((callback, task))
+            return True
+        except asyncio.QueueFull:
+            self.stats["callbacks_dropped"] += 1
+            self.logger.error(f"回调队列已满，丢弃回调: {callback.callback_id}", extra={
+                "task_id": callback.task_id,
+                "queue_size": self._callback_queue.qsize()
+            })
+            return False
     
     async def _execute_immediate_callback(self, callback: Callback, task) -> None:
         """执行立即回调"""
@@ -225,11 +276,7 @@ class CallbackManager:
             "timestamp": datetime.utcnow().isoformat()
         }
         
-        response = await self._http_client.post(
-            callback.target,
-            json=payload,
-            timeout=30
-        )
+        response = await self._http_client.post(callback.target, json=payload)
         
         response.raise_for_status()
         self.stats["webhooks_sent"] += 1
@@ -241,39 +288,56 @@ class CallbackManager:
         # TODO: 实现消息队列回调
         self.logger.warning("消息回调暂未实现")
     
-    async def _handle_callback_failure(self, callback: Callback, error: Exception) -> None:
+    async def _handle_callback_failure(self, callback: Callback, task, error: Exception) -> None:
         """处理回调失败"""
         callback.retry_count += 1
         self.stats["callbacks_failed"] += 1
         
         if callback.retry_count < callback.max_retries:
-            # 重试
-            self.pending_callbacks.append(callback)
+            # 退避一段时间后重新入队，避免对失败的目标连续重试
+            delay = self._get_retry_delay(callback.retry_count)
+            self._retry_timers[callback.callback_id] = asyncio.get_running_loop().call_later(
+                delay, self._enqueue_retry, callback, task
+            )
             self.stats["retries_attempted"] += 1
-            self.logger.warning(f"回调重试: {callback.callback_id} ({callback.retry_count}/{callback.max_retries})")
+            self.logger.warning(
+                f"回调重试: {callback.callback_id} ({callback.retry_count}/{callback.max_retries})，{delay:.1f}s后执行"
+            )
         else:
             self.logger.error(f"回调最终失败: {callback.callback_id}")
     
-    async def _callback_processor(self) -> None:
-        """回调处理器主循环"""
-        while self._running:
+    def _get_retry_delay(self, retry_count: int) -> float:
+        """计算第retry_count次重试前的等待时间"""
+        return min(self._RETRY_BASE_DELAY * (2 ** (retry_count - 1)), self._RETRY_MAX_DELAY)
+    
+    def _enqueue_retry(self, callback: Callback, task) -> None:
+        """退避结束，将回调重新放入队列"""
+        self._retry_timers.pop(callback.callback_id, None)
+        self._enqueue_callback(callback, task)
+    
+    async def _callback_worker(self) -> None:
+        """回调工作协程：持续从队列取出回调执行"""
+        queue = self._callback_queue
+        while True:
+            callback, task = await queue.get()
             try:
-                if self.pending_callbacks:
-                    callback = self.pending_callbacks.pop(0)
-                    # TODO: 获取对应的task信息
-                    # await self._execute_callback(callback, task)
-                
-                await asyncio.sleep(1)
-                
+                await self._run_callback(callback, task)
             except Exception as e:
                 self.logger.error(f"回调处理器错误: {str(e)}")
-                await asyncio.sleep(5)
+            finally:
+                queue.task_done()
     
     async def _init_http_client(self) -> None:
         """初始化HTTP客户端"""
         try:
             import httpx
-            self._http_client = httpx.AsyncClient()
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self._HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=self._HTTP_MAX_KEEPALIVE_CONNECTIONS
+                ),
+                timeout=self._HTTP_TIMEOUT
+            )
         except ImportError:
             self.logger.warning("httpx未安装，Webhook回调不可用")
     
@@ -290,7 +354,8 @@ class CallbackManager:
         """获取统计信息"""
         return {
             "total_callbacks": sum(len(cbs) for cbs in self.callbacks.values()),
-            "pending_callbacks": len(self.pending_callbacks),
+            "pending_callbacks": self._callback_queue.qsize(),
+            "scheduled_retries": len(self._retry_timers),
             "statistics": self.stats.copy()
         }
     
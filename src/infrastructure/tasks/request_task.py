@@ -39,6 +39,7 @@ class RequestTask(BaseTask):
         )
         
         self.handler_func = handler_func
+        self._is_async = inspect.iscoroutinefunction(handler_func)
         self.args = args
         self.kwargs = kwargs
         self.request_id = request_id
@@ -74,7 +75,7 @@ class RequestTask(BaseTask):
             merged_kwargs = {**self.kwargs, **execution_metadata}
             
             # 检查函数类型并执行
-            if inspect.iscoroutinefunction(self.handler_func):
+            if self._is_async:
                 self.logger.debug(f"执行异步Handler函数: {self.handler_func.__name__}")
                 result = await self.handler_func(*self.args, **merged_kwargs)
             else:
@@ -3,7 +3,7 @@ import time
 import fnmatch
 import statistics
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from collections import OrderedDict
 
 from src.infrastructure.logging.logger import get_logger
@@ -96,6 +96,13 @@ class MemoryStore:
             return True
         return False
     
+    async def delete_many(self, keys: List[str]) -> List[bool]:
+        """批量删除缓存值，按输入顺序返回各键是否删除成功"""
+        cache = self._cache
+        deleted = [cache.pop(key, None) is not None for key in keys]
+        self._stats["deletes"] += sum(deleted)
+        return deleted
+    
     async def search_pattern(self, pattern: str, limit: int = 100) -> List[Dict[str, Any]]:
         """按模式搜索"""
         results = []
@@ -115,8 +122,13 @@ class MemoryStore:
         
         return results
     
-    async def get_recent_items(self, pattern: str, limit: int = 100) -> List[Dict[str, Any]]:
-        """获取最近的项目"""
+    async def get_recent_items(
+        self,
+        pattern: str,
+        limit: int = 100,
+        predicate: Optional[Callable[[Any], bool]] = None
+    ) -> List[Dict[str, Any]]:
+        """获取最近的项目（predicate在扫描时过滤，limit只计入匹配的项目）"""
         items = []
         current_time = time.time()
         
@@ -137,7 +149,9 @@ class MemoryStore:
             
             # 模式匹配
             if fnmatch.fnmatch(key, pattern):
-                items.append(cache_item["value"])
+                value = cache_item["value"]
+                if predicate is None or predicate(value):
+                    items.append(value)
         
         return items
     
@@ -113,6 +113,24 @@ class S3Store:
             self.logger.error(f"从S3删除失败: {task_id} - {str(e)}")
             return False
     
+    async def delete_results(self, task_ids: List[str]) -> set:
+        """从S3批量删除任务结果，返回删除成功的任务ID集合"""
+        try:
+            prefix_len = len(self.prefix)
+            deleted_keys = self.s3_service.delete_files([f"{self.prefix}{task_id}.json" for task_id in task_ids])
+            
+            # 键格式为 {prefix}{task_id}.json，还原为任务ID
+            deleted = {key[prefix_len:-5] for key in deleted_keys}
+            self.stats["deletes"] += len(deleted)
+            self.logger.debug(f"从S3批量删除任务结果: {len(deleted)}/{len(task_ids)}")
+            
+            return deleted
+            
+        except Exception as e:
+            self.stats["errors"] += 1
+            self.logger.error(f"从S3批量删除失败: {str(e)}")
+            return set()
+    
     async def get_recent_results(self, limit: int = 100) -> List[Dict[str, Any]]:
         """获取最近的结果"""
         try:
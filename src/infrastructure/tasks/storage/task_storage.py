@@ -2,7 +2,7 @@
 import json
 import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from collections import OrderedDict
 
 from src.infrastructure.logging.logger import get_logger
@@ -99,6 +99,23 @@ class TaskStorage:
             self.logger.error(f"存储任务结果失败: {task_id} - {str(e)}")
             raise
     
+    async def store_results(self, items: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        批量存储任务结果，返回成功条数
+        
+        逐条调用store_result，并非后端层面的批量写：内存存储本身是本地操作，
+        S3按任务一个对象存储也没有批量写接口。批量的收益在于写入协程每轮只唤醒一次。
+        """
+        stored = 0
+        for task_id, result_data in items:
+            try:
+                await self.store_result(task_id, result_data)
+                stored += 1
+            except Exception:
+                # 单条失败不影响同批次其他结果，错误已在store_result中记录
+                continue
+        return stored
+    
     async def get_task_result(self, task_id: str) -> Optional[Dict[str, Any]]:
         """获取任务结果"""
         # 1. 先从内存获取
@@ -147,6 +164,36 @@ class TaskStorage:
         
         return deletion_info
     
+    async def delete_results_bulk(self, task_ids: List[str], delete_from_s3: bool = False) -> List[Dict[str, Any]]:
+        """批量删除任务结果：内存一次遍历，S3按批次DeleteObjects，结果与输入顺序一致"""
+        memory_deleted = await self.memory_store.delete_many([f"result:{task_id}" for task_id in task_ids])
+        
+        s3_deleted = set()
+        s3_error = None
+        if delete_from_s3 and self.s3_store and task_ids:
+            try:
+                s3_deleted = await self.s3_store.delete_results(task_ids)
+            except Exception as e:
+                s3_error = f"S3删除异常: {str(e)}"
+        
+        results = []
+        for task_id, in_memory in zip(task_ids, memory_deleted):
+            deletion_info = {
+                "task_id": task_id,
+                "deleted_from": ["memory"] if in_memory else [],
+                "errors": []
+            }
+            
+            if delete_from_s3 and self.s3_store:
+                if task_id in s3_deleted:
+                    deletion_info["deleted_from"].append("s3")
+                else:
+                    deletion_info["errors"].append(s3_error or "S3删除失败")
+            
+            results.append(deletion_info)
+        
+        return results
+    
     async def search_results(
         self, 
         task_name: Optional[str] = None,
@@ -165,15 +212,27 @@ class TaskStorage:
         
         return filtered_results[:limit]
     
-    async def get_task_history(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """获取任务历史"""
+    async def get_task_history(
+        self,
+        limit: int = 100,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        获取任务历史
+        
+        Args:
+            limit: 返回的最大数量（只计入满足predicate的任务）
+            predicate: 过滤条件，在存储层扫描时直接应用
+        """
         # 从内存获取最近的任务
-        memory_results = await self.memory_store.get_recent_items("result:*", limit)
+        memory_results = await self.memory_store.get_recent_items("result:*", limit, predicate)
         
         # 如果内存中数据不足且有S3，尝试从S3补充
         if len(memory_results) < limit and self.s3_store:
             try:
                 s3_results = await self.s3_store.get_recent_results(limit - len(memory_results))
+                if predicate is not None:
+                    s3_results = [result for result in s3_results if predicate(result)]
                 memory_results.extend(s3_results)
             except Exception as e:
                 self.logger.warning(f"从S3获取历史数据失败: {str(e)}")
@@ -230,7 +289,7 @@ class TaskStorage:
         return await self.memory_store.calculate_median_metric("duration")
     
     def get_storage_statistics(self) -> Dict[str, Any]:
-        """获取存储统计"""
+        """获取存储统计（只读取内存中的计数，不访问S3）"""
         memory_stats = self.memory_store.get_statistics()
         
         storage_stats = {
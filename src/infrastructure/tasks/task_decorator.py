@@ -8,8 +8,9 @@ from functools import wraps
 from typing import Callable, Optional, Any
 from fastapi import HTTPException
 
+from src.infrastructure.decorators.retry import NON_RETRYABLE_EXCEPTIONS
 from src.infrastructure.tasks.request_task import RequestTask
-from src.infrastructure.tasks.task_manager import task_manager
+from src.infrastructure.tasks.task_manager import get_task_manager
 from src.infrastructure.tasks.base_task import TaskPriority
 from src.schemas.dtos.response.base_response import BaseResponse
 from src.infrastructure.logging.logger import get_logger
@@ -92,6 +93,10 @@ async def _execute_directly(func: Callable, args: tuple, kwargs: dict, task_name
         # 否则包装成成功响应
         return BaseResponse.success_response(result)
         
+    except (HTTPException, *NON_RETRYABLE_EXCEPTIONS):
+        # 客户端类错误保持原异常类型，由FastAPI/错误中间件映射为4xx，重试装饰器也能据此放弃重试
+        raise
+        
     except Exception as e:
         logger.error(f"函数执行失败: {task_name}", extra={
             "task_name": task_name,
@@ -142,7 +147,7 @@ async def _execute_as_task(func: Callable, args: tuple, kwargs: dict, task_confi
         )
         
         # 提交任务到管理器
-        task_id = await task_manager.submit_task(task)
+        task_id = await get_task_manager().submit_task(task)
         
         logger.info(f"任务提交成功: {task_id}", extra={
             "task_id": task_id,
@@ -158,6 +163,10 @@ async def _execute_as_task(func: Callable, args: tuple, kwargs: dict, task_confi
             "message": f"任务已提交到队列: {task_name}"
         })
         
+    except (HTTPException, *NON_RETRYABLE_EXCEPTIONS):
+        # 客户端类错误保持原异常类型，不包装为500
+        raise
+        
     except Exception as e:
         logger.error(f"任务提交失败: {task_name}", extra={
             "task_name": task_name,
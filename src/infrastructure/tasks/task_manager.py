@@ -1,10 +1,13 @@
 # src/infrastructure/tasks/task_manager.py
 import asyncio
+import concurrent.futures
 import time
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
-from collections import deque
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, List, Optional, Set, Tuple
+from collections import Counter, deque
 from contextlib import asynccontextmanager
 
 from src.infrastructure.logging.logger import get_logger
@@ -30,6 +33,32 @@ class TaskManager:
     5. 回调处理
     """
     
+    # 任务终态 -> 统计字段
+    _COMPLETION_STATS = {
+        TaskStatus.SUCCESS: "total_completed",
+        TaskStatus.FAILED: "total_failed",
+        TaskStatus.CANCELLED: "total_cancelled",
+        TaskStatus.TIMEOUT: "total_timeout"
+    }
+    
+    # 任务终态 -> 回调事件
+    _COMPLETION_CALLBACKS = {
+        TaskStatus.SUCCESS: "success",
+        TaskStatus.FAILED: "failed",
+        TaskStatus.TIMEOUT: "failed"
+    }
+    
+    # 结果写入每批最大条数
+    _RESULT_WRITE_BATCH = 64
+    
+    # 近期完成统计的时间窗口（秒），以及计入窗口的终态
+    _RECENT_WINDOW_SECONDS = 86400
+    _RECENT_COMPLETION_KEYS = {
+        TaskStatus.SUCCESS: "completed",
+        TaskStatus.FAILED: "failed",
+        TaskStatus.TIMEOUT: "failed"
+    }
+    
     def __init__(self):
         self.logger = logger
         
@@ -38,22 +67,36 @@ class TaskManager:
         self.worker_pool = WorkerPool(max_workers=settings.task_max_workers)
         self.callback_manager = CallbackManager()
         
-        # 任务队列 - 按优先级分层
+        # 任务队列 - 按优先级分层（每层FIFO，无需任务间比较）
         self.priority_queues = {
             TaskPriority.URGENT: deque(),
             TaskPriority.HIGH: deque(),
             TaskPriority.NORMAL: deque(),
             TaskPriority.LOW: deque()
         }
+        # 按优先级从高到低排列的队列，供调度时顺序取用
+        self._ordered_queues = tuple(
+            self.priority_queues[priority]
+            for priority in sorted(self.priority_queues, key=lambda p: p.value, reverse=True)
+        )
         
         # 状态跟踪
         self.running_tasks: Dict[str, BaseTask] = {}
         self.task_futures: Dict[str, asyncio.Future] = {}
         
+        # 结果写入队列 - 由后台写入协程批量落盘，待写入的结果保留在内存中供查询
+        self._result_writes: asyncio.Queue[Tuple[str, Dict[str, Any]]] = asyncio.Queue()
+        self._pending_results: Dict[str, Dict[str, Any]] = {}
+        
+        # 近期完成时间戳（按完成顺序追加，天然有序），统计时只需裁掉窗口外的头部
+        self._recent_completions: Dict[str, deque] = {"completed": deque(), "failed": deque()}
+        
         # 管理状态
         self._running = False
         self._scheduler_task: Optional[asyncio.Task] = None
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._result_writer_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
         # 统计信息
         self.stats = {
@@ -61,6 +104,7 @@ class TaskManager:
             "total_completed": 0,
             "total_failed": 0,
             "total_cancelled": 0,
+            "total_timeout": 0,
             "start_time": time.time()
         }
     
@@ -70,6 +114,7 @@ class TaskManager:
             return
         
         self._running = True
+        self._loop = asyncio.get_running_loop()
         
         # 启动核心组件
         await self.worker_pool.start()
@@ -78,6 +123,7 @@ class TaskManager:
         # 启动调度器
         self._scheduler_task = asyncio.create_task(self._scheduler_loop())
         self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+        self._result_writer_task = asyncio.create_task(self._result_writer_loop())
         
         self.logger.info("任务管理器已启动", extra={
             "max_workers": settings.task_max_workers,
@@ -107,6 +153,15 @@ class TaskManager:
         for task_id in list(self.running_tasks.keys()):
             await self.cancel_task(task_id, "系统关闭")
         
+        # 停止结果写入并落盘剩余结果
+        if self._result_writer_task:
+            self._result_writer_task.cancel()
+            try:
+                await self._result_writer_task
+            except asyncio.CancelledError:
+                pass
+        await self._flush_pending_results()
+        
         # 关闭核心组件
         await self.worker_pool.shutdown()
         await self.callback_manager.shutdown()
@@ -116,6 +171,7 @@ class TaskManager:
     async def submit_task(self, task: BaseTask, **params) -> str:
         """提交任务"""
         task_id = str(uuid.uuid4())
+        priority = task.priority
         task.task_id = task_id
         task.params = params
         task.status = TaskStatus.PENDING
@@ -125,19 +181,34 @@ class TaskManager:
         await self.storage.store_task(task)
         
         # 加入优先级队列
-        self.priority_queues[task.priority].append(task)
+        self.priority_queues[priority].append(task)
         
         # 更新统计
         self.stats["total_submitted"] += 1
         
         self.logger.info(f"任务已提交: {task_id}", extra={
             "task_name": task.task_name,
-            "priority": task.priority.value,
+            "priority": priority.value,
             "queue_size": self._get_total_queue_size()
         })
         
         return task_id
     
+    def submit_task_threadsafe(self, task: BaseTask, **params) -> concurrent.futures.Future:
+        """
+        从其他线程提交任务
+        
+        队列操作只在事件循环线程内进行，不需要加锁；
+        跨线程调用通过run_coroutine_threadsafe投递到管理器所在的事件循环。
+        
+        Returns:
+            concurrent.futures.Future: 结果为任务ID
+        """
+        if self._loop is None or not self._running:
+            raise RuntimeError("任务管理器未启动，无法跨线程提交任务")
+        
+        return asyncio.run_coroutine_threadsafe(self.submit_task(task, **params), self._loop)
+    
     async def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         """获取任务状态"""
         # 先查运行中的任务
@@ -145,9 +216,27 @@ class TaskManager:
             task = self.running_tasks[task_id]
             return task.to_dict()
         
-        # 查存储
+        return await self.get_task_result(task_id)
+    
+    async def get_task_result(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """获取任务结果（包括尚未写入存储的结果）"""
+        pending = self._pending_results.get(task_id)
+        if pending is not None:
+            return pending
         return await self.storage.get_task_result(task_id)
     
+    async def delete_task_result(self, task_id: str, delete_from_s3: bool = False) -> Dict[str, Any]:
+        """删除任务结果（同时丢弃尚未写入的结果）"""
+        self._pending_results.pop(task_id, None)
+        return await self.storage.delete_result(task_id, delete_from_s3)
+    
+    async def delete_task_results_bulk(self, task_ids: List[str], delete_from_s3: bool = False) -> List[Dict[str, Any]]:
+        """批量删除任务结果（同时丢弃尚未写入的结果）"""
+        pending_results = self._pending_results
+        for task_id in task_ids:
+            pending_results.pop(task_id, None)
+        return await self.storage.delete_results_bulk(task_ids, delete_from_s3)
+    
     async def cancel_task(self, task_id: str, reason: str = "用户取消") -> bool:
         """取消任务"""
         # 如果任务正在运行
@@ -164,12 +253,11 @@ class TaskManager:
                 self.task_futures[task_id].cancel()
             
             # 存储结果
-            await self.storage.store_result(task_id, task.to_dict())
+            self._enqueue_result(task_id, task)
             
-            # 清理
+            # 清理（取消统计由任务完成处理统一计入）
             self._cleanup_task_references(task_id)
             
-            self.stats["total_cancelled"] += 1
             self.logger.info(f"任务已取消: {task_id}", extra={"reason": reason})
             return True
         
@@ -179,7 +267,7 @@ class TaskManager:
                 if task.task_id == task_id:
                     task.status = TaskStatus.CANCELLED
                     task.error = reason
-                    await self.storage.store_result(task_id, task.to_dict())
+                    self._enqueue_result(task_id, task)
                     queue.remove(task)
                     self.stats["total_cancelled"] += 1
                     return True
@@ -187,7 +275,7 @@ class TaskManager:
         return False
     
     def force_kill_task(self, task_id: str, reason: str = "强制终止") -> bool:
-        """强制终止任务"""
+        """强制终止任务（只取消Future并清理内存引用，不阻塞事件循环）"""
         if task_id not in self.running_tasks:
             return False
         
@@ -206,7 +294,7 @@ class TaskManager:
         return True
     
     def get_queue_info(self) -> Dict[str, Any]:
-        """获取队列信息"""
+        """获取队列信息（纯内存读取，可在事件循环中直接调用）"""
         return {
             "queue_size": self._get_total_queue_size(),
             "running_tasks": len(self.running_tasks),
@@ -217,55 +305,74 @@ class TaskManager:
             "worker_utilization": self.worker_pool.get_utilization()
         }
     
-    def get_all_tasks(self) -> List[Dict[str, Any]]:
-        """获取所有活跃任务"""
-        tasks = []
+    def get_task_distributions(self) -> Tuple[Dict[str, int], Dict[int, int]]:
+        """
+        一次遍历统计活跃任务的状态分布与优先级分布
         
-        # 运行中的任务
-        for task in self.running_tasks.values():
-            tasks.append(task.to_dict())
+        直接读取任务对象的属性，不为每个任务构建字典；纯内存读取，可在事件循环中直接调用
+        """
+        status_counter: Counter = Counter()
+        priority_counter: Counter = Counter()
         
-        # 队列中的任务
-        for queue in self.priority_queues.values():
-            for task in queue:
-                tasks.append(task.to_dict())
+        for task in chain(self.running_tasks.values(), chain.from_iterable(self._ordered_queues)):
+            status_counter[task.status.value] += 1
+            priority_counter[task.priority.value if task.priority else 1] += 1
         
-        return tasks
+        return dict(status_counter), dict(priority_counter)
+    
+    def get_all_tasks(self) -> List[Dict[str, Any]]:
+        """
+        获取所有活跃任务（运行中的任务在前，其后为队列中的任务）
+        
+        纯内存快照，不涉及锁或I/O，可在事件循环中直接调用；
+        这些结构只由事件循环修改，放到线程池读取反而会引入并发读写
+        """
+        return [
+            task.to_dict()
+            for task in chain(
+                self.running_tasks.values(),
+                chain.from_iterable(self.priority_queues.values())
+            )
+        ]
     
     async def _scheduler_loop(self) -> None:
         """调度器主循环"""
+        interval = settings.task_scheduler_interval
         while self._running:
             try:
-                await self._schedule_next_task()
-                await asyncio.sleep(0.1)  # 避免CPU密集
+                await self._schedule_tasks()
+                await asyncio.sleep(interval)  # 避免CPU密集
             except Exception as e:
                 self.logger.error(f"调度器错误: {str(e)}")
                 await asyncio.sleep(1)
     
-    async def _schedule_next_task(self) -> None:
-        """调度下一个任务"""
-        if not self.worker_pool.has_available_worker():
-            return
-        
-        # 按优先级获取任务
-        task = self._get_next_task()
-        if not task:
-            return
-        
-        # 分配工作者
-        worker = await self.worker_pool.get_worker()
-        if not worker:
-            # 重新放回队列
-            self.priority_queues[task.priority].appendleft(task)
-            return
+    async def _schedule_tasks(self) -> int:
+        """调度所有可分派的任务（按优先级，直到没有空闲工作者或队列为空）"""
+        worker_pool = self.worker_pool
+        scheduled = 0
+        
+        while worker_pool.has_available_worker():
+            # 按优先级获取任务
+            task = self._get_next_task()
+            if not task:
+                break
+            
+            # 分配工作者
+            worker = await worker_pool.get_worker()
+            if not worker:
+                # 重新放回队列
+                self.priority_queues[task.priority].appendleft(task)
+                break
+            
+            # 执行任务
+            await self._execute_task(task, worker)
+            scheduled += 1
         
-        # 执行任务
-        await self._execute_task(task, worker)
+        return scheduled
     
     def _get_next_task(self) -> Optional[BaseTask]:
         """按优先级获取下一个任务"""
-        for priority in [TaskPriority.URGENT, TaskPriority.HIGH, TaskPriority.NORMAL, TaskPriority.LOW]:
-            queue = self.priority_queues[priority]
+        for queue in self._ordered_queues:
             if queue:
                 return queue.popleft()
         return None
@@ -273,11 +380,12 @@ class TaskManager:
     async def _execute_task(self, task: BaseTask, worker) -> None:
         """执行任务"""
         task_id = task.task_id
+        worker_id = worker.worker_id
         
         # 更新状态
         task.status = TaskStatus.RUNNING
         task.start_time = datetime.utcnow()
-        task.worker_id = worker.worker_id
+        task.worker_id = worker_id
         
         # 记录运行状态
         self.running_tasks[task_id] = task
@@ -286,7 +394,7 @@ class TaskManager:
             "task_id": task_id,
             "task_name": task.task_name,
             "task_type": type(task).__name__,
-            "worker_id": worker.worker_id,
+            "worker_id": worker_id,
             "priority": task.priority.value,
             "timeout": task.timeout
         })
@@ -300,23 +408,26 @@ class TaskManager:
     
     async def _run_task_with_timeout(self, task: BaseTask, worker) -> Any:
         """带超时的任务执行"""
+        task_id = task.task_id
+        timeout = task.timeout
+        
         try:
-            self.logger.debug(f"任务开始执行: {task.task_id}", extra={
-                "task_id": task.task_id,
+            self.logger.debug(f"任务开始执行: {task_id}", extra={
+                "task_id": task_id,
                 "worker_id": worker.worker_id,
-                "has_timeout": bool(task.timeout)
+                "has_timeout": bool(timeout)
             })
             
-            if task.timeout:
+            if timeout:
                 result = await asyncio.wait_for(
                     self.worker_pool.execute_task(task, worker),
-                    timeout=task.timeout
+                    timeout=timeout
                 )
             else:
                 result = await self.worker_pool.execute_task(task, worker)
             
-            self.logger.debug(f"任务执行成功: {task.task_id}", extra={
-                "task_id": task.task_id,
+            self.logger.debug(f"任务执行成功: {task_id}", extra={
+                "task_id": task_id,
                 "result_type": type(result).__name__ if result is not None else "None"
             })
             
@@ -324,16 +435,16 @@ class TaskManager:
             
         except asyncio.TimeoutError:
             task.status = TaskStatus.TIMEOUT
-            self.logger.warning(f"任务执行超时: {task.task_id}", extra={
-                "task_id": task.task_id,
-                "timeout": task.timeout
+            self.logger.warning(f"任务执行超时: {task_id}", extra={
+                "task_id": task_id,
+                "timeout": timeout
             })
             raise
         except Exception as e:
             task.status = TaskStatus.FAILED
             task.error = str(e)
-            self.logger.error(f"任务执行失败: {task.task_id}", extra={
-                "task_id": task.task_id,
+            self.logger.error(f"任务执行失败: {task_id}", extra={
+                "task_id": task_id,
                 "error": str(e),
                 "error_type": type(e).__name__
             }, exc_info=True)
@@ -342,60 +453,66 @@ class TaskManager:
     async def _handle_task_completion(self, task: BaseTask, future: asyncio.Future) -> None:
         """处理任务完成"""
         task_id = task.task_id
+        task_name = task.task_name
         
         try:
-            result = await future
-            
-            # 成功完成
-            task.status = TaskStatus.SUCCESS
-            task.result = result
-            task.end_time = datetime.utcnow()
-            task.duration = (task.end_time - task.start_time).total_seconds()
-            
-            self.stats["total_completed"] += 1
-            
-            self.logger.info(f"任务完成: {task_id}", extra={
-                "task_id": task_id,
-                "task_name": task.task_name,
-                "status": task.status.value,
-                "duration": task.duration,
-                "worker_id": task.worker_id
-            })
-            
-            # 处理回调
-            await self.callback_manager.trigger_callbacks(task, "success")
-            
-        except asyncio.CancelledError:
-            task.status = TaskStatus.CANCELLED
-            task.end_time = datetime.utcnow()
-            if task.start_time:
-                task.duration = (task.end_time - task.start_time).total_seconds()
-            
-            self.logger.info(f"任务被取消: {task_id}", extra={
-                "task_id": task_id,
-                "task_name": task.task_name
-            })
-            
-        except Exception as e:
-            task.status = TaskStatus.FAILED
-            task.error = str(e)
-            task.end_time = datetime.utcnow()
-            if task.start_time:
+            try:
+                result = await future
+                
+                # 成功完成
+                task.status = TaskStatus.SUCCESS
+                task.result = result
+                task.end_time = datetime.utcnow()
                 task.duration = (task.end_time - task.start_time).total_seconds()
+                
+                self.logger.info(f"任务完成: {task_id}", extra={
+                    "task_id": task_id,
+                    "task_name": task_name,
+                    "status": task.status.value,
+                    "duration": task.duration,
+                    "worker_id": task.worker_id
+                })
+                
+            except asyncio.CancelledError:
+                task.status = TaskStatus.CANCELLED
+                task.end_time = datetime.utcnow()
+                if task.start_time:
+                    task.duration = (task.end_time - task.start_time).total_seconds()
+                
+                self.logger.info(f"任务被取消: {task_id}", extra={
+                    "task_id": task_id,
+                    "task_name": task_name
+                })
+                
+            except Exception as e:
+                # 超时状态已在执行阶段标记，这里不再覆盖
+                if task.status != TaskStatus.TIMEOUT:
+                    task.status = TaskStatus.FAILED
+                task.error = str(e)
+                task.end_time = datetime.utcnow()
+                if task.start_time:
+                    task.duration = (task.end_time - task.start_time).total_seconds()
+                
+                self.logger.error(f"任务失败: {task_id}", extra={
+                    "task_id": task_id,
+                    "task_name": task_name,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "retry_count": task.retry_count,
+                    "max_retries": task.max_retries
+                })
             
-            self.stats["total_failed"] += 1
+            # 按终态更新统计
+            stats_key = self._COMPLETION_STATS.get(task.status)
+            if stats_key:
+                self.stats[stats_key] += 1
             
-            self.logger.error(f"任务失败: {task_id}", extra={
-                "task_id": task_id,
-                "task_name": task.task_name,
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "retry_count": task.retry_count,
-                "max_retries": task.max_retries
-            })
+            recent_key = self._RECENT_COMPLETION_KEYS.get(task.status)
+            if recent_key:
+                self._record_recent_completion(recent_key)
             
             # 重试逻辑
-            if task.retry_count < task.max_retries:
+            if task.is_failed() and task.can_retry():
                 self.logger.info(f"准备重试任务: {task_id}", extra={
                     "task_id": task_id,
                     "retry_count": task.retry_count + 1,
@@ -404,18 +521,14 @@ class TaskManager:
                 await self._retry_task(task)
                 return
             
-            # 处理失败回调
-            await self.callback_manager.trigger_callbacks(task, "failed")
+            # 处理回调
+            event_type = self._COMPLETION_CALLBACKS.get(task.status)
+            if event_type:
+                await self.callback_manager.trigger_callbacks(task, event_type)
         
         finally:
-            # 存储结果
-            try:
-                await self.storage.store_result(task_id, task.to_dict())
-                self.logger.debug(f"任务结果已存储: {task_id}")
-            except Exception as storage_error:
-                self.logger.error(f"存储任务结果失败: {task_id}", extra={
-                    "storage_error": str(storage_error)
-                })
+            # 存储结果（异步批量写入）
+            self._enqueue_result(task_id, task)
             
             # 释放工作者
             worker = self.worker_pool.get_worker_by_task(task_id)
@@ -428,7 +541,9 @@ class TaskManager:
     
     async def _retry_task(self, task: BaseTask) -> None:
         """重试任务"""
-        task.retry_count += 1
+        task_id = task.task_id
+        retry_count = task.retry_count + 1
+        task.retry_count = retry_count
         task.status = TaskStatus.PENDING
         task.start_time = None
         task.end_time = None
@@ -436,18 +551,68 @@ class TaskManager:
         task.error = None
         
         # 清理当前执行状态
-        self._cleanup_task_references(task.task_id)
+        self._cleanup_task_references(task_id)
         
         # 重新加入队列
-        self.priority_queues[task.priority].appendleft(task)
+        queue = self.priority_queues[task.priority]
+        queue.appendleft(task)
         
-        self.logger.info(f"任务重试: {task.task_id}", extra={
-            "task_id": task.task_id,
-            "retry_count": task.retry_count,
+        self.logger.info(f"任务重试: {task_id}", extra={
+            "task_id": task_id,
+            "retry_count": retry_count,
             "max_retries": task.max_retries,
-            "queue_size": len(self.priority_queues[task.priority])
+            "queue_size": len(queue)
         })
     
+    def _enqueue_result(self, task_id: str, task: BaseTask) -> None:
+        """将任务结果放入写入队列"""
+        result_data = task.to_dict()
+        self._pending_results[task_id] = result_data
+        self._result_writes.put_nowait((task_id, result_data))
+    
+    async def _result_writer_loop(self) -> None:
+        """结果写入循环 - 每轮最多合并写入_RESULT_WRITE_BATCH条"""
+        while True:
+            batch = [await self._result_writes.get()]
+            while len(batch) < self._RESULT_WRITE_BATCH and not self._result_writes.empty():
+                batch.append(self._result_writes.get_nowait())
+            await self._write_results(batch)
+    
+    async def _flush_pending_results(self) -> None:
+        """写入队列中剩余的全部结果"""
+        batch = []
+        while not self._result_writes.empty():
+            batch.append(self._result_writes.get_nowait())
+        if batch:
+            await self._write_results(batch)
+    
+    async def _write_results(self, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """批量写入结果，跳过已被覆盖或删除的条目"""
+        items = [
+            (task_id, result_data) for task_id, result_data in batch
+            if self._pending_results.get(task_id) is result_data
+        ]
+        if not items:
+            return
+        
+        try:
+            stored = await self.storage.store_results(items)
+            self.logger.debug(f"任务结果已存储: {stored}/{len(items)}")
+        except asyncio.CancelledError:
+            # 关闭时被取消：本批次结果仍在_pending_results中，放回写入队列由_flush_pending_results重新落盘
+            for item in items:
+                self._result_writes.put_nowait(item)
+            raise
+        except Exception as storage_error:
+            self.logger.error("存储任务结果失败", extra={
+                "batch_size": len(items),
+                "storage_error": str(storage_error)
+            })
+        
+        for task_id, result_data in items:
+            if self._pending_results.get(task_id) is result_data:
+                del self._pending_results[task_id]
+    
     def _cleanup_task_references(self, task_id: str) -> None:
         """清理任务引用"""
         self.running_tasks.pop(task_id, None)
@@ -463,16 +628,46 @@ class TaskManager:
                 self.logger.error(f"清理任务错误: {str(e)}")
                 await asyncio.sleep(60)
     
+    def _record_recent_completion(self, key: str) -> None:
+        """记录一次任务完成，同时裁掉窗口外的记录以限制内存占用"""
+        now = time.time()
+        timestamps = self._recent_completions[key]
+        timestamps.append(now)
+        
+        cutoff = now - self._RECENT_WINDOW_SECONDS
+        while timestamps[0] < cutoff:
+            timestamps.popleft()
+    
+    def get_recent_completion_counts(self) -> Dict[str, int]:
+        """
+        获取时间窗口内（默认24小时）完成与失败的任务数
+        
+        仅读写内存中的时间戳队列，可在事件循环内直接调用
+        """
+        cutoff = time.time() - self._RECENT_WINDOW_SECONDS
+        counts = {}
+        for key, timestamps in self._recent_completions.items():
+            while timestamps and timestamps[0] < cutoff:
+                timestamps.popleft()
+            counts[key] = len(timestamps)
+        return counts
+    
     def _get_total_queue_size(self) -> int:
         """获取总队列大小"""
-        return sum(len(queue) for queue in self.priority_queues.values())
+        return sum(map(len, self._ordered_queues))
     
-    async def get_statistics(self) -> Dict[str, Any]:
-        """获取统计信息"""
+    async def get_statistics(self, include_details: bool = False) -> Dict[str, Any]:
+        """
+        获取统计信息
+        
+        include_details为True时在同一快照中附带活跃任务分布（distributions），调用方无需再单独遍历任务
+        """
         uptime = time.time() - self.stats["start_time"]
-        total_processed = self.stats["total_completed"] + self.stats["total_failed"]
+        total_processed = (
+            self.stats["total_completed"] + self.stats["total_failed"] + self.stats["total_timeout"]
+        )
         
-        return {
+        statistics = {
             "runtime": {
                 "uptime_seconds": uptime,
                 "total_tasks": self.stats["total_submitted"],
@@ -481,8 +676,10 @@ class TaskManager:
                 "completed_tasks": self.stats["total_completed"],
                 "failed_tasks": self.stats["total_failed"],
                 "cancelled_tasks": self.stats["total_cancelled"],
+                "timeout_tasks": self.stats["total_timeout"],
                 "success_rate": self.stats["total_completed"] / total_processed if total_processed > 0 else 0,
                 "queue_size": self._get_total_queue_size(),
+                "pending_result_writes": len(self._pending_results),
                 "worker_utilization": self.worker_pool.get_utilization()
             },
             "performance": {
@@ -491,7 +688,18 @@ class TaskManager:
                 "throughput_per_hour": (total_processed / uptime * 3600) if uptime > 0 else 0
             }
         }
+        
+        if include_details:
+            status_distribution, priority_distribution = self.get_task_distributions()
+            statistics["distributions"] = {
+                "status": status_distribution,
+                "priority": priority_distribution
+            }
+        
+        return statistics
 
 
-# 全局任务管理器实例
-task_manager = TaskManager()
\ No newline at end of file
+@lru_cache()
+def get_task_manager() -> TaskManager:
+    """获取全局任务管理器实例（首次使用时创建）"""
+    return TaskManager()
\ No newline at end of file
@@ -3,15 +3,42 @@
 增强的任务注册表 - 支持请求任务的注册和监控
 """
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, DefaultDict, Dict, FrozenSet, List, Optional, Set, Tuple
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 from src.infrastructure.logging.logger import get_logger
 from src.infrastructure.tasks.request_task import RequestTask
 
 logger = get_logger(__name__)
 
+# 任务状态 -> 计数字段
+_STATUS_STAT_KEYS = {
+    "success": "total_success",
+    "failed": "total_failed",
+    "cancelled": "total_cancelled",
+    "timeout": "total_timeout"
+}
+
+_COUNTER_FIELDS = ("total_executed", *_STATUS_STAT_KEYS.values())
+
+
+@dataclass(slots=True)
+class TaskTypeEntry:
+    """注册表条目 - 任务类型信息及其搜索文本"""
+    info: Dict[str, Any]
+    search_text: str
+
+
+@dataclass(slots=True)
+class TaskExecutionStats:
+    """单个任务类型的执行统计 - 计数器只保存整数计数，平均耗时与最后执行时间单独存放"""
+    counts: Counter = field(default_factory=Counter)
+    avg_duration: float = 0.0
+    last_executed: Optional[str] = None
+
 
 class TaskRegistry:
     """
@@ -27,22 +54,22 @@ class TaskRegistry:
     def __init__(self):
         self.logger = logger
         
-        # 任务类型注册
-        self._task_types: Dict[str, Dict[str, Any]] = {}
-        
-        # 任务执行统计
-        self._execution_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
-            "total_executed": 0,
-            "total_success": 0,
-            "total_failed": 0,
-            "total_cancelled": 0,
-            "total_timeout": 0,
-            "avg_duration": 0.0,
-            "last_executed": None
-        })
+        # 任务类型注册：任务名 -> 条目（信息与预先转为小写的搜索文本）
+        self._tasks: Dict[str, TaskTypeEntry] = {}
+        
+        # 任务执行统计（缺失的计数字段默认为0）
+        self._execution_stats: DefaultDict[str, TaskExecutionStats] = defaultdict(TaskExecutionStats)
         
         # 任务模板（用于创建相同类型的任务）
         self._task_templates: Dict[str, Dict[str, Any]] = {}
+        
+        # 倒排索引：标签/分类 -> 任务名集合
+        self._tasks_by_tag: Dict[str, Set[str]] = {}
+        self._tasks_by_category: Dict[str, Set[str]] = {}
+        
+        # 注册表版本号，注册/注销时递增；导出的任务类型按版本缓存
+        self._version = 0
+        self._task_types_cache: Optional[Tuple[int, Dict[str, Any], FrozenSet[str]]] = None
     
     def register_api_task_type(
         self, 
@@ -50,16 +77,25 @@ class TaskRegistry:
         route_path: str,
         method: str,
         handler_name: str,
-        default_config: Optional[Dict[str, Any]] = None
+        default_config: Optional[Dict[str, Any]] = None,
+        category: str = "general",
+        tags: Optional[List[str]] = None
     ) -> None:
         """注册API任务类型"""
+        # 所有任务类型共用一个字典，一次查找即可判断是否重复注册
+        if task_name in self._tasks:
+            raise ValueError(f"任务类型已注册: {task_name}，如需重新注册请先调用unregister_task_type注销")
+        
+        tags = list(dict.fromkeys(tags or []))
         task_info = {
             "task_name": task_name,
             "type": "api_request",
             "route_path": route_path,
             "http_method": method,
             "handler_name": handler_name,
-            "registered_at": datetime.utcnow().isoformat(),
+            "category": category,
+            "tags": tags,
+            "registered_at_ts": time.time(),
             "default_config": default_config or {
                 "timeout": 300,
                 "priority": 0,
@@ -67,66 +103,171 @@ class TaskRegistry:
             }
         }
         
-        self._task_types[task_name] = task_info
+        self._tasks[task_name] = TaskTypeEntry(
+            info=task_info,
+            search_text=f"{task_name} {route_path} {handler_name}".lower()
+        )
+        for tag in tags:
+            self._tasks_by_tag.setdefault(tag, set()).add(task_name)
+        self._tasks_by_category.setdefault(category, set()).add(task_name)
+        self._version += 1
         
         self.logger.info(f"注册API任务类型: {task_name}", extra={
             "route": f"{method} {route_path}",
             "handler": handler_name
         })
     
+    def unregister_task_type(self, task_name: str) -> bool:
+        """注销任务类型"""
+        entry = self._tasks.pop(task_name, None)
+        if entry is None:
+            return False
+        
+        self._unindex_task(task_name, entry)
+        self._version += 1
+        
+        self.logger.info(f"注销任务类型: {task_name}")
+        return True
+    
+    def _unindex_task(self, task_name: str, entry: TaskTypeEntry) -> None:
+        """从倒排索引中移除任务"""
+        task_info = entry.info
+        
+        for tag in task_info.get("tags", ()):
+            names = self._tasks_by_tag.get(tag)
+            if names is not None:
+                names.discard(task_name)
+                if not names:
+                    del self._tasks_by_tag[tag]
+        
+        category = task_info.get("category")
+        names = self._tasks_by_category.get(category)
+        if names is not None:
+            names.discard(task_name)
+            if not names:
+                del self._tasks_by_category[category]
+    
     def update_execution_stats(self, task_name: str, duration: float, status: str) -> None:
         """更新任务执行统计"""
         stats = self._execution_stats[task_name]
+        counts = stats.counts
         
-        stats["total_executed"] += 1
-        stats["last_executed"] = datetime.utcnow().isoformat()
+        counts["total_executed"] += 1
+        stats.last_executed = datetime.utcnow().isoformat()
         
-        if status == "success":
-            stats["total_success"] += 1
-        elif status == "failed":
-            stats["total_failed"] += 1
-        elif status == "cancelled":
-            stats["total_cancelled"] += 1
-        elif status == "timeout":
-            stats["total_timeout"] += 1
+        stat_key = _STATUS_STAT_KEYS.get(status)
+        if stat_key:
+            counts[stat_key] += 1
         
-        # 更新平均执行时间
-        total_success = stats["total_success"]
-        if total_success > 0:
-            old_avg = stats["avg_duration"]
-            stats["avg_duration"] = (old_avg * (total_success - 1) + duration) / total_success
+        # 更新平均执行时间（仅统计成功执行）
+        if stat_key == "total_success":
+            total_success = counts["total_success"]
+            stats.avg_duration = (stats.avg_duration * (total_success - 1) + duration) / total_success
+    
+    @staticmethod
+    def _format_stats(stats: TaskExecutionStats) -> Dict[str, Any]:
+        """将执行统计转换为完整的统计字典"""
+        counts = stats.counts
+        result = {name: counts[name] for name in _COUNTER_FIELDS}
+        result["avg_duration"] = stats.avg_duration
+        result["last_executed"] = stats.last_executed
+        return result
+    
+    @staticmethod
+    def _export_task_info(task_info: Dict[str, Any]) -> Dict[str, Any]:
+        """导出任务类型信息，注册时间在此时才格式化"""
+        result = task_info.copy()
+        # 去掉时区信息，与其他utcnow()生成的时间字符串格式保持一致
+        registered_at = datetime.fromtimestamp(result.pop("registered_at_ts"), tz=timezone.utc)
+        result["registered_at"] = registered_at.replace(tzinfo=None).isoformat()
+        return result
+    
+    def get_task_info(self, task_name: str) -> Optional[Dict[str, Any]]:
+        """获取单个任务类型信息"""
+        entry = self._tasks.get(task_name)
+        return self._export_task_info(entry.info) if entry is not None else None
+    
+    def has_task_type(self, task_name: str) -> bool:
+        """检查任务类型是否已注册"""
+        return task_name in self._tasks
     
     def get_task_types(self) -> Dict[str, Any]:
         """获取所有注册的任务类型"""
-        return self._task_types.copy()
+        return {name: self._export_task_info(entry.info) for name, entry in self._tasks.items()}
+    
+    def get_task_types_cached(self) -> Tuple[Dict[str, Any], FrozenSet[str]]:
+        """
+        获取所有注册的任务类型及任务名集合（按注册表版本缓存）
+        
+        注册表未变化时直接返回上次导出的结果，调用方不应修改返回的字典
+        """
+        cache = self._task_types_cache
+        if cache is None or cache[0] != self._version:
+            task_types = self.get_task_types()
+            cache = (self._version, task_types, frozenset(task_types))
+            self._task_types_cache = cache
+        return cache[1], cache[2]
+    
+    def get_tasks_by_category(self, category: str) -> List[str]:
+        """获取指定分类下的任务类型"""
+        return sorted(self._tasks_by_category.get(category, ()))
+    
+    def get_all_categories(self) -> Dict[str, List[str]]:
+        """获取所有分类及其任务类型"""
+        return {category: sorted(names) for category, names in self._tasks_by_category.items()}
     
     def get_task_stats(self, task_name: Optional[str] = None) -> Dict[str, Any]:
         """获取任务统计信息"""
         if task_name:
-            return self._execution_stats.get(task_name, {})
-        return dict(self._execution_stats)
+            stats = self._execution_stats.get(task_name)
+            return self._format_stats(stats) if stats is not None else {}
+        return {name: self._format_stats(stats) for name, stats in self._execution_stats.items()}
     
-    def search_tasks(self, query: str) -> List[Dict[str, Any]]:
-        """搜索任务类型"""
+    def search_tasks(
+        self,
+        query: str = "",
+        tags: Optional[List[str]] = None,
+        category: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        搜索任务类型
+        
+        Args:
+            query: 关键词，匹配任务名、路径、处理器
+            tags: 标签过滤，包含任一标签即匹配
+            category: 分类过滤
+        """
         results = []
         query_lower = query.lower()
         
-        for task_name, task_info in self._task_types.items():
-            # 在任务名、路径、处理器中搜索
-            searchable = f"{task_name} {task_info.get('route_path', '')} {task_info.get('handler_name', '')}".lower()
-            
-            if query_lower in searchable:
-                result = task_info.copy()
-                result["stats"] = self._execution_stats.get(task_name, {})
+        # 先用倒排索引缩小候选集
+        candidates: Optional[Set[str]] = None
+        if tags:
+            candidates = set().union(*(self._tasks_by_tag.get(tag, ()) for tag in tags))
+        if category is not None:
+            in_category = self._tasks_by_category.get(category, set())
+            candidates = in_category if candidates is None else candidates & in_category
+        
+        if candidates is None:
+            entries = self._tasks.items()
+        else:
+            entries = ((task_name, self._tasks[task_name]) for task_name in sorted(candidates))
+        
+        # 在任务名、路径、处理器中搜索
+        for task_name, entry in entries:
+            if query_lower in entry.search_text:
+                result = self._export_task_info(entry.info)
+                stats = self._execution_stats.get(task_name)
+                result["stats"] = self._format_stats(stats) if stats is not None else {}
                 results.append(result)
         
         return results
     
     def get_registry_summary(self) -> Dict[str, Any]:
         """获取注册表摘要"""
-        total_types = len(self._task_types)
-        total_executed = sum(stats["total_executed"] for stats in self._execution_stats.values())
-        total_success = sum(stats["total_success"] for stats in self._execution_stats.values())
+        total_types = len(self._tasks)
+        total_executed = sum(stats.counts["total_executed"] for stats in self._execution_stats.values())
+        total_success = sum(stats.counts["total_success"] for stats in self._execution_stats.values())
         
         return {
             "total_task_types": total_types,
@@ -134,4 +275,10 @@ class TaskRegistry:
             "total_success": total_success,
             "success_rate": total_success / total_executed if total_executed > 0 else 0,
             "api_task_types": total_types  # 目前都是API任务
-        }
\ No newline at end of file
+        }
+
+
+@lru_cache()
+def get_task_registry() -> TaskRegistry:
+    """获取全局任务注册表实例（首次使用时创建，处理器与服务共享同一份注册信息）"""
+    return TaskRegistry()
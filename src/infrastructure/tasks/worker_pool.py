@@ -2,7 +2,8 @@
 import asyncio
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Deque, Dict, List, Optional, Set
+from collections import deque
 from dataclasses import dataclass
 
 from src.infrastructure.logging.logger import get_logger
@@ -45,7 +46,7 @@ class WorkerPool:
         
         # 工作者管理
         self.workers: Dict[str, Worker] = {}
-        self.available_workers: Set[str] = set()
+        self.available_workers: Deque[str] = deque()  # 空闲工作者，FIFO复用
         self.busy_workers: Set[str] = set()
         
         # 任务到工作者的映射
@@ -108,7 +109,7 @@ class WorkerPool:
             self.logger.debug("没有可用工作者")
             return None
         
-        worker_id = self.available_workers.pop()
+        worker_id = self.available_workers.popleft()
         worker = self.workers[worker_id]
         
         # 标记为忙碌
@@ -123,25 +124,20 @@ class WorkerPool:
         """释放工作者"""
         worker_id = worker.worker_id
         
-        if worker_id in self.workers:
+        if worker_id in self.busy_workers:
+            # 清理任务映射
+            if worker.current_task_id is not None:
+                self.task_to_worker.pop(worker.current_task_id, None)
+            
             # 重置状态
             worker.is_busy = False
             worker.current_task_id = None
             worker.tasks_completed += 1
             
-            # 更新集合
+            # 归还到空闲队列
             self.busy_workers.discard(worker_id)
-            self.available_workers.add(worker_id)
-            
-            # 清理任务映射
-            task_id_to_remove = None
-            for task_id, w_id in self.task_to_worker.items():
-                if w_id == worker_id:
-                    task_id_to_remove = task_id
-                    break
-            
-            if task_id_to_remove:
-                del self.task_to_worker[task_id_to_remove]
+            if worker_id in self.workers:
+                self.available_workers.append(worker_id)
             
             self.logger.debug(f"释放工作者: {worker_id}")
     
@@ -159,13 +155,14 @@ class WorkerPool:
     async def _execute_task_internal(self, task, worker: Worker) -> Any:
         """执行任务内部实现"""
         task_id = task.task_id
+        worker_id = worker.worker_id
         worker.current_task_id = task_id
-        self.task_to_worker[task_id] = worker.worker_id
+        self.task_to_worker[task_id] = worker_id
         
         start_time = datetime.utcnow()
         
-        self.logger.info(f"工作者 {worker.worker_id} 开始执行任务 {task_id}", extra={
-            "worker_id": worker.worker_id,
+        self.logger.info(f"工作者 {worker_id} 开始执行任务 {task_id}", extra={
+            "worker_id": worker_id,
             "task_id": task_id,
             "task_name": getattr(task, 'task_name', 'unknown'),
             "task_type": type(task).__name__
@@ -180,8 +177,8 @@ class WorkerPool:
             self.stats["tasks_executed"] += 1
             self.stats["total_execution_time"] += execution_time
             
-            self.logger.info(f"工作者 {worker.worker_id} 完成任务 {task_id}", extra={
-                "worker_id": worker.worker_id,
+            self.logger.info(f"工作者 {worker_id} 完成任务 {task_id}", extra={
+                "worker_id": worker_id,
                 "task_id": task_id,
                 "execution_time": execution_time,
                 "result_type": type(result).__name__ if result is not None else "None"
@@ -193,8 +190,8 @@ class WorkerPool:
             self.stats["tasks_failed"] += 1
             execution_time = (datetime.utcnow() - start_time).total_seconds()
             
-            self.logger.error(f"工作者 {worker.worker_id} 执行任务 {task_id} 失败", extra={
-                "worker_id": worker.worker_id,
+            self.logger.error(f"工作者 {worker_id} 执行任务 {task_id} 失败", extra={
+                "worker_id": worker_id,
                 "task_id": task_id,
                 "execution_time": execution_time,
                 "error": str(e),
@@ -208,7 +205,7 @@ class WorkerPool:
         worker = Worker(worker_id=worker_id)
         
         self.workers[worker_id] = worker
-        self.available_workers.add(worker_id)
+        self.available_workers.append(worker_id)
         self.stats["workers_created"] += 1
         
         self.logger.debug(f"创建工作者: {worker_id}")
@@ -243,9 +240,10 @@ class WorkerPool:
             to_remove = current_count - target_count
             removed = 0
             
-            available_list = list(self.available_workers)
-            for worker_id in available_list[:to_remove]:
-                self.available_workers.remove(worker_id)
+            # 从空闲队列头部依次弹出（最久未使用的工作者），每次O(1)
+            available_workers = self.available_workers
+            while removed < to_remove and available_workers:
+                worker_id = available_workers.popleft()
                 del self.workers[worker_id]
                 removed += 1
             
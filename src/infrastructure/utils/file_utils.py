@@ -4,6 +4,8 @@ import shutil
 from pathlib import Path
 from typing import List, Optional, Union
 
+from src.infrastructure.utils.validation_utils import ValidationUtils
+
 
 class FileUtils:
     """文件工具类"""
@@ -34,7 +36,6 @@ class FileUtils:
     @staticmethod
     def safe_filename(filename: str) -> str:
         """创建安全的文件名"""
-        from src.infrastructure.utils.validation_utils import ValidationUtils
         return ValidationUtils.sanitize_filename(filename)
     
     @staticmethod
@@ -1,6 +1,8 @@
 # src/infrastructure/utils/string_utils.py
 import hashlib
+import json
 import random
+import re
 import string
 import uuid
 from typing import List, Optional
@@ -49,7 +51,6 @@ class StringUtils:
     @staticmethod
     def camel_to_snake(name: str) -> str:
         """驼峰转下划线"""
-        import re
         s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
         return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
     
@@ -74,14 +75,12 @@ class StringUtils:
     @staticmethod
     def extract_numbers(text: str) -> List[float]:
         """提取字符串中的数字"""
-        import re
         numbers = re.findall(r'-?\d+\.?\d*', text)
         return [float(num) for num in numbers if num]
     
     @staticmethod
     def is_json(text: str) -> bool:
         """检查字符串是否为有效JSON"""
-        import json
         try:
             json.loads(text)
             return True
@@ -3,25 +3,36 @@ import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response
+from starlette.requests import Request
+from starlette.routing import Route
 
 from src.api.middleware.error_handler import ErrorHandlerMiddleware
 from src.api.middleware.logging_middleware import LoggingMiddleware
 from src.api.routers.main_router import api_router
+from src.api.routers.v1.foo_router import get_foo_handler
 from src.application.config.settings import get_settings
 from src.infrastructure.logging.logger import setup_logging, get_logger
-from src.infrastructure.tasks.task_manager import task_manager
+from src.infrastructure.tasks.task_manager import get_task_manager
 
 # 初始化日志
 setup_logging()
 logger = get_logger(__name__)
 
 
+async def ping(request: Request) -> PlainTextResponse:
+    """负载均衡器存活检查（裸Starlette路由，不经过依赖注入与OpenAPI）"""
+    return PlainTextResponse(b"pong")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """应用生命周期管理"""
     settings = get_settings()
+    task_manager = get_task_manager()
     
     # 启动时初始化
     logger.info("应用启动中...", extra={
@@ -44,6 +55,10 @@ async def lifespan(app: FastAPI):
         task_config = settings.get_service_config("task")
         logger.info("任务系统配置", extra=task_config)
         
+        # 预热处理器（HANDLER_WARMUP=1时启用）
+        if settings.handler_warmup:
+            await get_foo_handler().warmup()
+        
         logger.info("应用启动完成")
         
     except Exception as e:
@@ -78,14 +93,18 @@ def create_app() -> FastAPI:
     """创建FastAPI应用实例"""
     settings = get_settings()
     
+    # 生产环境关闭文档相关路由
+    is_prod = settings.is_production
+    
     # 创建应用实例
     app = FastAPI(
         title=settings.app_name,
         description="A scalable FastAPI framework following DDD principles with advanced task management",
         version=settings.app_version,
-        docs_url=settings.docs_url if not settings.is_production else None,
-        redoc_url=settings.redoc_url if not settings.is_production else None,
-        openapi_url="/openapi.json" if not settings.is_production else None,
+        docs_url=None if is_prod else settings.docs_url,
+        redoc_url=None if is_prod else settings.redoc_url,
+        openapi_url=None if is_prod else "/openapi.json",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
     
@@ -105,25 +124,31 @@ def create_app() -> FastAPI:
     # 注册路由
     app.include_router(api_router, prefix=settings.api_prefix)
     
+    # 高频存活检查放在路由表最前面，最先被匹配
+    app.router.routes.insert(0, Route("/ping", endpoint=ping, methods=["GET"], include_in_schema=False))
+    
+    # 根路径响应内容只依赖配置，构建应用时预先序列化
+    task_config = settings.task_storage_config
+    root_content = orjson.dumps({
+        "message": f"欢迎使用 {settings.app_name}",
+        "version": settings.app_version,
+        "environment": settings.environment,
+        "docs": f"{settings.api_prefix}/docs" if settings.docs_url else None,
+        "health": f"{settings.api_prefix}/health",
+        "features": {
+            "task_system": "enabled",
+            "s3_storage": task_config["enable_s3_storage"],
+            "callback_support": "per_service",
+            "worker_scaling": "dynamic"
+        }
+    })
+    
     # 根路径处理
     @app.get("/", tags=["root"])
     async def root():
         """API根路径"""
-        task_config = settings.task_storage_config
-        
-        return {
-            "message": f"欢迎使用 {settings.app_name}",
-            "version": settings.app_version,
-            "environment": settings.environment,
-            "docs": f"{settings.api_prefix}/docs" if settings.docs_url else None,
-            "health": f"{settings.api_prefix}/health",
-            "features": {
-                "task_system": "enabled",
-                "s3_storage": task_config["enable_s3_storage"],
-                "callback_support": "per_service",
-                "worker_scaling": "dynamic"
-            }
-        }
+        # 每次返回新的Response实例，避免中间件追加的响应头在请求间累积
+        return Response(content=root_content, media_type="application/json")
     
     return app
 
@@ -142,6 +167,7 @@ if __name__ == "__main__":
         "host": settings.host,
         "port": settings.port,
         "reload": settings.reload and settings.is_development,
+        "loop": settings.event_loop,  # uvloop（uvicorn[standard]已包含）可显著降低协程调度开销
         "log_config": None,  # 使用自定义日志配置
         "access_log": False,  # 禁用默认访问日志，使用自定义中间件
     }
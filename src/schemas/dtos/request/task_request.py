@@ -1,11 +1,16 @@
 # src/schemas/dtos/request/task_request.py
+import re
 from typing import Any, Dict, Optional
 
+import orjson
 from pydantic import Field, validator
 
 from src.schemas.dtos.request.base_request import BaseRequest
 from src.schemas.enums.base_enums import TaskTypeEnum
 
+# 任务名称格式（字母、数字、下划线，且以字母开头）
+_TASK_NAME_PATTERN = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]*$')
+
 
 class TaskCreateRequest(BaseRequest):
     """创建任务请求DTO"""
@@ -20,20 +25,19 @@ class TaskCreateRequest(BaseRequest):
     
     @validator('task_name')
     def validate_task_name(cls, v: str) -> str:
-        if not v or not v.strip():
+        v = v.strip() if v else v
+        if not v:
             raise ValueError("任务名称不能为空")
         # 检查任务名称格式（字母、数字、下划线）
-        import re
-        if not re.match(r'^[a-zA-Z][a-zA-Z0-9_]*$', v.strip()):
+        if not _TASK_NAME_PATTERN.match(v):
             raise ValueError("任务名称只能包含字母、数字和下划线，且必须以字母开头")
-        return v.strip()
+        return v
     
     @validator('params')
     def validate_params(cls, v: Dict[str, Any]) -> Dict[str, Any]:
-        # 确保参数可序列化
-        import json
+        # 确保参数可序列化（orjson在C层完成一次遍历，嵌套的非字符串键按json.dumps的方式处理）
         try:
-            json.dumps(v, default=str)
+            orjson.dumps(v, default=str, option=orjson.OPT_NON_STR_KEYS)
         except (TypeError, ValueError) as e:
             raise ValueError(f"任务参数必须可JSON序列化: {str(e)}")
         return v
@@ -9,7 +9,7 @@ sys.path.insert(0, str(project_root))
 
 import pytest
 import asyncio
-from app.main import create_app
+from src.main import create_app
 
 
 @pytest.fixture(scope="session")
@@ -40,5 +40,5 @@ async def app():
 @pytest.fixture(autouse=True)
 def setup_logging():
     """设置测试日志"""
-    from app.infrastructure.logging.logger import setup_logging
+    from src.infrastructure.logging.logger import setup_logging
     setup_logging()
\ No newline at end of file
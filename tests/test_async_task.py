@@ -13,11 +13,13 @@ sys.path.insert(0, str(project_root))
 
 from src.application.config.settings import get_settings
 from src.infrastructure.logging.logger import setup_logging, get_logger
-from src.infrastructure.tasks.task_manager import task_manager
+from src.infrastructure.tasks.task_manager import get_task_manager
 from src.infrastructure.tasks.base_task import create_simple_task
 from src.infrastructure.tasks.request_task import RequestTask
 from src.application.handlers.foo_handler import FooHandler
 
+task_manager = get_task_manager()
+
 
 async def test_simple_task():
     """测试简单任务"""
@@ -0,0 +1,79 @@
+# tests/test_callback_manager.py
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+# 确保可以导入app模块
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.infrastructure.tasks.base_task import create_simple_task
+from src.infrastructure.tasks.callback_manager import CallbackManager, CallbackTrigger, CallbackType
+
+
+async def _noop():
+    return "ok"
+
+
+class TestCallbackRetry:
+    """测试回调失败后的退避重试"""
+    
+    def setup_method(self):
+        self.manager = CallbackManager()
+        self.task = create_simple_task(task_name="callback_test", task_func=_noop)
+        self.task.task_id = "callback-task"
+    
+    def test_retry_delay_backoff(self):
+        """测试重试等待时间指数增长且有上限"""
+        manager = self.manager
+        manager._RETRY_BASE_DELAY = 1.0
+        manager._RETRY_MAX_DELAY = 5.0
+        
+        assert [manager._get_retry_delay(n) for n in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+    
+    @pytest.mark.asyncio
+    async def test_failed_callback_requeued_after_delay(self):
+        """测试失败的回调在退避后才重新入队"""
+        manager = self.manager
+        manager._RETRY_BASE_DELAY = 0.05
+        
+        async def failing_callback(task):
+            raise RuntimeError("目标不可用")
+        
+        manager.register_callback(
+            self.task.task_id, CallbackType.SUCCESS, CallbackTrigger.ASYNC, failing_callback
+        )
+        callback = manager.callbacks[self.task.task_id][0]
+        
+        await manager._run_callback(callback, self.task)
+        
+        # 失败后不会立即入队，而是等待退避
+        assert manager._callback_queue.empty()
+        assert callback.callback_id in manager._retry_timers
+        
+        await asyncio.sleep(0.1)
+        
+        assert manager._callback_queue.qsize() == 1
+        assert not manager._retry_timers
+        assert manager.stats["retries_attempted"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_pending_retries(self):
+        """测试关闭时取消尚未到期的重试"""
+        manager = self.manager
+        manager._RETRY_BASE_DELAY = 0.05
+        
+        async def failing_callback(task):
+            raise RuntimeError("目标不可用")
+        
+        manager.register_callback(
+            self.task.task_id, CallbackType.SUCCESS, CallbackTrigger.ASYNC, failing_callback
+        )
+        await manager._run_callback(manager.callbacks[self.task.task_id][0], self.task)
+        
+        await manager.shutdown()
+        await asyncio.sleep(0.1)
+        
+        assert manager._callback_queue.empty()
+        assert not manager._retry_timers
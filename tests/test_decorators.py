@@ -1,22 +1,29 @@
 # tests/test_decorators.py
 import asyncio
+import json
+import orjson
 import pytest
 import time
 import sys
 import os
 from pathlib import Path
 
+from fastapi import HTTPException
+from fastapi.responses import Response
+
 # 确保可以导入app模块
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from app.infrastructure.decorators.rate_limit import (
-    rate_limit, api_rate_limit, RateLimitExceeded, global_rate_limiter
+from src.infrastructure.decorators.rate_limit import (
+    rate_limit, api_rate_limit, strict_rate_limit, RateLimitExceeded, global_rate_limiter
 )
-from app.infrastructure.decorators.retry import (
-    retry, simple_retry, network_retry, RetryExhausted
+from src.infrastructure.decorators.retry import (
+    retry, simple_retry, network_retry, RetryExhausted, NON_RETRYABLE_EXCEPTIONS
 )
-from app.infrastructure.decorators.cache import cache, short_cache
+from src.infrastructure.cache.cache_interface import InMemoryCache
+from src.infrastructure.decorators.cache import cache, short_cache, response_cache
+from src.infrastructure.tasks.task_decorator import sync_task
 
 
 class TestRateLimiter:
@@ -88,6 +95,76 @@ class TestRateLimiter:
         assert result3 == "success for user2"
         
         print("✅ 用户级限流测试通过")
+    
+    @pytest.mark.asyncio
+    async def test_token_bucket_burst_size(self):
+        """测试令牌桶容量由burst_size决定"""
+        
+        @rate_limit(max_requests=60, window_seconds=60, algorithm="token_bucket", burst_size=3)
+        async def test_function():
+            return "success"
+        
+        for _ in range(3):
+            assert await test_function() == "success"
+        
+        with pytest.raises(RateLimitExceeded):
+            await test_function()
+    
+    @pytest.mark.asyncio
+    async def test_token_bucket_refill(self):
+        """测试令牌按平均速率补充"""
+        
+        @rate_limit(max_requests=10, window_seconds=1, algorithm="token_bucket", burst_size=1)
+        async def test_function():
+            return "success"
+        
+        assert await test_function() == "success"
+        with pytest.raises(RateLimitExceeded):
+            await test_function()
+        
+        # 每秒补充10个令牌，等待0.15秒后至少恢复1个
+        await asyncio.sleep(0.15)
+        assert await test_function() == "success"
+    
+    @pytest.mark.asyncio
+    async def test_api_rate_limit_burst_capped(self):
+        """测试api_rate_limit的突发容量不超过每分钟请求数"""
+        
+        @api_rate_limit(requests_per_minute=2)
+        async def test_function():
+            return "success"
+        
+        assert await test_function() == "success"
+        assert await test_function() == "success"
+        with pytest.raises(RateLimitExceeded):
+            await test_function()
+    
+    @pytest.mark.asyncio
+    async def test_strict_rate_limit_sliding_window(self):
+        """测试strict_rate_limit使用滑动窗口且返回retry_after"""
+        
+        @strict_rate_limit(requests_per_minute=3)
+        async def test_function():
+            return "success"
+        
+        for _ in range(3):
+            assert await test_function() == "success"
+        
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            await test_function()
+        assert exc_info.value.retry_after > 0
+    
+    def test_sync_function_rate_limit(self):
+        """测试同步函数限流"""
+        
+        @rate_limit(max_requests=2, window_seconds=60)
+        def test_function():
+            return "success"
+        
+        assert test_function() == "success"
+        assert test_function() == "success"
+        with pytest.raises(RateLimitExceeded):
+            test_function()
 
 
 class TestRetryDecorator:
@@ -172,6 +249,68 @@ class TestRetryDecorator:
         # 检查退避时间：0.1 + 0.2 = 0.3秒（大致）
         assert end_time - start_time >= 0.25  # 允许一些误差
         print("✅ 重试退避机制测试通过")
+    
+    @pytest.mark.asyncio
+    async def test_give_up_on_non_retryable(self):
+        """测试give_up_on中的异常不重试"""
+        call_count = 0
+        
+        @simple_retry(attempts=3, delay=0.01, give_up_on=NON_RETRYABLE_EXCEPTIONS)
+        async def invalid_input():
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("参数错误")
+        
+        with pytest.raises(ValueError):
+            await invalid_input()
+        assert call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_http_client_error_not_retried(self):
+        """测试4xx的HTTPException不重试，5xx仍然重试"""
+        calls = {"client": 0, "server": 0}
+        
+        @simple_retry(attempts=3, delay=0.01)
+        async def client_error():
+            calls["client"] += 1
+            raise HTTPException(status_code=404, detail="not found")
+        
+        @simple_retry(attempts=3, delay=0.01)
+        async def server_error():
+            calls["server"] += 1
+            raise HTTPException(status_code=500, detail="boom")
+        
+        with pytest.raises(HTTPException):
+            await client_error()
+        assert calls["client"] == 1
+        
+        with pytest.raises(RetryExhausted):
+            await server_error()
+        assert calls["server"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_task_wrapper_keeps_client_errors(self):
+        """测试sync_task保留客户端类错误的类型，其他异常转为500"""
+        call_count = 0
+        
+        @simple_retry(attempts=3, delay=0.01, give_up_on=NON_RETRYABLE_EXCEPTIONS)
+        @sync_task(timeout=5)
+        async def invalid_input():
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("参数错误")
+        
+        @sync_task(timeout=5)
+        async def server_failure():
+            raise RuntimeError("内部错误")
+        
+        with pytest.raises(ValueError):
+            await invalid_input()
+        assert call_count == 1
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await server_failure()
+        assert exc_info.value.status_code == 500
 
 
 class TestCacheDecorator:
@@ -205,6 +344,73 @@ class TestCacheDecorator:
         assert call_count == 2
         
         print("✅ 缓存命中和未命中测试通过")
+    
+    @pytest.mark.asyncio
+    async def test_response_cache_returns_cached_bytes(self):
+        """测试路由层响应缓存命中时直接返回缓存的JSON字节"""
+        call_count = 0
+        
+        @response_cache(ttl=60, key_prefix="test:response:", key_func=lambda key, **_: key)
+        async def get_item(key: str, verbose: bool = False):
+            nonlocal call_count
+            call_count += 1
+            return {"success": True, "data": {"key": key}}
+        
+        response1 = await get_item(key="a", verbose=False)
+        response2 = await get_item(key="a", verbose=True)  # key_func只使用key
+        assert isinstance(response1, Response)
+        assert response1.body == response2.body
+        assert orjson.loads(response2.body) == {"success": True, "data": {"key": "a"}}
+        assert call_count == 1
+        
+        await get_item(key="b")
+        assert call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_response_cache_skips_failures(self):
+        """测试失败的响应不会被缓存"""
+        call_count = 0
+        
+        @response_cache(ttl=60, key_prefix="test:response:")
+        async def get_item(key: str):
+            nonlocal call_count
+            call_count += 1
+            return {"success": False, "error": "not found"}
+        
+        result1 = await get_item(key="missing")
+        result2 = await get_item(key="missing")
+        assert result1 == {"success": False, "error": "not found"}
+        assert result2 == result1
+        assert call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_response_cache_with_serializing_backend(self):
+        """测试会做JSON序列化的缓存后端（如RedisCache）命中时返回原始响应"""
+        
+        class SerializingCache(InMemoryCache):
+            """与RedisCache一致：写入时json.dumps，读取时json.loads"""
+            
+            async def set(self, key, value, ttl=None):
+                return await super().set(key, json.dumps(value, default=str), ttl)
+            
+            async def get(self, key):
+                value = await super().get(key)
+                return None if value is None else json.loads(value)
+        
+        call_count = 0
+        
+        @response_cache(ttl=60, key_prefix="test:response:", cache_instance=SerializingCache())
+        async def get_item(key: str):
+            nonlocal call_count
+            call_count += 1
+            return {"success": True, "data": {"key": key, "name": "缓存"}}
+        
+        response1 = await get_item(key="a")
+        response2 = await get_item(key="a")
+        
+        assert call_count == 1
+        assert response2.body == response1.body
+        assert orjson.loads(response2.body) == {"success": True, "data": {"key": "a", "name": "缓存"}}
 
 
 class TestStressTest:
@@ -233,6 +233,25 @@ class TestFooHandler:
         
         print("✅ Handler批量处理测试通过")
     
+    async def test_handler_batch_processing_sharded(self):
+        """测试Handler按分片批量处理，结果保持原有顺序"""
+        test_items = [{"id": i, "data": f"test{i}"} for i in range(5)]
+        
+        result = await self.foo_handler.handle_batch_processing(
+            items=test_items,
+            processing_time=0.1,
+            shard_size=2
+        )
+        
+        assert result["total_items"] == 5
+        assert [r["id"] for r in result["results"]] == [0, 1, 2, 3, 4]
+        # item_index为项目在整批请求中的位置，而非分片内位置
+        assert [r["item_index"] for r in result["results"]] == [0, 1, 2, 3, 4]
+        # 每个分片是一次独立的服务层批量调用
+        assert len({r["batch_id"] for r in result["results"]}) == 3
+        
+        print("✅ Handler分片批量处理测试通过")
+    
     async def test_handler_validation(self):
         """测试Handler参数验证"""
         # 测试空数据验证
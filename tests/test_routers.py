@@ -0,0 +1,64 @@
+# tests/test_routers.py
+import pytest
+import sys
+import uuid
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+# 确保可以导入app模块
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.api.routers.v1.system.task_router import get_task_handler
+from src.infrastructure.tasks.task_manager import get_task_manager
+from src.main import create_app
+from src.schemas.dtos.response.base_response import BaseResponse
+
+
+class TestTaskResultResponse:
+    """测试任务结果接口的手工拼接响应"""
+    
+    def setup_method(self):
+        self.client = TestClient(create_app())
+    
+    @pytest.mark.asyncio
+    async def test_result_response_matches_base_response(self):
+        """测试拼接的响应与BaseResponse.success_response的结构一致"""
+        task_id = str(uuid.uuid4())
+        result = {"task_id": task_id, "status": "success", "result": {"value": [1, 2, 3]}}
+        await get_task_manager().storage.store_result(task_id, result)
+        
+        response = self.client.get(f"/api/v1/tasks/{task_id}/result")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == BaseResponse.success_response(result).dict()
+    
+    def test_missing_result_returns_404(self):
+        """测试结果不存在时返回404"""
+        response = self.client.get(f"/api/v1/tasks/{uuid.uuid4()}/result")
+        assert response.status_code == 404
+
+
+class TestHandlerDependencyOverride:
+    """测试路由的Handler依赖可通过dependency_overrides替换"""
+    
+    def test_override_task_handler(self):
+        """测试覆盖get_task_handler后路由使用替换的Handler"""
+        
+        class StubTaskService:
+            async def get_storage_statistics(self):
+                return {"stub": True}
+        
+        class StubTaskHandler:
+            task_service = StubTaskService()
+        
+        app = create_app()
+        app.dependency_overrides[get_task_handler] = StubTaskHandler
+        client = TestClient(app)
+        
+        response = client.get("/api/v1/tasks/storage/stats")
+        
+        assert response.status_code == 200
+        assert response.json()["data"] == {"stub": True}
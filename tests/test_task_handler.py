@@ -0,0 +1,81 @@
+# tests/test_task_handler.py
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+# 确保可以导入app模块
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.application.handlers.system.task_handler import TaskHandler
+from src.schemas.dtos.request.task_request import TaskBulkOperationRequest
+
+
+class TestBulkOperation:
+    """测试批量操作的并发控制"""
+    
+    def setup_method(self):
+        self.handler = TaskHandler()
+    
+    @pytest.mark.parametrize("value, expected", [
+        (None, TaskHandler._BULK_CONCURRENCY),
+        (0, 1),
+        (-5, 1),
+        (8, 8),
+        ("4", 4),
+        (1000, TaskHandler._BULK_CONCURRENCY_MAX),
+    ])
+    def test_resolve_concurrency(self, value, expected):
+        """测试并发数的默认值与范围截断"""
+        assert self.handler._resolve_bulk_concurrency(value) == expected
+    
+    @pytest.mark.parametrize("value", ["abc", [1, 2], True])
+    def test_resolve_concurrency_invalid_type(self, value):
+        """测试非整数并发数视为参数错误"""
+        with pytest.raises(ValueError):
+            self.handler._resolve_bulk_concurrency(value)
+    
+    @pytest.mark.asyncio
+    async def test_zero_concurrency_does_not_hang(self):
+        """测试concurrency为0时不会阻塞"""
+        request = TaskBulkOperationRequest(
+            task_ids=["missing-1", "missing-2"],
+            operation="cancel",
+            params={"concurrency": 0}
+        )
+        
+        response = await asyncio.wait_for(self.handler.bulk_operation(request), timeout=5)
+        
+        assert response.total_requested == 2
+        assert response.failed == 2
+    
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency_rejected(self):
+        """测试非法并发数返回参数错误而不是TypeError"""
+        request = TaskBulkOperationRequest(
+            task_ids=["missing-1"],
+            operation="cancel",
+            params={"concurrency": "abc"}
+        )
+        
+        with pytest.raises(ValueError):
+            await self.handler.bulk_operation(request)
+    
+    @pytest.mark.asyncio
+    async def test_bulk_delete(self):
+        """测试批量删除走存储层批量接口，逐项返回结果"""
+        task_id = "bulk-delete-stored"
+        await self.handler.task_manager.storage.store_result(task_id, {"task_id": task_id})
+        request = TaskBulkOperationRequest(
+            task_ids=[task_id, "bulk-delete-missing"],
+            operation="delete"
+        )
+        
+        response = await self.handler.bulk_operation(request)
+        
+        assert response.successful == 1
+        assert response.failed == 1
+        results = {result["task_id"]: result for result in response.results}
+        assert results[task_id]["deleted_from"] == ["memory"]
+        assert results["bulk-delete-missing"]["error"] == "任务结果不存在"
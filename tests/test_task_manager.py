@@ -0,0 +1,156 @@
+# tests/test_task_manager.py
+import asyncio
+import pytest
+import sys
+import uuid
+from pathlib import Path
+
+# 确保可以导入app模块
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.infrastructure.tasks.base_task import TaskStatus, create_simple_task
+from src.infrastructure.tasks.task_manager import TaskManager
+
+
+async def _noop():
+    return "ok"
+
+
+def _make_task(name: str = "writer_test"):
+    task = create_simple_task(task_name=name, task_func=_noop)
+    task.task_id = str(uuid.uuid4())  # 正常由TaskManager.submit_task分配
+    return task
+
+
+async def _wait_until(condition, timeout: float = 2.0):
+    """轮询等待条件成立"""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("等待条件超时")
+        await asyncio.sleep(0.01)
+
+
+class TestResultWriter:
+    """测试批量结果写入"""
+    
+    @pytest.mark.asyncio
+    async def test_results_written_in_batches(self):
+        """测试结果经写入协程批量落盘，写入前可从内存查询"""
+        manager = TaskManager()
+        batch_sizes = []
+        store_results = manager.storage.store_results
+        
+        async def recording_store_results(items):
+            batch_sizes.append(len(items))
+            return await store_results(items)
+        
+        manager.storage.store_results = recording_store_results
+        
+        tasks = [_make_task(f"writer_{i}") for i in range(5)]
+        for task in tasks:
+            manager._enqueue_result(task.task_id, task)
+        
+        # 写入前结果可直接从待写入缓存读取
+        assert (await manager.get_task_result(tasks[0].task_id))["task_id"] == tasks[0].task_id
+        
+        writer = asyncio.create_task(manager._result_writer_loop())
+        try:
+            await _wait_until(lambda: not manager._pending_results)
+        finally:
+            writer.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await writer
+        
+        assert batch_sizes == [5]
+        for task in tasks:
+            stored = await manager.storage.get_task_result(task.task_id)
+            assert stored["task_id"] == task.task_id
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_write_is_flushed_on_shutdown(self):
+        """测试关闭时正在写入的批次不会丢失"""
+        manager = TaskManager()
+        store_results = manager.storage.store_results
+        write_started = asyncio.Event()
+        
+        async def blocking_store_results(items):
+            write_started.set()
+            await asyncio.Event().wait()
+        
+        manager.storage.store_results = blocking_store_results
+        
+        task = _make_task()
+        manager._enqueue_result(task.task_id, task)
+        
+        writer = asyncio.create_task(manager._result_writer_loop())
+        await asyncio.wait_for(write_started.wait(), timeout=2)
+        writer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await writer
+        
+        # 被取消的批次仍可查询，并由关闭流程重新写入
+        assert task.task_id in manager._pending_results
+        manager.storage.store_results = store_results
+        await manager._flush_pending_results()
+        
+        assert not manager._pending_results
+        stored = await manager.storage.get_task_result(task.task_id)
+        assert stored["task_id"] == task.task_id
+
+
+class TestBulkDelete:
+    """测试批量删除任务结果"""
+    
+    @pytest.mark.asyncio
+    async def test_bulk_delete_keeps_order_and_drops_pending(self):
+        """测试批量删除结果与输入顺序一致，并丢弃尚未写入的结果"""
+        manager = TaskManager()
+        stored_task = _make_task("stored")
+        pending_task = _make_task("pending")
+        
+        await manager.storage.store_result(stored_task.task_id, stored_task.to_dict())
+        manager._enqueue_result(pending_task.task_id, pending_task)
+        
+        results = await manager.delete_task_results_bulk(
+            [stored_task.task_id, "missing", pending_task.task_id]
+        )
+        
+        assert [r["task_id"] for r in results] == [stored_task.task_id, "missing", pending_task.task_id]
+        assert results[0]["deleted_from"] == ["memory"]
+        assert results[1]["deleted_from"] == []
+        assert pending_task.task_id not in manager._pending_results
+        assert await manager.get_task_result(stored_task.task_id) is None
+        assert await manager.get_task_result(pending_task.task_id) is None
+
+
+class TestRecentCompletions:
+    """测试近期完成统计的时间窗口"""
+    
+    @pytest.mark.asyncio
+    async def test_counts_expire_with_window(self):
+        """测试窗口外的完成记录不再计数"""
+        manager = TaskManager()
+        manager._RECENT_WINDOW_SECONDS = 0.05
+        
+        manager._record_recent_completion("completed")
+        manager._record_recent_completion("completed")
+        manager._record_recent_completion("failed")
+        assert manager.get_recent_completion_counts() == {"completed": 2, "failed": 1}
+        
+        await asyncio.sleep(0.1)
+        manager._record_recent_completion("completed")
+        
+        assert manager.get_recent_completion_counts() == {"completed": 1, "failed": 0}
+        # 记录时已裁掉窗口外的头部，内存不随历史增长
+        assert len(manager._recent_completions["completed"]) == 1
+    
+    def test_default_window_is_one_day(self):
+        """测试默认统计最近24小时，超时计入失败"""
+        assert TaskManager._RECENT_WINDOW_SECONDS == 86400
+        assert TaskManager._RECENT_COMPLETION_KEYS == {
+            TaskStatus.SUCCESS: "completed",
+            TaskStatus.FAILED: "failed",
+            TaskStatus.TIMEOUT: "failed"
+        }
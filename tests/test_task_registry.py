@@ -0,0 +1,110 @@
+# tests/test_task_registry.py
+import pytest
+import sys
+from collections import Counter
+from pathlib import Path
+
+# 确保可以导入app模块
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.infrastructure.tasks.task_registry import TaskRegistry
+
+
+class TestTaskRegistration:
+    """测试任务类型注册与注销"""
+    
+    def setup_method(self):
+        self.registry = TaskRegistry()
+        self.registry.register_api_task_type("foo_sync", "/foo/sync", "POST", "FooHandler")
+    
+    def test_duplicate_registration_rejected(self):
+        """测试重复注册抛出ValueError并提示先注销"""
+        with pytest.raises(ValueError, match="unregister_task_type"):
+            self.registry.register_api_task_type("foo_sync", "/foo/sync/v2", "POST", "FooHandler")
+        
+        # 原注册信息保持不变
+        assert self.registry.get_task_info("foo_sync")["route_path"] == "/foo/sync"
+    
+    def test_register_again_after_unregister(self):
+        """测试注销后可以重新注册"""
+        assert self.registry.unregister_task_type("foo_sync") is True
+        assert self.registry.unregister_task_type("foo_sync") is False
+        
+        self.registry.register_api_task_type("foo_sync", "/foo/sync/v2", "POST", "FooHandler")
+        assert self.registry.get_task_info("foo_sync")["route_path"] == "/foo/sync/v2"
+
+
+class TestTaskIndexes:
+    """测试标签与分类倒排索引"""
+    
+    def setup_method(self):
+        self.registry = TaskRegistry()
+        self.registry.register_api_task_type(
+            "foo_sync", "/foo/sync", "POST", "FooHandler", category="foo", tags=["fast", "sync"]
+        )
+        self.registry.register_api_task_type(
+            "foo_batch", "/foo/batch", "POST", "FooHandler", category="foo", tags=["batch"]
+        )
+        self.registry.register_api_task_type(
+            "report", "/reports", "GET", "ReportHandler", category="reporting", tags=["batch", "slow"]
+        )
+    
+    def _names(self, results):
+        return sorted(result["task_name"] for result in results)
+    
+    def test_search_by_tags_and_category(self):
+        """测试标签匹配任一即可，与分类取交集"""
+        assert self._names(self.registry.search_tasks(tags=["batch"])) == ["foo_batch", "report"]
+        assert self._names(self.registry.search_tasks(tags=["fast", "slow"])) == ["foo_sync", "report"]
+        assert self._names(self.registry.search_tasks(category="foo")) == ["foo_batch", "foo_sync"]
+        assert self._names(self.registry.search_tasks(tags=["batch"], category="foo")) == ["foo_batch"]
+        assert self._names(self.registry.search_tasks("report", tags=["batch"])) == ["report"]
+        assert self.registry.search_tasks(tags=["missing"]) == []
+    
+    def test_categories_follow_registration(self):
+        """测试分类索引随注册与注销更新"""
+        assert self.registry.get_all_categories() == {
+            "foo": ["foo_batch", "foo_sync"],
+            "reporting": ["report"]
+        }
+        
+        self.registry.unregister_task_type("report")
+        
+        assert self.registry.get_tasks_by_category("reporting") == []
+        assert "reporting" not in self.registry.get_all_categories()
+        assert self._names(self.registry.search_tasks(tags=["batch"])) == ["foo_batch"]
+        assert "slow" not in self.registry._tasks_by_tag
+
+
+class TestExecutionStats:
+    """测试任务执行统计"""
+    
+    def setup_method(self):
+        self.registry = TaskRegistry()
+    
+    def test_update_and_format_stats(self):
+        """测试计数、成功平均耗时与最后执行时间"""
+        self.registry.update_execution_stats("foo_sync", 1.0, "success")
+        self.registry.update_execution_stats("foo_sync", 3.0, "success")
+        self.registry.update_execution_stats("foo_sync", 10.0, "failed")
+        
+        stats = self.registry.get_task_stats("foo_sync")
+        assert stats["total_executed"] == 3
+        assert stats["total_success"] == 2
+        assert stats["total_failed"] == 1
+        assert stats["total_timeout"] == 0
+        assert stats["avg_duration"] == 2.0
+        assert stats["last_executed"] is not None
+        assert self.registry.get_task_stats("missing") == {}
+    
+    def test_counter_holds_only_counts(self):
+        """测试计数器中只有整数计数，Counter的聚合操作可正常使用"""
+        self.registry.update_execution_stats("foo_sync", 1.0, "success")
+        self.registry.update_execution_stats("foo_batch", 2.0, "timeout")
+        
+        counts = [stats.counts for stats in self.registry._execution_stats.values()]
+        merged = sum(counts, Counter())
+        assert merged == Counter(total_executed=2, total_success=1, total_timeout=1)
+        assert merged.total() == 4
+        assert self.registry.get_registry_summary()["total_executed"] == 2
@@ -0,0 +1,48 @@
+# tests/test_worker_pool.py
+import pytest
+import sys
+from pathlib import Path
+
+# 确保可以导入app模块
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.infrastructure.tasks.worker_pool import WorkerPool
+
+
+class TestScaleWorkers:
+    """测试工作者数量动态调整"""
+    
+    @pytest.mark.asyncio
+    async def test_scale_up_and_down(self):
+        """测试扩容后缩容只移除空闲队列头部的工作者"""
+        pool = WorkerPool(max_workers=2)
+        await pool.start()
+        
+        result = await pool.scale_workers(5)
+        assert result == {"action": "scale_up", "added": 3, "total": 5}
+        
+        expected_remaining = list(pool.available_workers)[3:]
+        result = await pool.scale_workers(2)
+        
+        assert result == {"action": "scale_down", "removed": 3, "total": 2}
+        assert list(pool.available_workers) == expected_remaining
+        assert set(pool.workers) == set(expected_remaining)
+        
+        await pool.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_scale_down_keeps_busy_workers(self):
+        """测试缩容不会移除忙碌的工作者"""
+        pool = WorkerPool(max_workers=3)
+        await pool.start()
+        busy_worker = await pool.get_worker()
+        
+        result = await pool.scale_workers(0)
+        
+        assert result["removed"] == 2
+        assert list(pool.workers) == [busy_worker.worker_id]
+        assert not pool.available_workers
+        
+        await pool.release_worker(busy_worker)
+        await pool.shutdown()